@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Benchmark suite for elzzur.
+
+It measures:
+
+a. ``solve/<lang>``: solving ``res/<lang>.board`` with ``res/<lang>.marisa``;
+b. ``solve/random-<N>x<N>``: solving seeded random boards,
+   generated with ``Board.generate_random_board()``, from 4x4 up to 12x12;
+c. ``top/random-<N>x<N>``: finding only the best ``TOP_K`` words of the same boards,
+   which must be as fast as the full solve;
+d. ``load/<lang>``: loading ``res/<lang>.marisa``;
+e. ``compile/<lang>``: compiling the plain text version of ``res/<lang>.marisa``; and
+f. ``startup/<command>``: running a short ``python -m elzzur`` command
+   in a new interpreter, that is, mostly the import time.
+
+For each case, it records the wall time (best of ``--repeat`` runs),
+the peak memory allocated by Python
+(``memory``, measured with ``tracemalloc`` in a separate run),
+and, for the solve cases, the number of nodes expanded.
+For the load and compile cases, which allocate most of their memory
+in the C++ code of the MARISA trie, invisible to ``tracemalloc``,
+it records instead the growth of the peak resident set size (``rss``)
+of a new interpreter running the case once.
+For the startup cases, it records the number of modules imported
+(measured in a separate run with ``-X importtime``) instead of the memory.
+
+The results of the solve cases are checked against ``reference.json``
+(and the English board against ``OUTPUT.md``),
+so that optimizations cannot silently change words, scores or snakes.
+
+Each run is appended to a JSON history file,
+and compared with the previous run:
+the suite fails (exit code 1) if a result changed,
+if a top case is slower than its full solve by more than ``--threshold``,
+or if the time, the memory, the RSS or the imported modules of a case grew by more than ``--threshold``.
+
+Usage::
+
+    $ python benchmarks/bench.py [--quick] [--repeat N] [--threshold T] [--history FILE] [--no-history]
+    $ python benchmarks/bench.py --update-reference
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import argparse
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from elzzur.board import Board
+from elzzur.languages import LANGUAGES
+from elzzur.mtdictionary import MTDictionary, bundled_dictionary_path
+from elzzur.solver import Solver
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+""" Directory of the benchmark suite """
+
+REFERENCE_FILE = os.path.join(BENCHMARKS_DIR, "reference.json")
+""" Expected results of the solve cases """
+
+HISTORY_FILE = os.path.join(BENCHMARKS_DIR, "history.json")
+""" Default history file """
+
+OUTPUT_FILE = os.path.join(ROOT, "OUTPUT.md")
+""" Reference output of the English demo """
+
+RANDOM_SIZES = [4, 6, 8, 10, 12]
+""" Sizes of the seeded random boards """
+
+RANDOM_LANGUAGE = "en"
+""" Language of the seeded random boards """
+
+TOP_K = 1
+""" Number of words of the top cases """
+
+STARTUP_CASES = [
+    ("startup/import", ["-c", "import elzzur"]),
+    ("startup/languages", ["-m", "elzzur", "languages"]),
+    ("startup/generate", ["-m", "elzzur", "generate", "-l", RANDOM_LANGUAGE, "--seed", "1"]),
+]
+""" The startup cases, as ``(name, interpreter arguments)`` tuples """
+
+MIN_TIME_DELTA = 0.002
+""" Time differences below this value (in seconds) are never regressions """
+
+MIN_MEMORY_DELTA = 256
+""" Memory differences below this value (in KB) are never regressions """
+
+RSS_SCRIPT = u"""
+import os, resource, sys
+sys.path.insert(0, %r)
+from elzzur.mtdictionary import MTDictionary
+# import marisa_trie, which is not part of the case
+MTDictionary.from_keys([u"A"])
+# the peak RSS of this process starts from the RSS of the benchmark process,
+# while the one of a forked process starts from the RSS of this one
+pid = os.fork()
+if pid == 0:
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    value = %s
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print((after - before) // (1024 if sys.platform == "darwin" else 1))
+    sys.stdout.flush()
+    os._exit(0)
+os.waitpid(pid, 0)
+"""
+""" Script measuring the growth of the peak RSS (in KB) caused by an expression, see ``measure_rss()`` """
+
+def format_words(words):
+    """
+    Format the given solve result as the lines printed by ``elzzur solve``.
+
+    :param list words: list of (word, score, snake) tuples
+    :rtype: list of str
+    """
+    length_longest_word = max([0] + [len(w[0]) for w in words])
+    length_max_score = max([0] + [len(str(w[1])) for w in words])
+    acc = []
+    for (word, snake_score, snake) in words:
+        word_padding = " " * (length_longest_word - len(word))
+        score_padding = " " * (length_max_score - len(str(snake_score)))
+        acc.append(u"%s%s    %d%s    %s" % (word, word_padding, snake_score, score_padding, snake))
+    return acc
+
+def digest_words(words):
+    """
+    Return the SHA-1 of the given solve result.
+
+    :param list words: list of (word, score, snake) tuples
+    :rtype: str
+    """
+    return hashlib.sha1(u"\n".join(format_words(words)).encode("utf-8")).hexdigest()
+
+def output_md_lines():
+    """
+    Return the word lines of the English demo in ``OUTPUT.md``.
+
+    :rtype: list of str
+    """
+    with io.open(OUTPUT_FILE, "r", encoding="utf-8") as f:
+        lines = [line.rstrip(u"\n") for line in f]
+    # the word lines are between the board and the statistics, both separated by empty lines
+    start = lines.index(u"$ python -m elzzur demo -l en")
+    blocks = []
+    current = []
+    for line in lines[start + 1:]:
+        if line.startswith(u"```"):
+            break
+        if len(line.strip()) == 0:
+            if len(current) > 0:
+                blocks.append(current)
+            current = []
+        else:
+            current.append(line)
+    return blocks[1]
+
+def solve_cases():
+    """
+    Return the solve cases, as ``(name, language, board_factory)`` tuples.
+
+    :rtype: list
+    """
+    def bundled(language):
+        path = os.path.join(ROOT, "elzzur", "res", language + ".board")
+        return lambda: Board(language).read_board_file(path)
+
+    def seeded(size):
+        def factory():
+            random.seed(size)
+            return Board(RANDOM_LANGUAGE).generate_random_board(rows=size, cols=size)
+        return factory
+
+    acc = [("solve/%s" % language, language, bundled(language)) for language in LANGUAGES]
+    acc.extend([("solve/random-%dx%d" % (size, size), RANDOM_LANGUAGE, seeded(size)) for size in RANDOM_SIZES])
+    return acc
+
+def measure(function, repeat, traced=True):
+    """
+    Run the given function ``repeat`` times, and once more under ``tracemalloc``.
+
+    :param function function: the function to measure, called with no arguments
+    :param int repeat: the number of timed runs
+    :param bool traced: if ``False``, do not run the function under ``tracemalloc``
+    :rtype: (float, int, object) tuple, i.e. ``(best time in seconds, peak memory in KB or None, last return value)``
+    """
+    best = None
+    value = None
+    for i in range(repeat):
+        start = time.time()
+        value = function()
+        elapsed = time.time() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    if not traced:
+        return (best, None, value)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return (best, peak // 1024, value)
+
+def measure_rss(expression):
+    """
+    Evaluate the given expression (which can use ``MTDictionary``) once in a new interpreter,
+    and return the growth of its peak resident set size, in KB,
+    or ``None`` if the ``resource`` module (or ``os.fork()``) is not available (e.g., on Windows).
+
+    :param str expression: the Python expression
+    :rtype: int
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    if not hasattr(os, "fork"):
+        return None
+    output = subprocess.run([sys.executable, "-c", RSS_SCRIPT % (ROOT, expression)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True).stdout
+    return int(output.decode("utf-8").strip())
+
+def measure_startup(arguments, repeat):
+    """
+    Run the Python interpreter with the given arguments ``repeat`` times,
+    and once more with ``-X importtime``.
+
+    :param list arguments: the interpreter arguments
+    :param int repeat: the number of timed runs
+    :rtype: (float, int) tuple, i.e. ``(best time in seconds, number of imported modules)``
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT] + ([env["PYTHONPATH"]] if "PYTHONPATH" in env else []))
+    command = [sys.executable] + arguments
+    best = None
+    for i in range(repeat):
+        start = time.time()
+        subprocess.check_call(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.time() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    # one line per imported module, plus the header
+    log = subprocess.run([sys.executable, "-X", "importtime"] + arguments, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True).stderr
+    modules = len([line for line in log.decode("utf-8").splitlines() if line.startswith("import time:")]) - 1
+    return (best, modules)
+
+def run(repeat=3, quick=False):
+    """
+    Run the benchmark suite.
+
+    :param int repeat: the number of timed runs per case
+    :param bool quick: if ``True``, skip the compile cases
+    :rtype: dict
+    """
+    results = {}
+    for (name, arguments) in STARTUP_CASES:
+        best, modules = measure_startup(arguments, repeat)
+        results[name] = {"time": round(best, 6), "modules": modules}
+    dictionaries = {}
+    for language in LANGUAGES:
+        path = bundled_dictionary_path(language)
+        best, peak, dictionary = measure(lambda: MTDictionary(path), repeat, traced=False)
+        dictionaries[language] = dictionary
+        results["load/%s" % language] = {"time": round(best, 6), "rss": measure_rss("MTDictionary(%r)" % path)}
+    if not quick:
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            for language in LANGUAGES:
+                plain = os.path.join(tmp_dir, language + ".txt")
+                dictionaries[language].save_plain_text(plain)
+                best, peak, dictionary = measure(lambda: MTDictionary(plain, normalize=True, ignore_case=True), 1, traced=False)
+                results["compile/%s" % language] = {"time": round(best, 6), "rss": measure_rss("MTDictionary(%r, normalize=True, ignore_case=True)" % plain), "words": len(dictionary)}
+        finally:
+            shutil.rmtree(tmp_dir)
+    for (name, language, factory) in solve_cases():
+        board = factory()
+        dictionary = dictionaries[language]
+        # warm the memoized dictionary nodes, as in a long-running process
+        Solver(board, dictionary).solve()
+        solvers = []
+
+        def solve():
+            solver = Solver(board, dictionary)
+            solvers.append(solver)
+            return solver.solve()
+
+        best, peak, words = measure(solve, repeat)
+        results[name] = {
+            "time": round(best, 6),
+            "memory": peak,
+            "nodes": solvers[-1].nodes_expanded,
+            "words": len(words),
+            "total": sum([w[1] for w in words]),
+            "digest": digest_words(words),
+        }
+        if name == "solve/en":
+            results[name]["output_md"] = (format_words(words) == output_md_lines())
+        if name.startswith("solve/random-"):
+            best, peak, top = measure(lambda: Solver(board, dictionary).solve(top_k=TOP_K), repeat)
+            results[name.replace("solve/", "top/", 1)] = {
+                "time": round(best, 6),
+                "memory": peak,
+                "words": len(top),
+                "full_time": results[name]["time"],
+                "matches_full": (format_words(top) == format_words(words[0:TOP_K])),
+            }
+    return results
+
+def check_reference(results, reference):
+    """
+    Return the list of the solve cases whose result differs from the reference.
+
+    :param dict results: the results of the current run
+    :param dict reference: the expected results
+    :rtype: list of str
+    """
+    acc = []
+    for (name, result) in sorted(results.items()):
+        if "digest" not in result:
+            continue
+        expected = reference.get(name)
+        if (expected is None) or (expected["digest"] != result["digest"]):
+            acc.append("%s: result differs from %s" % (name, os.path.basename(REFERENCE_FILE)))
+        if result.get("output_md") is False:
+            acc.append("%s: result differs from %s" % (name, os.path.basename(OUTPUT_FILE)))
+    return acc
+
+def check_top(results, threshold):
+    """
+    Return the list of the top cases which differ from the best words of the full solve,
+    or which are slower than the full solve by more than ``threshold``.
+
+    :param dict results: the results of the current run
+    :param float threshold: the maximum relative slowdown
+    :rtype: list of str
+    """
+    acc = []
+    for (name, result) in sorted(results.items()):
+        if "full_time" not in result:
+            continue
+        if not result["matches_full"]:
+            acc.append("%s: result differs from the full solve" % name)
+        if (result["time"] > result["full_time"] * (1 + threshold)) and (result["time"] - result["full_time"] > MIN_TIME_DELTA):
+            acc.append("%s: slower than the full solve (%ss vs %ss)" % (name, result["time"], result["full_time"]))
+    return acc
+
+def check_regressions(results, previous, threshold):
+    """
+    Return the list of the cases whose time, memory, RSS or imported modules grew
+    by more than ``threshold`` with respect to the previous run.
+
+    :param dict results: the results of the current run
+    :param dict previous: the results of the previous run
+    :param float threshold: the maximum relative growth
+    :rtype: list of str
+    """
+    acc = []
+    for (name, result) in sorted(results.items()):
+        old = previous.get(name)
+        if old is None:
+            continue
+        for (metric, unit, min_delta) in [("time", "s", MIN_TIME_DELTA), ("memory", "KB", MIN_MEMORY_DELTA), ("rss", "KB", MIN_MEMORY_DELTA), ("modules", "", 0)]:
+            if (result.get(metric) is None) or (old.get(metric) is None):
+                continue
+            if (result[metric] > old[metric] * (1 + threshold)) and (result[metric] - old[metric] > min_delta):
+                acc.append("%s: %s grew from %s%s to %s%s" % (name, metric, old[metric], unit, result[metric], unit))
+    return acc
+
+def main():
+    """
+    Entry point.
+    """
+    parser = argparse.ArgumentParser(description="elzzur benchmark suite")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per case")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Maximum relative growth of time, memory and RSS")
+    parser.add_argument("--history", type=str, default=HISTORY_FILE, help="Path to the JSON history file")
+    parser.add_argument("--no-history", action="store_true", help="Do not read or update the history file")
+    parser.add_argument("--quick", action="store_true", help="Skip the compile cases")
+    parser.add_argument("--update-reference", action="store_true", help="Store the results of the solve cases as the new reference")
+    vargs = vars(parser.parse_args())
+
+    results = run(repeat=vargs["repeat"], quick=vargs["quick"])
+    print("%-24s %12s %16s %12s %8s" % ("case", "time (ms)", "memory", "nodes", "words"))
+    for (name, result) in sorted(results.items()):
+        if "memory" in result:
+            memory = "%d KB" % result["memory"]
+        elif "rss" in result:
+            memory = "%s KB rss" % result["rss"]
+        else:
+            memory = "%d modules" % result["modules"]
+        print("%-24s %12.3f %16s %12s %8s" % (name, result["time"] * 1000, memory, result.get("nodes", ""), result.get("words", "")))
+
+    if vargs["update_reference"]:
+        reference = dict([(name, {"digest": r["digest"], "words": r["words"], "total": r["total"]}) for (name, r) in results.items() if "digest" in r])
+        with io.open(REFERENCE_FILE, "w", encoding="utf-8") as f:
+            f.write(u"%s\n" % json.dumps(reference, indent=4, sort_keys=True))
+        print("File '%s' saved" % REFERENCE_FILE)
+        sys.exit(0)
+
+    with io.open(REFERENCE_FILE, "r", encoding="utf-8") as f:
+        reference = json.load(f)
+    failures = check_reference(results, reference)
+    failures.extend(check_top(results, vargs["threshold"]))
+
+    if not vargs["no_history"]:
+        history = []
+        if os.path.isfile(vargs["history"]):
+            with io.open(vargs["history"], "r", encoding="utf-8") as f:
+                history = json.load(f)
+        if len(history) > 0:
+            failures.extend(check_regressions(results, history[-1]["results"], vargs["threshold"]))
+        history.append({
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "results": results,
+        })
+        with io.open(vargs["history"], "w", encoding="utf-8") as f:
+            f.write(u"%s\n" % json.dumps(history, indent=1, sort_keys=True))
+
+    if len(failures) > 0:
+        print("")
+        for failure in failures:
+            print("FAIL %s" % failure)
+        sys.exit(1)
+    sys.exit(0)
+
+
+
+if __name__ == "__main__":
+    main()
+
+
+
@@ -15,7 +15,16 @@ __version__ = "0.0.1"
 __email__ = "alberto@albertopettarin.it"
 __status__ = "Production"
 
-from elzzur.__main__ import main
+def main():
+    """
+    Entry point, see ``elzzur.__main__.main()``.
+
+    The command line module is imported only when called,
+    so that importing ``elzzur`` (or running ``python -m elzzur``,
+    which imports this package first) does not load it twice.
+    """
+    from elzzur.__main__ import main as cli_main
+    return cli_main()
 
 
 
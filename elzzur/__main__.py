@@ -10,13 +10,16 @@ This is the main elzzur script, intended to be run from command line.
 from __future__ import absolute_import
 from __future__ import print_function
 import argparse
+import io
+import json
 import os
 import sys
+import time
 
-from elzzur.board import Board 
+# the modules needed only by some commands (marisa_trie, multiprocessing, ...)
+# are imported by the functions running those commands, to keep the startup fast
 from elzzur.languages import LANGUAGES
-from elzzur.mtdictionary import MTDictionary
-from elzzur.solver import Solver
+from elzzur.topology import GRID, TOPOLOGIES
 
 __author__ = "Alberto Pettarin"
 __copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
@@ -27,6 +30,9 @@ __status__ = "Production"
 
 DESCRIPTION = "elzzur solves a Ruzzle board"
 
+STATS_FORMATS = ["json", "text"]
+""" Formats of the search counters printed by --stats """
+
 ARGUMENTS = [
     {
         "long": "command",
@@ -34,7 +40,7 @@ ARGUMENTS = [
         "nargs": None,
         "type": str,
         "default": None,
-        "help": "[cat|compile|demo|generate|languages|solve]"
+        "help": "[cat|compile|demo|generate|languages|serve|solve|solve-batch]"
     },
     {
         "long": "--language",
@@ -58,7 +64,7 @@ ARGUMENTS = [
         "nargs": "?",
         "type": str,
         "default": None,
-        "help": "Path to the board file"
+        "help": "Path to the board file (for solve-batch: a directory, a multi-board file, or '-' for stdin)"
     },
     {
         "long": "--output",
@@ -84,6 +90,126 @@ ARGUMENTS = [
         "default": 4,
         "help": "The number of columns of the board to generate"
     },
+    {
+        "long": "--count",
+        "short": "-n",
+        "nargs": "?",
+        "type": int,
+        "default": None,
+        "help": "The number of boards to generate, one per line in the compact format"
+    },
+    {
+        "long": "--seed",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": None,
+        "help": "The seed of the random boards to generate (default: random)"
+    },
+    {
+        "long": "--min-words",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 0,
+        "help": "Generate only boards with at least the given number of words"
+    },
+    {
+        "long": "--min-score",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 0,
+        "help": "Generate only boards with at least the given maximum total score"
+    },
+    {
+        "long": "--min-longest",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 0,
+        "help": "Generate only boards whose longest word has at least the given number of letters"
+    },
+    {
+        "long": "--max-restarts",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 20,
+        "help": "Give up generating a board meeting the targets after starting again from the given number of random boards (default: 20)"
+    },
+    {
+        "long": "--topology",
+        "short": "-t",
+        "nargs": "?",
+        "type": str,
+        "default": GRID,
+        "help": "Adjacency of the board cells [%s]" % "|".join(TOPOLOGIES)
+    },
+    {
+        "long": "--jobs",
+        "short": "-j",
+        "nargs": "?",
+        "type": int,
+        "default": 1,
+        "help": "The number of worker processes (serve: the number of boards solved concurrently, by threads sharing one core)"
+    },
+    {
+        "long": "--host",
+        "short": None,
+        "nargs": "?",
+        "type": str,
+        "default": "127.0.0.1",
+        "help": "The host the server listens on"
+    },
+    {
+        "long": "--port",
+        "short": "-p",
+        "nargs": "?",
+        "type": int,
+        "default": 8080,
+        "help": "The port the server listens on"
+    },
+    {
+        "long": "--socket",
+        "short": None,
+        "nargs": "?",
+        "type": str,
+        "default": None,
+        "help": "Path of the Unix socket the server listens on (instead of host and port)"
+    },
+    {
+        "long": "--queue",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 64,
+        "help": "The maximum number of pending requests of the server"
+    },
+    {
+        "long": "--timeout",
+        "short": None,
+        "nargs": "?",
+        "type": float,
+        "default": 10.0,
+        "help": "The maximum time, in seconds, to solve a board received by the server"
+    },
+    {
+        "long": "--cache",
+        "short": None,
+        "nargs": "?",
+        "type": str,
+        "default": None,
+        "help": "Path to the directory of the on-disk cache of the solve results"
+    },
+    {
+        "long": "--cache-size",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 256,
+        "help": "The maximum size, in MB, of the on-disk cache of the solve results"
+    },
     {
         "long": "--sort",
         "short": "-s",
@@ -92,12 +218,73 @@ ARGUMENTS = [
         "default": "score",
         "help": "Sort words by [score|length|start|end]"
     },
+    {
+        "long": "--top",
+        "short": "-k",
+        "nargs": "?",
+        "type": int,
+        "default": None,
+        "help": "Output only the given number of best (highest scoring) words"
+    },
+    {
+        "long": "--deadline",
+        "short": None,
+        "nargs": "?",
+        "type": float,
+        "default": None,
+        "help": "Stop the search after the given number of seconds, outputting the best words found so far"
+    },
+    {
+        "long": "--max-nodes",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": None,
+        "help": "Stop the search after expanding the given number of snakes, outputting the best words found so far"
+    },
+    {
+        "long": "--min-length",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": 2,
+        "help": "Output only the words with at least the given number of letters (default: 2)"
+    },
+    {
+        "long": "--max-length",
+        "short": None,
+        "nargs": "?",
+        "type": int,
+        "default": None,
+        "help": "Output only the words with at most the given number of letters, and do not explore longer snakes"
+    },
     {
         "long": "--reverse",
         "short": "-R",
         "action": "store_true",
         "help": "Reverse the list of words"
     },
+    {
+        "long": "--symmetry",
+        "short": None,
+        "action": "store_true",
+        "help": "Solve the canonical rotation/reflection of the board, sharing results among symmetric boards"
+    },
+    {
+        "long": "--stream",
+        "short": None,
+        "action": "store_true",
+        "help": "Output each word as soon as it is found, unsorted (again if a higher scoring snake is found)"
+    },
+    {
+        "long": "--stats",
+        "short": None,
+        "nargs": "?",
+        "type": str,
+        "const": "json",
+        "default": None,
+        "help": "Print the search counters to stderr, as %s (solve, default: json), or add them to each result (solve-batch)" % "|".join(STATS_FORMATS)
+    },
     {
         "long": "--quiet",
         "short": "-q",
@@ -128,6 +315,150 @@ def check_language(vargs):
     if vargs["language"] not in LANGUAGES:
         print_error("You must specify a supported language: %s" % ", ".join(LANGUAGES))
 
+def check_topology(vargs):
+    """
+    Check that the topology is among the supported ones.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if vargs["topology"] not in TOPOLOGIES:
+        print_error("You must specify a supported topology: %s" % ", ".join(TOPOLOGIES))
+
+def check_lengths(vargs):
+    """
+    Check that the word length limits are consistent.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if (vargs["max_length"] is not None) and (vargs["max_length"] < max(2, vargs["min_length"])):
+        print_error("The maximum word length must be at least the minimum word length (and at least 2).")
+
+def check_budget(vargs):
+    """
+    Check that the search budget is not negative.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if (vargs["deadline"] is not None) and (vargs["deadline"] < 0):
+        print_error("The deadline must be a non-negative number of seconds.")
+    if (vargs["max_nodes"] is not None) and (vargs["max_nodes"] < 0):
+        print_error("The maximum number of nodes must be a non-negative integer.")
+
+def check_top(vargs):
+    """
+    Check that the number of best words to output is positive.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if (vargs["top"] is not None) and (vargs["top"] < 1):
+        print_error("The number of best words to output must be at least 1.")
+
+def check_stream(vargs):
+    """
+    Check that the options ignored by --stream have not been specified.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if not vargs["stream"]:
+        return
+    ignored = [
+        ("--jobs", vargs["jobs"] != 1),
+        ("--top", vargs["top"] is not None),
+        ("--cache", vargs["cache"] is not None),
+        ("--symmetry", vargs["symmetry"]),
+        ("--deadline", vargs["deadline"] is not None),
+        ("--max-nodes", vargs["max_nodes"] is not None),
+        ("--sort", vargs["sort"] != "score"),
+        ("--reverse", vargs["reverse"]),
+    ]
+    options = [option for (option, given) in ignored if given]
+    if len(options) > 0:
+        print_error("The --stream option cannot be combined with: %s" % ", ".join(options))
+
+def check_generate(vargs):
+    """
+    Check that the size and the number of the boards to generate are valid.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if (vargs["rows"] < 1) or (vargs["cols"] < 1):
+        print_error("The number of rows and columns of the board must be at least 1.")
+    if (vargs["count"] is not None) and (vargs["count"] < 0):
+        print_error("The number of boards to generate must be non-negative.")
+    if min(vargs["min_words"], vargs["min_score"], vargs["min_longest"]) < 0:
+        print_error("The quality targets of the boards to generate must be non-negative.")
+    if vargs["min_longest"] > vargs["rows"] * vargs["cols"]:
+        print_error("The longest word cannot have more letters than the board has cells.")
+    if vargs["max_restarts"] < 0:
+        print_error("The maximum number of restarts must be non-negative.")
+
+def generation_targets(vargs):
+    """
+    Return the quality targets of the boards to generate,
+    as a ``(min_words, min_score, min_longest)`` tuple,
+    or ``None`` if no target was given.
+
+    :param dict vargs: the command line arguments
+    :rtype: tuple
+    """
+    targets = (vargs["min_words"], vargs["min_score"], vargs["min_longest"])
+    if max(targets) <= 0:
+        return None
+    return targets
+
+def generation_dictionary(vargs):
+    """
+    Return the dictionary used to check the quality targets of the boards to generate.
+
+    :param dict vargs: the command line arguments
+    :rtype: MTDictionary
+    """
+    from elzzur.mtdictionary import bundled_dictionary_path, get_dictionary
+    if vargs["dictionary"] is None:
+        vargs["dictionary"] = bundled_dictionary_path(vargs["language"])
+    return get_dictionary(vargs["dictionary"], language=vargs["language"], normalize=True, ignore_case=True)
+
+def check_stats(vargs):
+    """
+    Check that the format of the search counters is among the supported ones.
+    On error, print error message and exit.
+
+    :param dict vargs: the command line arguments
+    """
+    if (vargs["stats"] is not None) and (vargs["stats"] not in STATS_FORMATS):
+        print_error("You must specify a supported stats format: %s" % ", ".join(STATS_FORMATS))
+
+def print_stats(solver, stats_format):
+    """
+    Print the search counters of the given solver to stderr.
+
+    :param Solver solver: the solver
+    :param str stats_format: the format, either ``json`` or ``text``
+    """
+    if stats_format == "json":
+        sys.stderr.write("%s\n" % json.dumps(solver.stats.as_dict(), sort_keys=True))
+    else:
+        sys.stderr.write("%s\n" % solver.stats.pretty_print())
+
+def create_cache(vargs, memory=False):
+    """
+    Create the cache of the solve results requested on the command line.
+
+    :param dict vargs: the command line arguments
+    :param bool memory: if ``True``, create an in-memory cache even if no cache directory was given
+    :rtype: SolveCache
+    """
+    if vargs["cache"] is None and not memory:
+        return None
+    from elzzur.cache import SolveCache
+    return SolveCache(directory=vargs["cache"], disk_size=vargs["cache_size"] * 1024 * 1024)
+
 def list_languages():
     """
     List all the available languages
@@ -150,21 +481,44 @@ def solve_board(vargs):
     
     :param dict vargs: the command line arguments
     """
+    from elzzur.board import Board
+    from elzzur.mtdictionary import bundled_dictionary_path, get_dictionary
+    from elzzur.solver import Solver
     check_language(vargs)
+    check_topology(vargs)
+    check_stats(vargs)
+    check_lengths(vargs)
+    check_budget(vargs)
+    check_top(vargs)
+    check_stream(vargs)
     if vargs["board"] is None:
         print_error("You must specify the path of the board file to solve.")
     if vargs["dictionary"] is None:
-        vargs["dictionary"] = os.path.abspath(os.path.join(os.path.dirname(__file__), "res/" + vargs["language"] + ".marisa"))
-    dictionary = MTDictionary(vargs["dictionary"], normalize=True, ignore_case=True)
-    board = Board(vargs["language"]).read_board_file(vargs["board"])
+        vargs["dictionary"] = bundled_dictionary_path(vargs["language"])
+    dictionary = get_dictionary(vargs["dictionary"], language=vargs["language"], normalize=True, ignore_case=True)
+    board = Board(vargs["language"], topology=vargs["topology"]).read_board_file(vargs["board"])
     if not vargs["quiet"]:
         print("")
         print(board.pretty_print(multipliers=True))
         print("")
-    solver = Solver(board, dictionary)
-    words = solver.solve(sort=vargs["sort"], reverse=vargs["reverse"])
-    length_longest_word = max([len(w[0]) for w in words])
-    length_max_score = len(str(max([w[1] for w in words])))
+    solver = Solver(board, dictionary, stats=(vargs["stats"] is not None), min_length=vargs["min_length"], max_length=vargs["max_length"])
+    if vargs["stream"]:
+        for (word, snake_score, snake) in solver.iter_words(updates=True):
+            print("%s    %d    %s" % (word, snake_score, snake))
+            sys.stdout.flush()
+        words = list(solver.found.values())
+        if not vargs["quiet"]:
+            print("")
+            print("Number of words:            %d" % len(words))
+            print("Length of the longest word: %d" % max([0] + [len(w[0]) for w in words]))
+            print("Maximum total score:        %d" % sum([w[1] for w in words]))
+            print("")
+        if vargs["stats"] is not None:
+            print_stats(solver, vargs["stats"])
+        return
+    words = solver.solve(sort=vargs["sort"], reverse=vargs["reverse"], workers=vargs["jobs"], cache=create_cache(vargs), symmetry=vargs["symmetry"], top_k=vargs["top"], deadline=vargs["deadline"], max_nodes=vargs["max_nodes"])
+    length_longest_word = max([0] + [len(w[0]) for w in words])
+    length_max_score = len(str(max([0] + [w[1] for w in words])))
     total = 0
     for (word, snake_score, snake) in words:
         word_padding = " " * (length_longest_word - len(word))
@@ -176,7 +530,85 @@ def solve_board(vargs):
         print("Number of words:            %d" % len(words))
         print("Length of the longest word: %d" % length_longest_word)
         print("Maximum total score:        %d" % total)
+        if solver.incomplete:
+            print("Search incomplete:          budget exhausted")
         print("")
+    if vargs["stats"] is not None:
+        print_stats(solver, vargs["stats"])
+
+def solve_batch(vargs):
+    """
+    Solve many boards with one loaded dictionary,
+    writing one JSON object per board (NDJSON), in input order.
+
+    :param dict vargs: the command line arguments
+    """
+    from elzzur.batch import iter_board_records, solve_records
+    from elzzur.mtdictionary import bundled_dictionary_path, get_dictionary
+    check_language(vargs)
+    check_topology(vargs)
+    check_stats(vargs)
+    check_lengths(vargs)
+    check_budget(vargs)
+    check_top(vargs)
+    if vargs["board"] is None:
+        print_error("You must specify the directory or file containing the boards to solve, or '-' for stdin.")
+    if vargs["dictionary"] is None:
+        vargs["dictionary"] = bundled_dictionary_path(vargs["language"])
+    dictionary = get_dictionary(vargs["dictionary"], language=vargs["language"], normalize=True, ignore_case=True)
+    try:
+        records = iter_board_records(vargs["board"])
+        results = solve_records(
+            records,
+            language=vargs["language"],
+            dictionary=dictionary,
+            topology=vargs["topology"],
+            sort=vargs["sort"],
+            reverse=vargs["reverse"],
+            workers=vargs["jobs"],
+            cache=create_cache(vargs, memory=True),
+            symmetry=vargs["symmetry"],
+            top_k=vargs["top"],
+            stats=(vargs["stats"] is not None),
+            min_length=vargs["min_length"],
+            max_length=vargs["max_length"],
+            deadline=vargs["deadline"],
+            max_nodes=vargs["max_nodes"]
+        )
+        if vargs["output"] is not None:
+            with io.open(vargs["output"], "w", encoding="utf-8") as f:
+                for result in results:
+                    f.write(u"%s\n" % json.dumps(result, sort_keys=True))
+        else:
+            for result in results:
+                print(json.dumps(result, sort_keys=True))
+                sys.stdout.flush()
+    except IOError as exc:
+        print_error(str(exc))
+
+def serve(vargs):
+    """
+    Run the local solve service, until interrupted.
+
+    :param dict vargs: the command line arguments
+    """
+    from elzzur.server import SolveService, create_server
+    languages = LANGUAGES
+    if vargs["language"] is not None:
+        check_language(vargs)
+        languages = [vargs["language"]]
+    service = SolveService(languages=languages, workers=vargs["jobs"], queue_size=vargs["queue"], timeout=vargs["timeout"], cache=create_cache(vargs, memory=True))
+    server = create_server(service, host=vargs["host"], port=vargs["port"], socket_path=vargs["socket"], verbose=not vargs["quiet"])
+    if not vargs["quiet"]:
+        where = vargs["socket"] if vargs["socket"] is not None else "http://%s:%d/" % (vargs["host"], vargs["port"])
+        print("Serving %s on %s" % (", ".join(languages), where))
+        sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
 
 def generate_board(vargs):
     """
@@ -184,14 +616,75 @@ def generate_board(vargs):
     
     :param dict vargs: the command line arguments
     """
+    from elzzur.board import Board
+    from elzzur.generator import BoardSampler, search_board, shard_seed
     check_language(vargs)
-    board = Board(vargs["language"]).generate_random_board(rows=vargs["rows"], cols=vargs["cols"])
+    check_topology(vargs)
+    check_generate(vargs)
+    if vargs["count"] is not None:
+        generate_many_boards(vargs)
+        return
+    targets = generation_targets(vargs)
+    if targets is not None:
+        sampler = BoardSampler(vargs["language"], seed=shard_seed(vargs["seed"], 0) if vargs["seed"] is not None else None)
+        try:
+            board = search_board(sampler, generation_dictionary(vargs), vargs["rows"], vargs["cols"], targets, topology=vargs["topology"], max_restarts=vargs["max_restarts"])
+        except ValueError as exc:
+            print_error(str(exc))
+    elif vargs["seed"] is not None:
+        # the same board as the first one of --count N --seed S
+        board = BoardSampler(vargs["language"], seed=shard_seed(vargs["seed"], 0)).board(vargs["rows"], vargs["cols"], topology=vargs["topology"])
+    else:
+        board = Board(vargs["language"], topology=vargs["topology"]).generate_random_board(rows=vargs["rows"], cols=vargs["cols"])
     print(board.pretty_print(multipliers=True))
     if vargs["output"] is not None:
         board.save_to_file(vargs["output"])
         print("")
         print("File '%s' saved" % vargs["output"])
 
+def generate_many_boards(vargs):
+    """
+    Generate many random boards, writing one board per line,
+    in the compact format (rows separated by ``/``),
+    to the output file or to stdout.
+
+    :param dict vargs: the command line arguments
+    """
+    from elzzur.generator import generate_boards, search_boards
+    seed = vargs["seed"]
+    if seed is None:
+        import random
+        seed = random.SystemRandom().randint(0, 2 ** 32 - 1)
+        if not vargs["quiet"]:
+            sys.stderr.write("Seed: %d\n" % seed)
+    targets = generation_targets(vargs)
+    counters = {}
+    start = time.time()
+    if targets is not None:
+        lines = search_boards(vargs["language"], generation_dictionary(vargs), vargs["count"], targets, rows=vargs["rows"], cols=vargs["cols"], seed=seed, topology=vargs["topology"], workers=vargs["jobs"], max_restarts=vargs["max_restarts"], counters=counters)
+    else:
+        lines = generate_boards(vargs["language"], vargs["count"], rows=vargs["rows"], cols=vargs["cols"], seed=seed, workers=vargs["jobs"])
+    try:
+        if vargs["output"] is not None:
+            with io.open(vargs["output"], "w", encoding="utf-8") as f:
+                for line in lines:
+                    f.write(u"%s\n" % line)
+        else:
+            write = sys.stdout.write
+            for line in lines:
+                write("%s\n" % line)
+            sys.stdout.flush()
+    except ValueError as exc:
+        # raised by search_boards() when the targets cannot be met
+        sys.stdout.flush()
+        print_error(str(exc))
+    if not vargs["quiet"]:
+        elapsed = time.time() - start
+        if targets is not None:
+            sys.stderr.write("Accepted %d boards in %.3f seconds (%.1f boards/s, %d mutations/s, %d restarts)\n" % (vargs["count"], elapsed, vargs["count"] / elapsed if elapsed > 0 else 0, counters.get("mutations", 0) / elapsed if elapsed > 0 else 0, counters.get("restarts", 0)))
+        else:
+            sys.stderr.write("Generated %d boards in %.3f seconds (%d boards/s)\n" % (vargs["count"], elapsed, vargs["count"] / elapsed if elapsed > 0 else 0))
+
 def cat_dictionary(vargs):
     """
     Output the keys in the given dictionary to stdout.
@@ -199,6 +692,7 @@ def cat_dictionary(vargs):
     
     :param dict vargs: the command line arguments
     """
+    from elzzur.mtdictionary import MTDictionary
     if vargs["dictionary"] is None:
         print_error("You must specify the path of the input dictionary file.")
     words = MTDictionary(vargs["dictionary"], normalize=False, ignore_case=False)
@@ -216,6 +710,7 @@ def compile_dictionary(vargs):
     
     :param dict vargs: the command line arguments
     """
+    from elzzur.mtdictionary import MTDictionary
     if vargs["dictionary"] is None:
         print_error("You must specify the path of the input dictionary file.")
     if vargs["output"] is None:
@@ -223,7 +718,19 @@ def compile_dictionary(vargs):
     output_file_path = vargs["output"]
     if not output_file_path.endswith(".marisa"):
         output_file_path += ".marisa"
-    words = MTDictionary(vargs["dictionary"], normalize=True, ignore_case=True)
+
+    def report(lines, elapsed):
+        if not vargs["quiet"]:
+            sys.stderr.write("\rRead %d lines (%d lines/s)" % (lines, lines / elapsed if elapsed > 0 else 0))
+            sys.stderr.flush()
+
+    start = time.time()
+    try:
+        words = MTDictionary(vargs["dictionary"], normalize=True, ignore_case=True, workers=vargs["jobs"], progress=report)
+    except (IOError, ValueError) as exc:
+        print_error(str(exc))
+    if not vargs["quiet"]:
+        sys.stderr.write("\nCompiled %d words in %.3f seconds\n" % (len(words), time.time() - start))
     words.save_marisa_trie(output_file_path)
     print("File '%s' saved" % output_file_path)
 
@@ -240,9 +747,9 @@ def main():
                 parser.add_argument(arg["long"], action=arg["action"], help=arg["help"])
         else:
             if arg["short"] is not None:
-                parser.add_argument(arg["short"], arg["long"], nargs=arg["nargs"], type=arg["type"], default=arg["default"], help=arg["help"])
+                parser.add_argument(arg["short"], arg["long"], nargs=arg["nargs"], type=arg["type"], const=arg.get("const"), default=arg["default"], help=arg["help"])
             else:
-                parser.add_argument(arg["long"], nargs=arg["nargs"], type=arg["type"], default=arg["default"], help=arg["help"])
+                parser.add_argument(arg["long"], nargs=arg["nargs"], type=arg["type"], const=arg.get("const"), default=arg["default"], help=arg["help"])
     vargs = vars(parser.parse_args())
     command = vargs["command"]
     if command == "languages":
@@ -251,6 +758,10 @@ def main():
         demo_mode(vargs)
     elif command == "solve":
         solve_board(vargs)
+    elif command == "serve":
+        serve(vargs)
+    elif command == "solve-batch":
+        solve_batch(vargs)
     elif command == "generate":
         generate_board(vargs)
     elif command == "cat":
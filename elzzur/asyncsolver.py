@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Solve boards from asyncio code, without blocking the event loop.
+
+The search runs in an executor:
+
+a. a thread executor (the default), where a running search
+   can be cancelled cooperatively (see ``Solver.cancel()``),
+   and its words can be streamed as they are found; or
+b. a process executor (``concurrent.futures.ProcessPoolExecutor``),
+   where the searches run in parallel, but they can be cancelled
+   only before they start, and their words are available only at the end.
+
+At most ``max_concurrent`` searches run at once;
+the others wait for a free slot, without blocking the event loop.
+The dictionaries are shared through ``get_dictionary()``,
+hence each process loads the dictionary of each language only once.
+
+Example::
+
+    from elzzur.asyncsolver import solve_async
+
+    words = await solve_async(board, timeout=1.0, partial=True)
+
+This module requires Python 3.6 or later.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import asyncio
+import concurrent.futures
+import functools
+
+from elzzur.mtdictionary import get_dictionary
+from elzzur.snake import Snake
+from elzzur.solver import Solver
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+SOLVER_OPTIONS = ["stats", "min_length", "max_length"]
+""" Options passed to ``Solver()``; the others are passed to ``Solver.solve()`` """
+
+_DONE = object()
+""" Marks the end of the words streamed by ``AsyncSolver.iter_words()`` """
+
+_DEFAULT_SOLVER = None
+""" The ``AsyncSolver`` used by ``solve_async()`` and ``iter_words_async()`` """
+
+def split_options(options):
+    """
+    Split the given options into the ones for ``Solver()``
+    and the ones for ``Solver.solve()``.
+
+    :param dict options: the options
+    :rtype: (dict, dict)
+    """
+    solver_options = dict([(k, v) for (k, v) in options.items() if k in SOLVER_OPTIONS])
+    solve_options = dict([(k, v) for (k, v) in options.items() if k not in SOLVER_OPTIONS])
+    return (solver_options, solve_options)
+
+def _solve_in_process(board, dictionary, solver_options, solve_options):
+    """
+    Solve the given board in a worker process of a process executor.
+
+    :param Board board: the board to solve
+    :param object dictionary: the dictionary, or the path of its MARISA file
+    :param dict solver_options: the keyword arguments for ``Solver()``
+    :param dict solve_options: the keyword arguments for ``Solver.solve()``
+    :rtype: list of (str, int, list) tuples
+    """
+    if not hasattr(dictionary, "trie"):
+        dictionary = get_dictionary(dictionary, language=board.language)
+    words = Solver(board, dictionary, **solver_options).solve(**solve_options)
+    return [(word, snake_score, snake.cells) for (word, snake_score, snake) in words]
+
+class AsyncSolver(object):
+    """
+    Solve boards from asyncio code, in the given executor,
+    running at most ``max_concurrent`` searches at once.
+
+    :param concurrent.futures.Executor executor: the executor (if ``None``, a thread executor with ``max_concurrent`` threads)
+    :param int max_concurrent: the maximum number of searches running at once
+    """
+    def __init__(self, executor=None, max_concurrent=4):
+        self.max_concurrent = max(1, max_concurrent)
+        self.own_executor = executor is None
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent)
+        self.executor = executor
+        self.processes = isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+        self._semaphore = None
+
+    @property
+    def semaphore(self):
+        """
+        The semaphore limiting the searches running at once
+        in the current event loop.
+
+        :rtype: asyncio.Semaphore
+        """
+        loop = asyncio.get_event_loop()
+        if (self._semaphore is None) or (self._semaphore[0] is not loop):
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrent))
+        return self._semaphore[1]
+
+    def dictionary(self, language, file_path=None):
+        """
+        Return the (shared) dictionary for the given language.
+
+        :param str language: the language code (e.g. ``en``)
+        :param str file_path: path to the dictionary file (if ``None``, the built-in one)
+        :rtype: MTDictionary
+        """
+        return get_dictionary(file_path, language=language)
+
+    async def _submit(self, function, *args):
+        """
+        Wait for a free slot, and submit the given function to the executor.
+
+        The slot is released when the function returns
+        (or when it is cancelled before starting),
+        even if the caller stopped waiting for it;
+        hence the caller must not cancel the returned asyncio future,
+        but the ``concurrent.futures`` one.
+
+        :param function function: the function to run
+        :rtype: (asyncio.Future, concurrent.futures.Future)
+        """
+        semaphore = self.semaphore
+        await semaphore.acquire()
+        try:
+            concurrent_future = self.executor.submit(function, *args)
+        except BaseException:
+            semaphore.release()
+            raise
+        future = asyncio.wrap_future(concurrent_future)
+        future.add_done_callback(lambda f: semaphore.release())
+        return (future, concurrent_future)
+
+    async def solve(self, board, dictionary=None, timeout=None, partial=False, **options):
+        """
+        Solve the given board, as ``Solver.solve()`` does.
+
+        If the search does not end within ``timeout`` seconds,
+        ``asyncio.TimeoutError`` is raised, unless ``partial`` is ``True``:
+        in this case, the words found so far are returned (thread executors only).
+        If the calling task is cancelled, the search is cancelled as well.
+
+        :param Board board: the board to solve
+        :param MTDictionary dictionary: the dictionary (if ``None``, the built-in one for the language of the board)
+        :param float timeout: the maximum time, in seconds, to wait for the result
+        :param bool partial: if ``True``, return the words found so far on timeout
+        :param dict options: the keyword arguments for ``Solver()`` and ``Solver.solve()``
+        :rtype: list of (str, int, Snake) tuples
+        """
+        if dictionary is None:
+            dictionary = self.dictionary(board.language)
+        solver_options, solve_options = split_options(options)
+        if self.processes:
+            reference = dictionary
+            if (dictionary.file_path is not None) and (dictionary.file_path.endswith(".marisa")):
+                # each worker process loads it once, through get_dictionary()
+                reference = dictionary.file_path
+            future, concurrent_future = await self._submit(_solve_in_process, board, reference, solver_options, solve_options)
+            try:
+                entries = await asyncio.wait_for(asyncio.shield(future), timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                # a running search cannot be interrupted
+                concurrent_future.cancel()
+                raise
+            return [(word, snake_score, Snake(cells)) for (word, snake_score, cells) in entries]
+        solver = Solver(board, dictionary, **solver_options)
+        future, concurrent_future = await self._submit(functools.partial(solver.solve, **solve_options))
+        try:
+            # shield: on timeout, the search must end before its slot is released
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            solver.cancel()
+            if partial:
+                return await future
+            raise
+        except asyncio.CancelledError:
+            solver.cancel()
+            raise
+
+    async def iter_words(self, board, dictionary=None, timeout=None, updates=False, **options):
+        """
+        Solve the given board, yielding each word as soon as it is found,
+        as ``Solver.iter_words()`` does (thread executors only).
+
+        If the search does not end within ``timeout`` seconds,
+        ``asyncio.TimeoutError`` is raised.
+        If the caller stops iterating, the search is cancelled.
+
+        :param Board board: the board to solve
+        :param MTDictionary dictionary: the dictionary (if ``None``, the built-in one for the language of the board)
+        :param float timeout: the maximum time, in seconds, to wait for the search to end
+        :param bool updates: if ``True``, yield also the best snake updates
+        :param dict options: the keyword arguments for ``Solver()``
+        :rtype: async generator of (str, int, Snake) tuples
+        """
+        if self.processes:
+            raise ValueError("Streaming the words requires a thread executor.")
+        if dictionary is None:
+            dictionary = self.dictionary(board.language)
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue()
+        solver = Solver(board, dictionary, **options)
+
+        def produce():
+            try:
+                for entry in solver.iter_words(updates=updates):
+                    loop.call_soon_threadsafe(queue.put_nowait, entry)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+        future, concurrent_future = await self._submit(produce)
+        deadline = loop.time() + timeout if timeout is not None else None
+        try:
+            while True:
+                remaining = max(0.0, deadline - loop.time()) if deadline is not None else None
+                entry = await asyncio.wait_for(queue.get(), remaining)
+                if entry is _DONE:
+                    break
+                yield entry
+            # propagate the exceptions of the search, if any
+            await future
+        finally:
+            solver.cancel()
+            concurrent_future.cancel()
+
+    def shutdown(self, wait=True):
+        """
+        Shut the executor down, if it was created by this object.
+
+        :param bool wait: if ``True``, wait for the running searches to end
+        """
+        if self.own_executor:
+            self.executor.shutdown(wait=wait)
+
+def default_solver():
+    """
+    Return the ``AsyncSolver`` shared by ``solve_async()`` and ``iter_words_async()``,
+    using a thread executor.
+
+    :rtype: AsyncSolver
+    """
+    global _DEFAULT_SOLVER
+    if _DEFAULT_SOLVER is None:
+        _DEFAULT_SOLVER = AsyncSolver()
+    return _DEFAULT_SOLVER
+
+async def solve_async(board, dictionary=None, **options):
+    """
+    Solve the given board with the default ``AsyncSolver``
+    (see ``AsyncSolver.solve()``).
+
+    :param Board board: the board to solve
+    :param MTDictionary dictionary: the dictionary (if ``None``, the built-in one for the language of the board)
+    :param dict options: the keyword arguments for ``AsyncSolver.solve()``
+    :rtype: list of (str, int, Snake) tuples
+    """
+    return await default_solver().solve(board, dictionary=dictionary, **options)
+
+def iter_words_async(board, dictionary=None, **options):
+    """
+    Solve the given board with the default ``AsyncSolver``,
+    yielding each word as soon as it is found (see ``AsyncSolver.iter_words()``).
+
+    :param Board board: the board to solve
+    :param MTDictionary dictionary: the dictionary (if ``None``, the built-in one for the language of the board)
+    :param dict options: the keyword arguments for ``AsyncSolver.iter_words()``
+    :rtype: async generator of (str, int, Snake) tuples
+    """
+    return default_solver().iter_words(board, dictionary=dictionary, **options)
+
+
+
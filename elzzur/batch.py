@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Solve many boards with one loaded dictionary.
+
+The boards can be read from:
+
+a. a directory, containing one board file per board (read in name order);
+b. a multi-board file, containing boards separated by one or more empty lines,
+   or one board per line in the compact format (rows separated by ``/``); or
+c. the standard input (``-``), in the same format of b.
+
+The results are produced in input order,
+as one dict per board, ready to be serialized as NDJSON.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import io
+import itertools
+import os
+import sys
+import time
+
+from elzzur.board import Board
+from elzzur.generator import ROW_SEPARATOR
+from elzzur.pool import ordered_map
+from elzzur.results import SolveResult
+from elzzur.solver import Solver
+from elzzur.topology import GRID
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+STDIN = "-"
+""" Placeholder for reading the boards from the standard input """
+
+CHUNK_SIZE = 8
+""" Number of board records sent to a worker process at once by ``solve_records()`` """
+
+_WORKER_BATCH = None
+""" The (dictionary, options) of the current worker process, see ``solve_records()`` """
+
+def split_records(lines, source):
+    """
+    Split the given lines into board records,
+    separated by one or more empty lines.
+    A line in the compact format of ``elzzur.generator``
+    (rows separated by ``/``) is a board record by itself.
+
+    :param iterable lines: the input lines
+    :param str source: the name of the input, used to label the records
+    :rtype: generator of (str, str) tuples, i.e. ``(label, text)``
+    """
+    acc = []
+    first = 0
+    for (number, line) in enumerate(lines, 1):
+        if ROW_SEPARATOR in line:
+            # a whole board in the compact format
+            if len(acc) > 0:
+                yield (u"%s:%d" % (source, first), u"".join(acc))
+                acc = []
+            yield (u"%s:%d" % (source, number), line.strip().replace(ROW_SEPARATOR, u"\n"))
+        elif len(line.strip()) == 0:
+            if len(acc) > 0:
+                yield (u"%s:%d" % (source, first), u"".join(acc))
+                acc = []
+        else:
+            if len(acc) == 0:
+                first = number
+            acc.append(line)
+    if len(acc) > 0:
+        yield (u"%s:%d" % (source, first), u"".join(acc))
+
+def iter_board_records(input_path):
+    """
+    Read the board records from the given directory, multi-board file, or standard input.
+
+    :param str input_path: path to a directory or a file, or ``-`` for the standard input
+    :rtype: generator of (str, str) tuples, i.e. ``(label, text)``
+    """
+    if input_path == STDIN:
+        stdin = sys.stdin if sys.version_info[0] == 2 else io.open(sys.stdin.fileno(), "r", encoding="utf-8", closefd=False)
+        for record in split_records(stdin, u"<stdin>"):
+            yield record
+    elif os.path.isdir(input_path):
+        for name in sorted(os.listdir(input_path)):
+            file_path = os.path.join(input_path, name)
+            if os.path.isfile(file_path):
+                with io.open(file_path, "r", encoding="utf-8") as f:
+                    yield (file_path, f.read())
+    elif os.path.isfile(input_path):
+        with io.open(input_path, "r", encoding="utf-8") as f:
+            for record in split_records(f, input_path):
+                yield record
+    else:
+        raise IOError("The batch input does not exist. (Got: '%s')" % input_path)
+
+def solve_record(record, language, dictionary, topology=GRID, sort=Solver.SORT_BY_SCORE, reverse=False, cache=None, symmetry=False, top_k=None, stats=False, min_length=2, max_length=None, deadline=None, max_nodes=None, compact=False):
+    """
+    Parse and solve one board record.
+
+    If the board cannot be parsed, the returned dict
+    contains an ``error`` key instead of the words.
+
+    :param tuple record: the ``(label, text)`` record
+    :param str language: the language code (e.g. ``en``) of the board
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param str topology: the adjacency of the board cells
+    :param str sort: the sort method
+    :param bool reverse: if ``True`` reverse the order of the words
+    :param SolveCache cache: the cache of the solve results
+    :param bool symmetry: if ``True``, solve the canonical rotation/reflection of the board
+    :param int top_k: if not ``None``, the number of best words to return
+    :param bool stats: if ``True``, add the search counters (see ``SolverStats``) to the result
+    :param int min_length: the minimum length of the words
+    :param int max_length: the maximum length of the words, or ``None`` for no limit
+    :param float deadline: if not ``None``, the time budget of the search, in seconds
+    :param int max_nodes: if not ``None``, the maximum number of snakes to expand
+    :param bool compact: if ``True``, return the words as a ``SolveResult`` instead of a list of lists
+    :rtype: dict
+    """
+    label, text = record
+    result = {"source": label}
+    start = time.time()
+    try:
+        board = Board(language, topology=topology).read_board_string(text)
+    except ValueError as exc:
+        result["error"] = str(exc)
+        return result
+    parsed = time.time()
+    solver = Solver(board, dictionary, stats=stats, min_length=min_length, max_length=max_length)
+    words = solver.solve(sort=sort, reverse=reverse, cache=cache, symmetry=symmetry, top_k=top_k, deadline=deadline, max_nodes=max_nodes)
+    solved = time.time()
+    result["board"] = board.pretty_print(multipliers=True)
+    if compact:
+        result["words"] = SolveResult.from_entries(words, dictionary, board.graph)
+    else:
+        result["words"] = [[word, snake_score, snake.cells] for (word, snake_score, snake) in words]
+    result["count"] = len(words)
+    result["total"] = sum([w[1] for w in words])
+    result["time"] = {
+        "parse": round(parsed - start, 6),
+        "solve": round(solved - parsed, 6),
+    }
+    if (deadline is not None) or (max_nodes is not None):
+        result["incomplete"] = solver.incomplete
+    if stats:
+        result["stats"] = solver.stats.as_dict()
+    return result
+
+def _init_worker(dictionary, options):
+    """
+    Initialize a worker process of ``solve_records()``.
+
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param dict options: the keyword arguments for ``solve_record()``
+    """
+    global _WORKER_BATCH
+    _WORKER_BATCH = (dictionary, options)
+
+def _solve_chunk(records):
+    """
+    Solve a chunk of board records in the current worker process.
+
+    The words are returned as a ``SolveResult``,
+    which is much cheaper to send back to the main process
+    than a list of lists.
+
+    :param list records: the ``(label, text)`` records
+    :rtype: list of dict
+    """
+    dictionary, options = _WORKER_BATCH
+    return [solve_record(record, dictionary=dictionary, compact=True, **options) for record in records]
+
+def solve_records(records, language, dictionary, topology=GRID, sort=Solver.SORT_BY_SCORE, reverse=False, workers=1, cache=None, symmetry=False, top_k=None, stats=False, min_length=2, max_length=None, deadline=None, max_nodes=None):
+    """
+    Solve the given board records, yielding the results in input order.
+
+    The records are consumed lazily,
+    and each result is yielded as soon as it
+    (and all the results preceding it) is available.
+    With more than one worker process, the records are sent
+    in chunks of ``CHUNK_SIZE`` records (see ``ordered_map()``),
+    hence only a bounded window of the input is read ahead.
+
+    :param iterable records: the ``(label, text)`` records
+    :param str language: the language code (e.g. ``en``) of the boards
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param str topology: the adjacency of the board cells
+    :param str sort: the sort method
+    :param bool reverse: if ``True`` reverse the order of the words
+    :param int workers: the number of worker processes
+    :param SolveCache cache: the cache of the solve results (each worker process gets its own in-memory tier)
+    :param bool symmetry: if ``True``, solve the canonical rotation/reflection of each board, so that symmetric boards share the cached result
+    :param int top_k: if not ``None``, the number of best words to return for each board
+    :param bool stats: if ``True``, add the search counters to each result
+    :param int min_length: the minimum length of the words
+    :param int max_length: the maximum length of the words, or ``None`` for no limit
+    :param float deadline: if not ``None``, the time budget of the search of each board, in seconds
+    :param int max_nodes: if not ``None``, the maximum number of snakes to expand for each board
+    :rtype: generator of dict
+    """
+    options = {"language": language, "topology": topology, "sort": sort, "reverse": reverse, "cache": cache, "symmetry": symmetry, "top_k": top_k, "stats": stats, "min_length": min_length, "max_length": max_length, "deadline": deadline, "max_nodes": max_nodes}
+    if workers > 1:
+        records = iter(records)
+        chunks = iter(lambda: list(itertools.islice(records, CHUNK_SIZE)), [])
+        index = 0
+        for results in ordered_map(_solve_chunk, chunks, workers, initializer=_init_worker, initargs=(dictionary, options)):
+            for result in results:
+                if "words" in result:
+                    result["words"] = result["words"].bind(dictionary).to_lists()
+                result["index"] = index
+                index += 1
+                yield result
+    else:
+        for (index, record) in enumerate(records):
+            result = solve_record(record, dictionary=dictionary, **options)
+            result["index"] = index
+            yield result
+
+
+
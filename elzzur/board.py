@@ -7,11 +7,13 @@ A Ruzzle board.
 
 from __future__ import absolute_import
 from __future__ import print_function
+import bisect
 import io
 import os
 import random
 
 from elzzur.languages import LANGUAGES, LETTER_SCORE, LETTER_FREQUENCY
+from elzzur.topology import GRID, TOPOLOGIES, compile_graph
 
 __author__ = "Alberto Pettarin"
 __copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
@@ -58,6 +60,60 @@ MULTIPLIERS_CDF = [
 ]
 """ CDF of the multipliers, used for generating random boards """
 
+SCORE_CHUNK_SIZE = 65536
+""" Number of snakes scored at once by ``Board.compute_snakes_scores()`` """
+
+MAX_EXACT_SCORE = 2 ** 62
+""" Scores that might exceed this value are not computed with NumPy (64 bit) integers """
+
+_SAMPLING_TABLES = {}
+""" Sampling tables of each language, see ``sampling_tables()`` """
+
+def sampling_tables(language):
+    """
+    Return the tables for drawing random letters and multipliers
+    for the given language, computed only once per language,
+    as a ``(letters, letters_cdf, multipliers, multipliers_cdf)`` tuple.
+
+    The element drawn by a uniform random number ``rnd`` in ``[0, 1]``
+    is ``elements[bisect.bisect_left(cdf, rnd)]``.
+
+    :param str language: the language code (e.g. ``en``)
+    :rtype: tuple
+    """
+    tables = _SAMPLING_TABLES.get(language)
+    if tables is None:
+        letter_freq = sorted([(l, LETTER_FREQUENCY[language][l]) for l in LETTER_FREQUENCY[language]])
+        cum_freq = []
+        f_prev = 0.0
+        for (l, f) in letter_freq:
+            f_prev += f
+            cum_freq.append(f_prev)
+        f_sum = cum_freq[-1]
+        tables = (
+            [l for (l, f) in letter_freq],
+            [f / f_sum for f in cum_freq],
+            [m for (m, cf) in MULTIPLIERS_CDF],
+            [cf for (m, cf) in MULTIPLIERS_CDF],
+        )
+        _SAMPLING_TABLES[language] = tables
+    return tables
+
+def _numpy():
+    """
+    Return the ``numpy`` module, or ``None`` if it is not installed.
+
+    NumPy is imported only when snakes are scored in batch,
+    so that loading a board does not pay for importing it.
+
+    :rtype: module
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
 class BoardCell(object):
     """
     A cell of the board.
@@ -97,11 +153,15 @@ class Board(object):
     A Ruzzle board.
 
     :param str language: the language code (e.g. ``en``) of the board, used to determine the letter score
+    :param str topology: the adjacency of the cells (see ``elzzur.topology.TOPOLOGIES``)
     """
-    def __init__(self, language):
+    def __init__(self, language, topology=GRID):
         if language not in LETTER_SCORE:
             raise ValueError("No score available for the given language. (Got '%s')" % language)
+        if topology not in TOPOLOGIES:
+            raise ValueError("Unknown topology '%s'. Supported topologies: %s" % (topology, ", ".join(TOPOLOGIES)))
         self.language = language
+        self.topology = topology
         self.cells = {}
         self.rows = 0
         self.cols = 0
@@ -138,6 +198,16 @@ class Board(object):
         """
         return [l.letter for l in list(self.cells.values())]
 
+    @property
+    def graph(self):
+        """
+        Return the compiled adjacency graph of the board,
+        shared by all the boards with the same shape and topology.
+
+        :rtype: BoardGraph
+        """
+        return compile_graph(self.rows, self.cols, self.topology)
+
     def letter_at(self, cell):
         """
         Return the letter at the given cell.
@@ -169,6 +239,93 @@ class Board(object):
             acc += LENGTH_POINTS[len(snake)]
         return acc
 
+    def score_tables(self):
+        """
+        Return the letter scores and the word multipliers
+        of the cells of the board, indexed as in ``self.graph``,
+        followed by a sentinel cell, with index ``len(self.graph)``,
+        score 0 and multiplier 1, used to pad snakes of different lengths.
+
+        :rtype: (list of int, list of int)
+        """
+        board_cells = [self.cells[cell] for cell in self.graph.cells]
+        return ([c.score for c in board_cells] + [0], [c.word_multiplier for c in board_cells] + [1])
+
+    def compute_indices_scores(self, indices):
+        """
+        Return the scores of the snakes in the given padded index array,
+        using vectorized NumPy operations.
+
+        Each row of ``indices`` contains the indices (as in ``self.graph``)
+        of the cells of one snake, padded with the sentinel index ``len(self.graph)``.
+
+        :param numpy.ndarray indices: the (number of snakes) x (maximum length) array of cell indices
+        :rtype: numpy.ndarray
+        """
+        numpy = _numpy()
+        if numpy is None:
+            raise ImportError("Scoring snakes with compute_indices_scores() requires NumPy.")
+        scores, multipliers = self.score_tables()
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        letters = numpy.asarray(scores, dtype=numpy.int64)[indices].sum(axis=1)
+        products = numpy.asarray(multipliers, dtype=numpy.int64)[indices].prod(axis=1)
+        lengths = (indices != len(scores) - 1).sum(axis=1)
+        cap = max(LENGTH_POINTS) + 1
+        points = numpy.asarray([LENGTH_POINTS.get(length, 0) for length in range(cap + 1)], dtype=numpy.int64)
+        return letters * products + points[numpy.minimum(lengths, cap)]
+
+    def compute_snakes_scores(self, snakes, vectorized=False):
+        """
+        Return the scores of the given snakes,
+        as ``compute_snake_score()`` would, but in batch.
+
+        The snakes are scored in pure Python, using the per-cell tables of ``score_tables()``.
+        If ``vectorized`` is ``True`` and NumPy is available,
+        the snakes are converted into padded index arrays
+        of ``SCORE_CHUNK_SIZE`` snakes each, and scored by ``compute_indices_scores()``
+        (unless the scores might overflow 64 bit integers).
+        Since converting the cells into indices costs about as much
+        as scoring them in pure Python, this is not faster:
+        call ``compute_indices_scores()`` directly on snakes already stored as index arrays.
+
+        :param list snakes: the snakes (Snake objects, or lists of ``(x, y)`` cells)
+        :param bool vectorized: if ``True``, use NumPy, if available
+        :rtype: list of int
+        """
+        snakes = [snake if isinstance(snake, list) else snake.cells for snake in snakes]
+        graph = self.graph
+        scores, multipliers = self.score_tables()
+        width = max([0] + [len(cells) for cells in snakes])
+        numpy = _numpy() if vectorized else None
+        if vectorized and (numpy is not None):
+            top_scores = sum(sorted(scores, reverse=True)[0:width])
+            top_multipliers = 1
+            for value in sorted(multipliers, reverse=True)[0:width]:
+                top_multipliers *= value
+            vectorized = (top_scores * top_multipliers + max(LENGTH_POINTS.values())) < MAX_EXACT_SCORE
+        if vectorized and (numpy is not None):
+            positions = dict([(cell, i) for (i, cell) in enumerate(graph.cells)])
+            acc = []
+            for start in range(0, len(snakes), SCORE_CHUNK_SIZE):
+                chunk = snakes[start:start + SCORE_CHUNK_SIZE]
+                lengths = numpy.asarray([len(cells) for cells in chunk], dtype=numpy.intp)
+                flat = numpy.fromiter([positions[cell] for cells in chunk for cell in cells], dtype=numpy.intp)
+                indices = numpy.full((len(chunk), int(lengths.max())), len(graph), dtype=numpy.intp)
+                indices[numpy.arange(indices.shape[1]) < lengths[:, None]] = flat
+                acc.extend(self.compute_indices_scores(indices).tolist())
+            return acc
+        acc = []
+        index = graph.index
+        for cells in snakes:
+            letters = 0
+            product = 1
+            for cell in cells:
+                i = index(cell)
+                letters += scores[i]
+                product *= multipliers[i]
+            acc.append(letters * product + LENGTH_POINTS.get(len(cells), 0))
+        return acc
+
     def save_to_file(self, file_path):
         """
         Save the board to file.
@@ -197,19 +354,40 @@ class Board(object):
         """
         if not os.path.isfile(file_path):
             raise IOError("The board file does not exist. (Got: '%s')" % file_path)
+        with io.open(file_path, "r", encoding="utf-8") as f:
+            return self.read_board_lines(f)
+
+    def read_board_string(self, string):
+        """
+        Read the board from the given string,
+        in the same format of ``read_board_file()``.
+
+        :param str string: the board rows
+        :rtype: Board
+        """
+        return self.read_board_lines(string.split(u"\n"))
+
+    def read_board_lines(self, lines):
+        """
+        Read the board from the given iterable of lines,
+        in the same format of ``read_board_file()``.
+        Reading stops at the first empty line.
+
+        :param iterable lines: the board rows
+        :rtype: Board
+        """
         self.cells = {}
         row = 0
         cols = []
-        with io.open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if len(line.strip()) == 0:
-                    break
-                col = 0
-                for t in [l for l in line.strip().split(" ") if len(l) > 0]:
-                    self.cells[(row, col)] = BoardCell(t, self.language)
-                    col += 1
-                cols.append(col)
-                row += 1
+        for line in lines:
+            if len(line.strip()) == 0:
+                break
+            col = 0
+            for t in [l for l in line.strip().split(" ") if len(l) > 0]:
+                self.cells[(row, col)] = BoardCell(t, self.language)
+                col += 1
+            cols.append(col)
+            row += 1
         # check that we have at least one row
         if row < 1:
             raise ValueError("The board file seems empty.")
@@ -222,47 +400,34 @@ class Board(object):
         self.cols = cols[0]
         return self
 
-    def generate_random_board(self, rows=4, cols=4):
+    def generate_random_board(self, rows=4, cols=4, rng=None):
         """
         Generate a random board.
 
+        The letters are drawn according to the letter frequencies
+        of the language, and the multipliers according to ``MULTIPLIERS_CDF``,
+        using the (precomputed) tables of ``sampling_tables()``.
+
         :param int rows: the number of rows of the desired board
         :param int cols: the number of columns of the desired board
+        :param random.Random rng: the random number generator (if ``None``, the global one)
         :rtype: Board
         """
-        def cumsum(letter_freq):
-            # numpy has cumsum, but I do not want numpy as dependency
-            cum_freq = []
-            f_prev = 0.0
-            for (l, f) in letter_freq:
-                f_prev += f
-                cum_freq.append((l, f_prev))
-            f_sum = cum_freq[-1][1]
-            return [(l, f/f_sum) for (l, f) in cum_freq]
-
-        def draw_from_distribution(cdf):
-            #
-            # numpy has digitize() and numpy.random, but I do not want numpy as dependency
-            # this can be done with binary search instead of linear search
-            #
-            # in general, one should use the distribution of N-grams, N>=2 instead of single letter frequencies (N=1)
-            # I suspect that the original Ruzzle builds the board so that there are at least M words, etc.
-            # (i.e., the boards are not truly "random", based on some N-gram distribution)
-            #
-            rnd = random.uniform(0, 1)
-            for (element, cf) in cdf:
-                if rnd <= cf:
-                    return element
-
+        #
+        # in general, one should use the distribution of N-grams, N>=2 instead of single letter frequencies (N=1)
+        # I suspect that the original Ruzzle builds the board so that there are at least M words, etc.
+        # (i.e., the boards are not truly "random", based on some N-gram distribution)
+        #
+        if rng is None:
+            rng = random
+        letters, letters_cdf, multipliers, multipliers_cdf = sampling_tables(self.language)
         self.cells = {}
         self.rows = rows
         self.cols = cols
-        sorted_letters = sorted([(l, LETTER_FREQUENCY[self.language][l]) for l in LETTER_FREQUENCY[self.language]])
-        cum_freq = cumsum(sorted_letters)
         for row in range(self.rows):
             for col in range(self.cols):
-                letter = draw_from_distribution(cum_freq)
-                multiplier = draw_from_distribution(MULTIPLIERS_CDF)
+                letter = letters[bisect.bisect_left(letters_cdf, rng.uniform(0, 1))]
+                multiplier = multipliers[bisect.bisect_left(multipliers_cdf, rng.uniform(0, 1))]
                 self.cells[(row, col)] = BoardCell(letter + multiplier, self.language)
         return self
 
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+A content-addressed cache of solve results.
+
+The key of a board is the SHA-1 of its language, topology, shape,
+letters and multipliers, plus the fingerprint of the dictionary,
+so that a cached result is never reused after the dictionary changes.
+
+The cache has two tiers:
+
+a. an in-memory LRU tier, holding at most ``memory_size`` results; and
+b. an optional on-disk tier, holding one JSON file per result,
+   with the least recently used files evicted when the total size
+   exceeds ``disk_size`` bytes.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import collections
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+
+from elzzur.snake import Snake
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+def board_signature(board):
+    """
+    Return the canonical string representation of the given board,
+    including its language, topology, shape, letters and multipliers.
+
+    :param Board board: the board
+    :rtype: str
+    """
+    tokens = [board.cells[(row, col)].pretty_print(multiplier=True) for row in range(board.rows) for col in range(board.cols)]
+    return u"%s|%s|%dx%d|%s" % (board.language, board.topology, board.rows, board.cols, u" ".join(tokens))
+
+class SolveCache(object):
+    """
+    A two-tier (memory and disk) cache of solve results.
+
+    Each result is a list of ``(word, score, Snake)`` tuples.
+
+    :param str directory: the directory of the on-disk tier, or ``None`` to use only the in-memory tier
+    :param int memory_size: the maximum number of results in the in-memory tier
+    :param int disk_size: the maximum total size, in bytes, of the on-disk tier
+    """
+    def __init__(self, directory=None, memory_size=4096, disk_size=256 * 1024 * 1024):
+        self.directory = directory
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+        self.memory = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.disk_used = 0
+        self.hits = 0
+        self.misses = 0
+        if self.directory is not None:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            self.disk_used = sum([os.path.getsize(path) for path in self._disk_files()])
+
+    def __getstate__(self):
+        # the in-memory tier is not shared with other processes
+        return {"directory": self.directory, "memory_size": self.memory_size, "disk_size": self.disk_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self.memory)
+
+    def key(self, board, dictionary, kind=u"all"):
+        """
+        Return the key of the result of solving the given board with the given dictionary.
+
+        :param Board board: the board
+        :param MTDictionary dictionary: the dictionary
+        :param str kind: a label distinguishing results computed with different options
+        :rtype: str
+        """
+        string = u"%s|%s|%s" % (kind, dictionary.fingerprint, board_signature(board))
+        return hashlib.sha1(string.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Return the result with the given key, or ``None`` if it is not cached.
+
+        :param str key: the key
+        :rtype: list of (str, int, Snake) tuples
+        """
+        with self.lock:
+            entries = self.memory.get(key)
+            if entries is not None:
+                # move to the most recently used end
+                del self.memory[key]
+                self.memory[key] = entries
+                self.hits += 1
+                return entries
+        entries = self._disk_get(key)
+        with self.lock:
+            if entries is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._memory_put(key, entries)
+        return entries
+
+    def put(self, key, entries):
+        """
+        Store the given result with the given key.
+
+        :param str key: the key
+        :param list entries: the result, a list of (str, int, Snake) tuples
+        """
+        entries = list(entries)
+        self._memory_put(key, entries)
+        self._disk_put(key, entries)
+
+    def clear(self):
+        """
+        Remove all the results from both tiers.
+        """
+        with self.lock:
+            self.memory.clear()
+            for path in self._disk_files():
+                os.remove(path)
+            self.disk_used = 0
+
+    def _memory_put(self, key, entries):
+        with self.lock:
+            if key in self.memory:
+                del self.memory[key]
+            self.memory[key] = entries
+            while len(self.memory) > self.memory_size:
+                self.memory.popitem(last=False)
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, key[0:2], key + ".json")
+
+    def _disk_files(self):
+        acc = []
+        for (root, dirs, files) in os.walk(self.directory):
+            acc.extend([os.path.join(root, f) for f in files if f.endswith(".json")])
+        return acc
+
+    def _disk_get(self, key):
+        if self.directory is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with io.open(path, "r", encoding="utf-8") as f:
+                obj = json.load(f)
+            # mark as recently used
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        return [(word, snake_score, Snake([tuple(cell) for cell in cells])) for (word, snake_score, cells) in obj]
+
+    def _disk_put(self, key, entries):
+        if self.directory is None:
+            return
+        path = self._disk_path(key)
+        if not os.path.isdir(os.path.dirname(path)):
+            try:
+                os.makedirs(os.path.dirname(path))
+            except OSError:
+                pass
+        data = json.dumps([[word, snake_score, snake.cells] for (word, snake_score, snake) in entries]).encode("utf-8")
+        # write to a temporary file and rename it, so that readers never see a partial file
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(handle, "wb") as f:
+            f.write(data)
+        # the size of the file being overwritten, if any, is no longer used
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        getattr(os, "replace", os.rename)(tmp_path, path)
+        with self.lock:
+            self.disk_used += len(data) - replaced
+            evict = self.disk_used > self.disk_size
+        if evict:
+            self._disk_evict()
+
+    def _disk_evict(self):
+        """
+        Remove the least recently used files,
+        until the on-disk tier uses at most 90% of ``disk_size``.
+        """
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                pass
+        files.sort()
+        used = sum([f[1] for f in files])
+        target = int(self.disk_size * 0.9)
+        for (mtime, size, path) in files:
+            if used <= target:
+                break
+            try:
+                os.remove(path)
+                used -= size
+            except OSError:
+                pass
+        with self.lock:
+            self.disk_used = used
+
+
+
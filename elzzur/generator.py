@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Generate many random boards, quickly and reproducibly.
+
+The boards are generated in shards of ``SHARD_SIZE`` boards,
+each with its own random number generator, seeded from the global seed
+and the shard index, so that the same seed always produces the same boards,
+regardless of the number of worker processes.
+
+The boards are written in the compact format,
+one board per line, with the rows separated by ``/``::
+
+    S Ldl O S/K C Pdl T/A I Kdl Ttl/A T O S
+
+Boards meeting quality targets (number of words, maximum total score,
+length of the longest word) are found by hill climbing:
+starting from a random board, single cells are mutated,
+and a mutation is kept only if it does not move the board
+further from the targets (see ``search_board()``).
+The quality of a mutated board is updated by exploring again
+only the snakes through the mutated cell (see ``BoardQuality``
+and ``Solver.update_cell()``), instead of solving the board again.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import bisect
+import collections
+import random
+
+from elzzur.board import Board, sampling_tables
+from elzzur.pool import ordered_map
+from elzzur.topology import GRID
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+SHARD_SIZE = 4096
+""" Number of boards generated by each task of ``generate_boards()`` """
+
+SEARCH_SHARD_SIZE = 16
+""" Number of boards generated by each task of ``search_boards()`` """
+
+MAX_STEPS = 2000
+""" Number of mutations tried on a board before starting again from a new random board """
+
+MAX_RESTARTS = 20
+""" Number of times the search starts again from a new random board before giving up """
+
+ROW_SEPARATOR = u"/"
+""" Separator of the rows of a board in the compact format """
+
+_WORKER_DICTIONARY = None
+""" The dictionary of the current worker process, see ``search_boards()`` """
+
+def format_board_line(board):
+    """
+    Return the given board in the compact format.
+
+    :param Board board: the board
+    :rtype: str
+    """
+    return ROW_SEPARATOR.join([u" ".join([board.cells[(row, col)].pretty_print(multiplier=True) for col in range(board.cols)]) for row in range(board.rows)])
+
+def parse_board_line(line, language, topology=GRID):
+    """
+    Parse a board in the compact format,
+    raising ``ValueError`` on invalid input.
+
+    :param str line: the board
+    :param str language: the language code (e.g. ``en``)
+    :param str topology: the adjacency of the board cells
+    :rtype: Board
+    """
+    return Board(language, topology=topology).read_board_lines(line.strip().split(ROW_SEPARATOR))
+
+def shard_seed(seed, shard):
+    """
+    Return the seed of the random number generator of the given shard.
+
+    :param int seed: the global seed
+    :param int shard: the index of the shard
+    :rtype: str
+    """
+    return u"elzzur:%d:%d" % (seed, shard)
+
+class BoardSampler(object):
+    """
+    Draw random boards for the given language,
+    using the precomputed tables of ``sampling_tables()``
+    and a private random number generator.
+
+    :param str language: the language code (e.g. ``en``)
+    :param object seed: the seed of the random number generator
+    """
+    def __init__(self, language, seed=None):
+        self.language = language
+        self.rng = random.Random(seed)
+        self.letters, self.letters_cdf, self.multipliers, self.multipliers_cdf = sampling_tables(language)
+
+    def token(self):
+        """
+        Draw the token (letter and multiplier) of one cell.
+
+        :rtype: str
+        """
+        rnd = self.rng.random
+        return self.letters[bisect.bisect_left(self.letters_cdf, rnd())] + self.multipliers[bisect.bisect_left(self.multipliers_cdf, rnd())]
+
+    def tokens(self, rows, cols):
+        """
+        Draw the tokens of a ``rows x cols`` board, row by row.
+
+        :param int rows: the number of rows
+        :param int cols: the number of columns
+        :rtype: list of list of str
+        """
+        rnd = self.rng.random
+        letters, letters_cdf = self.letters, self.letters_cdf
+        multipliers, multipliers_cdf = self.multipliers, self.multipliers_cdf
+        return [[letters[bisect.bisect_left(letters_cdf, rnd())] + multipliers[bisect.bisect_left(multipliers_cdf, rnd())] for col in range(cols)] for row in range(rows)]
+
+    def line(self, rows, cols):
+        """
+        Draw a ``rows x cols`` board, in the compact format.
+
+        :param int rows: the number of rows
+        :param int cols: the number of columns
+        :rtype: str
+        """
+        return ROW_SEPARATOR.join([u" ".join(row) for row in self.tokens(rows, cols)])
+
+    def board(self, rows, cols, topology=GRID):
+        """
+        Draw a ``rows x cols`` board.
+
+        :param int rows: the number of rows
+        :param int cols: the number of columns
+        :param str topology: the adjacency of the board cells
+        :rtype: Board
+        """
+        return Board(self.language, topology=topology).read_board_lines([u" ".join(row) for row in self.tokens(rows, cols)])
+
+class BoardQuality(object):
+    """
+    The quality measures of a board:
+    the number of words, the maximum total score
+    (i.e., the sum of the highest score of each word),
+    and the length of the longest word.
+
+    The words are kept by a ``Solver`` indexing the snakes by cell,
+    so that changing one cell (see ``set_token()``)
+    explores again only the snakes through that cell,
+    and the measures are updated from the words added and removed.
+
+    :param Board board: the board, modified in place by ``set_token()``
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    """
+    def __init__(self, board, dictionary):
+        from elzzur.solver import Solver
+        self.board = board
+        self.solver = Solver(board, dictionary)
+        self.solver.build_index()
+        self.scores = {}
+        self.length_counts = collections.Counter()
+        self.total = 0
+        self._apply(self.solver.found.values(), [])
+
+    @property
+    def words(self):
+        """
+        The number of distinct words.
+
+        :rtype: int
+        """
+        return len(self.scores)
+
+    @property
+    def longest(self):
+        """
+        The length of the longest word.
+
+        :rtype: int
+        """
+        return max([0] + [length for (length, count) in self.length_counts.items() if count > 0])
+
+    def _apply(self, added, removed):
+        for word in removed:
+            self.total -= self.scores.pop(word)
+            self.length_counts[len(word)] -= 1
+        for (word, snake_score, snake) in added:
+            if word in self.scores:
+                self.total -= self.scores[word]
+            else:
+                self.length_counts[len(word)] += 1
+            self.scores[word] = snake_score
+            self.total += snake_score
+
+    def set_token(self, index, token):
+        """
+        Set the token of the cell with the given index (as in ``BoardGraph``),
+        and update the quality measures.
+
+        Return the record needed by ``undo()`` to revert the change.
+
+        :param int index: the index of the cell
+        :param str token: the new token (letter and multiplier) of the cell
+        :rtype: tuple
+        """
+        cell = self.board.graph.cells[index]
+        old = self.board.cells[cell]
+        self._apply(*self.solver.update_cell(cell, token))
+        return (index, old.letter + old.token_multiplier)
+
+    def undo(self, record):
+        """
+        Revert the change made by ``set_token()``.
+
+        :param tuple record: the record returned by ``set_token()``
+        """
+        self.set_token(*record)
+
+    def deficit(self, targets):
+        """
+        Return how far the board is from the given targets,
+        as the sum of the relative shortfalls of its quality measures.
+
+        :param tuple targets: the ``(min_words, min_score, min_longest)`` targets
+        :rtype: float
+        """
+        acc = 0.0
+        for (value, target) in zip([self.words, self.total, self.longest], targets):
+            if value < target:
+                acc += float(target - value) / target
+        return acc
+
+def search_board(sampler, dictionary, rows, cols, targets, topology=GRID, max_steps=MAX_STEPS, max_restarts=MAX_RESTARTS, counters=None):
+    """
+    Find a random board meeting the given quality targets, by hill climbing.
+
+    Each step redraws either the letter or the multiplier
+    of a random cell, and the mutation is undone
+    if it moves the board further from the targets.
+    After ``max_steps`` steps, the search starts again from a new random board.
+    After ``max_restarts`` restarts, the search gives up
+    (the targets might be unreachable, e.g. too many words for a small board),
+    raising ``ValueError``.
+
+    :param BoardSampler sampler: the sampler drawing the boards and the mutations
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param int rows: the number of rows
+    :param int cols: the number of columns
+    :param tuple targets: the ``(min_words, min_score, min_longest)`` targets
+    :param str topology: the adjacency of the board cells
+    :param int max_steps: the number of steps before starting again
+    :param int max_restarts: the number of restarts before giving up
+    :param dict counters: if not ``None``, the numbers of ``mutations`` and ``restarts`` are added to it
+    :rtype: Board
+    """
+    rnd = sampler.rng.random
+    letters, letters_cdf = sampler.letters, sampler.letters_cdf
+    multipliers, multipliers_cdf = sampler.multipliers, sampler.multipliers_cdf
+    restarts = 0
+    while True:
+        board = sampler.board(rows, cols, topology=topology)
+        cells = board.graph.cells
+        quality = BoardQuality(board, dictionary)
+        deficit = quality.deficit(targets)
+        steps = 0
+        while (deficit > 0) and (steps < max_steps):
+            steps += 1
+            index = sampler.rng.randrange(len(cells))
+            old = board.cells[cells[index]]
+            if rnd() < 0.5:
+                token = letters[bisect.bisect_left(letters_cdf, rnd())] + old.token_multiplier
+            else:
+                token = old.letter + multipliers[bisect.bisect_left(multipliers_cdf, rnd())]
+            if token == old.letter + old.token_multiplier:
+                continue
+            record = quality.set_token(index, token)
+            new_deficit = quality.deficit(targets)
+            if new_deficit <= deficit:
+                deficit = new_deficit
+            else:
+                quality.undo(record)
+        if counters is not None:
+            counters["mutations"] = counters.get("mutations", 0) + steps
+        if deficit == 0:
+            return board
+        if restarts >= max_restarts:
+            raise ValueError("No %dx%d board meeting the targets (%d words, %d points, %d letters) found after %d restarts." % ((rows, cols) + tuple(targets) + (restarts,)))
+        restarts += 1
+        if counters is not None:
+            counters["restarts"] = counters.get("restarts", 0) + 1
+
+def _shards(count, size):
+    """
+    Return the ``(shard, count)`` pairs splitting ``count`` boards into shards of ``size`` boards.
+
+    :param int count: the number of boards
+    :param int size: the number of boards per shard
+    :rtype: list of (int, int) tuples
+    """
+    return [(shard, min(size, count - shard * size)) for shard in range((count + size - 1) // size)]
+
+def _generate_shard(args):
+    """
+    Generate the boards of one shard, in the compact format.
+
+    :param tuple args: the ``(language, rows, cols, seed, shard, count)`` arguments
+    :rtype: list of str
+    """
+    language, rows, cols, seed, shard, count = args
+    sampler = BoardSampler(language, seed=shard_seed(seed, shard))
+    return [sampler.line(rows, cols) for i in range(count)]
+
+def generate_boards(language, count, rows=4, cols=4, seed=0, workers=1):
+    """
+    Generate ``count`` random boards, yielding them in the compact format.
+
+    If ``workers`` is greater than one, the shards are generated
+    by a pool of worker processes;
+    the boards are identical to the ones generated by a single process.
+
+    :param str language: the language code (e.g. ``en``)
+    :param int count: the number of boards
+    :param int rows: the number of rows of each board
+    :param int cols: the number of columns of each board
+    :param int seed: the global seed
+    :param int workers: the number of worker processes
+    :rtype: generator of str
+    """
+    tasks = [(language, rows, cols, seed, shard, size) for (shard, size) in _shards(count, SHARD_SIZE)]
+    for lines in ordered_map(_generate_shard, tasks, workers):
+        for line in lines:
+            yield line
+
+def _init_worker(dictionary):
+    """
+    Initialize a worker process of ``search_boards()``.
+
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    """
+    global _WORKER_DICTIONARY
+    _WORKER_DICTIONARY = dictionary
+
+def _search_shard(args):
+    """
+    Find the boards of one shard meeting the quality targets, in the compact format.
+
+    :param tuple args: the ``(language, rows, cols, seed, shard, count, targets, topology, max_restarts)`` arguments
+    :rtype: (list of str, dict)
+    """
+    language, rows, cols, seed, shard, count, targets, topology, max_restarts = args
+    sampler = BoardSampler(language, seed=shard_seed(seed, shard))
+    counters = {}
+    lines = [format_board_line(search_board(sampler, _WORKER_DICTIONARY, rows, cols, targets, topology=topology, max_restarts=max_restarts, counters=counters)) for i in range(count)]
+    return (lines, counters)
+
+def search_boards(language, dictionary, count, targets, rows=4, cols=4, seed=0, topology=GRID, workers=1, max_restarts=MAX_RESTARTS, counters=None):
+    """
+    Find ``count`` random boards meeting the given quality targets
+    (see ``search_board()``), yielding them in the compact format.
+
+    As in ``generate_boards()``, the boards are found in shards,
+    each with its own random number generator,
+    hence they do not depend on the number of worker processes.
+    If a board cannot be found (see ``search_board()``), ``ValueError`` is raised.
+
+    :param str language: the language code (e.g. ``en``)
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param int count: the number of boards
+    :param tuple targets: the ``(min_words, min_score, min_longest)`` targets
+    :param int rows: the number of rows of each board
+    :param int cols: the number of columns of each board
+    :param int seed: the global seed
+    :param str topology: the adjacency of the board cells
+    :param int workers: the number of worker processes
+    :param int max_restarts: the number of restarts before giving up on a board
+    :param dict counters: if not ``None``, the numbers of ``mutations`` and ``restarts`` are added to it
+    :rtype: generator of str
+    """
+    tasks = [(language, rows, cols, seed, shard, size, targets, topology, max_restarts) for (shard, size) in _shards(count, SEARCH_SHARD_SIZE)]
+    for (lines, shard_counters) in ordered_map(_search_shard, tasks, workers, initializer=_init_worker, initargs=(dictionary,)):
+        if counters is not None:
+            for (key, value) in shard_counters.items():
+                counters[key] = counters.get(key, 0) + value
+        for line in lines:
+            yield line
+
+
+
@@ -1,443 +0,0 @@
-#!/usr/bin/env python
-# coding=utf-8
-
-"""
-Language-dependent data.
-"""
-
-from __future__ import absolute_import
-from __future__ import print_function
-import io
-import os
-import random
-
-__author__ = "Alberto Pettarin"
-__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
-__license__ = "MIT"
-__version__ = "0.0.1"
-__email__ = "alberto@albertopettarin.it"
-__status__ = "Production"
-
-LANGUAGES = [
-    "de",
-    "en",
-    "es",
-    "fr",
-    "it",
-    "nl",
-    "pt"
-]
-""" Supported languages """
-
-LETTER_SCORE = {
-    "en": {
-        "A": 1,
-        "B": 4,
-        "C": 4,
-        "D": 2,
-        "E": 1,
-        "F": 4,
-        "G": 3,
-        "H": 4,
-        "I": 1,
-        "J": 10,
-        "K": 5,
-        "L": 1,
-        "M": 3,
-        "N": 1,
-        "O": 1,
-        "P": 4,
-        "Q": 10,
-        "R": 1,
-        "S": 1,
-        "T": 1,
-        "U": 2,
-        "V": 4,
-        "W": 4,
-        "X": 8,
-        "Y": 4,
-        "Z": 10,
-    },
-    "it": {
-        "A": 1,
-        "B": 5,
-        "C": 2,
-        "D": 5,
-        "E": 1,
-        "F": 5,
-        "G": 8,
-        "H": 8,
-        "I": 1,
-        "J": 10,
-        "K": 5,
-        "L": 3,
-        "M": 3,
-        "N": 3,
-        "O": 1,
-        "P": 5,
-        "Q": 10,
-        "R": 2,
-        "S": 2,
-        "T": 2,
-        "U": 3,
-        "V": 5,
-        "W": 10,
-        "X": 10,
-        "Y": 4,
-        "Z": 8,
-    },
-    "es": {
-        "A": 1,
-        "B": 3,
-        "C": 3,
-        "D": 2,
-        "E": 1,
-        "F": 4,
-        "G": 2,
-        "H": 4,
-        "I": 1,
-        "J": 8,
-        "K": 5,
-        "L": 1,
-        "M": 3,
-        "N": 1,
-        "O": 1,
-        "P": 3,
-        "Q": 10,
-        "R": 1,
-        "S": 1,
-        "T": 1,
-        "U": 1,
-        "V": 4,
-        "W": 4,
-        "X": 8,
-        "Y": 4,
-        "Z": 10,
-    },
-    "de": {
-        "A": 1,
-        "B": 3,
-        "C": 4,
-        "D": 1,
-        "E": 1,
-        "F": 4,
-        "G": 2,
-        "H": 2,
-        "I": 1,
-        "J": 1,
-        "K": 2,
-        "L": 3,
-        "M": 3,
-        "N": 1,
-        "O": 2,
-        "P": 1,
-        "Q": 1,
-        "R": 1,
-        "S": 1,
-        "T": 1,
-        "U": 1,
-        "V": 1,
-        "W": 1,
-        "X": 1,
-        "Y": 1,
-        "Z": 3,
-    },
-    "nl": {
-        "A": 1,
-        "B": 4,
-        "C": 5,
-        "D": 2,
-        "E": 1,
-        "F": 4,
-        "G": 3,
-        "H": 4,
-        "I": 2,
-        "J": 4,
-        "K": 3,
-        "L": 3,
-        "M": 3,
-        "N": 1,
-        "O": 1,
-        "P": 4,
-        "Q": 10,
-        "R": 2,
-        "S": 2,
-        "T": 2,
-        "U": 2,
-        "V": 4,
-        "W": 5,
-        "X": 8,
-        "Y": 8,
-        "Z": 5,
-    },
-    "fr": {
-        "A": 1,     # NOTE derived from Scrabble, not sure they are correct
-        "B": 3,
-        "C": 3,
-        "D": 2,
-        "E": 1,
-        "F": 4,
-        "G": 2,
-        "H": 4,
-        "I": 1,
-        "J": 10,
-        "K": 8,
-        "L": 2,
-        "M": 2,
-        "N": 1,
-        "O": 1,
-        "P": 3,
-        "Q": 10,
-        "R": 1,
-        "S": 1,
-        "T": 1,
-        "U": 1,
-        "V": 5,
-        "W": 8,
-        "X": 8,
-        "Y": 8,
-        "Z": 8,
-    },
-    "pt": {
-        "A": 1,     # NOTE derived from Scrabble, not sure they are correct
-        "B": 4,
-        "C": 4,
-        "D": 2,
-        "E": 1,
-        "F": 4,
-        "G": 3,
-        "H": 4,
-        "I": 1,
-        "J": 5,
-        "K": 10,
-        "L": 1,
-        "M": 3,
-        "N": 1,
-        "O": 1,
-        "P": 4,
-        "Q": 6,
-        "R": 1,
-        "S": 1,
-        "T": 1,
-        "U": 2,
-        "V": 4,
-        "W": 10,
-        "X": 8,
-        "Y": 10,
-        "Z": 10,
-    },
-}
-"""
-Scores of the letters in each language,
-data from various unofficial Web sites on Ruzzle,
-and from https://en.wikipedia.org/wiki/Scrabble_letter_distributions .
-"""
-
-LETTER_FREQUENCY = {
-    "en": {
-        "A": 11.602,
-        "B": 4.702,
-        "C": 3.511,
-        "D": 2.670,
-        "E": 2.007,
-        "F": 3.779,
-        "G": 1.950,
-        "H": 7.232,
-        "I": 6.286,
-        "J": 0.597,
-        "K": 0.590,
-        "L": 2.705,
-        "M": 4.383,
-        "N": 2.365,
-        "O": 6.264,
-        "P": 2.545,
-        "Q": 0.173,
-        "R": 1.653,
-        "S": 7.755,
-        "T": 16.671,
-        "U": 1.487,
-        "V": 0.649,
-        "W": 6.753,
-        "X": 0.017,
-        "Y": 1.620,
-        "Z": 0.034,
-    },
-    "it": {
-        "A": 12.380, # 11.745 + 0.635
-        "B": 0.927,
-        "C": 4.501,
-        "D": 3.736,
-        "E": 12.055, # 11.792 + 0.263
-        "F": 1.153,
-        "G": 1.644,
-        "H": 0.636,
-        "I": 10.173, # 10.143 + 0.030
-        "J": 0.011,
-        "K": 0.009,
-        "L": 6.510,
-        "M": 2.512,
-        "N": 6.883,
-        "O": 9.834, # 9.832 + 0.002
-        "P": 3.056,
-        "Q": 0.505,
-        "R": 6.367,
-        "S": 4.981,
-        "T": 5.623,
-        "U": 3.177, # 3.011 + 0.166
-        "V": 2.097,
-        "W": 0.033,
-        "X": 0.003,
-        "Y": 0.020,
-        "Z": 1.181,
-    },
-    "es": {
-        "A": 12.027, # 11.525 + 0.502
-        "B": 2.215,
-        "C": 4.019,
-        "D": 5.010,
-        "E": 12.614, # 12.181 + 0.433
-        "F": 0.692,
-        "G": 1.768,
-        "H": 0.703,
-        "I": 6.972, # 6.247 + 0.725
-        "J": 0.493,
-        "K": 0.011,
-        "L": 4.967,
-        "M": 3.157,
-        "N": 7.023, # 6.712 + 0.311
-        "O": 9.510, # 8.683 + 0.827
-        "P": 2.510,
-        "Q": 0.877,
-        "R": 6.871,
-        "S": 7.977,
-        "T": 4.632,
-        "U": 3.107, # 2.927 + 0.168 + 0.012
-        "V": 1.138,
-        "W": 0.017,
-        "X": 0.215,
-        "Y": 1.008,
-        "Z": 0.467,
-    },
-    "de": {
-        "A": 7.094, # 6.516 + 0.578
-        "B": 1.886,
-        "C": 2.732,
-        "D": 5.076,
-        "E": 16.396,
-        "F": 1.656,
-        "G": 3.009,
-        "H": 4.577,
-        "I": 6.550,
-        "J": 0.268,
-        "K": 1.417,
-        "L": 3.437,
-        "M": 2.534,
-        "N": 9.776,
-        "O": 3.037, # 2.594 + 0.443
-        "P": 0.670,
-        "Q": 0.018,
-        "R": 7.003,
-        "S": 7.577, # 7.270 + 0.307
-        "T": 6.154,
-        "U": 5.161, # 4.166 + 0.995
-        "V": 0.846,
-        "W": 1.921,
-        "X": 0.034,
-        "Y": 0.039,
-        "Z": 1.134,
-    },
-    "nl": {
-        "A": 7.486,
-        "B": 1.584,
-        "C": 1.242,
-        "D": 5.933,
-        "E": 18.910,
-        "F": 0.805,
-        "G": 3.403,
-        "H": 2.380,
-        "I": 6.499,
-        "J": 1.460,
-        "K": 2.248,
-        "L": 3.568,
-        "M": 2.213,
-        "N": 10.032,
-        "O": 6.063,
-        "P": 1.570,
-        "Q": 0.009,
-        "R": 6.411,
-        "S": 3.730,
-        "T": 6.790,
-        "U": 1.990,
-        "V": 2.850,
-        "W": 1.520,
-        "X": 0.036,
-        "Y": 0.035,
-        "Z": 1.390,
-    },
-    "fr": {
-        "A": 8.173, # 7.636 + 0.486 + 0.051
-        "B": 0.901,
-        "C": 3.345, # 3.260 + 0.085
-        "D": 3.669,
-        "E": 16.716, # 14.715 + 0.271 + 1.504 + 0.218 + 0.008
-        "F": 1.066,
-        "G": 0.866,
-        "H": 0.737,
-        "I": 7.579, # 7.529 + 0.045 + 0.005
-        "J": 0.613,
-        "K": 0.049,
-        "L": 5.456,
-        "M": 2.968,
-        "N": 7.095,
-        "O": 5.837, # 5.796 + 0.018 + 0.023
-        "P": 2.521,
-        "Q": 1.362,
-        "R": 6.693,
-        "S": 7.948,
-        "T": 7.244,
-        "U": 6.369, # 6.311 + 0.058
-        "V": 1.838,
-        "W": 0.074,
-        "X": 0.427,
-        "Y": 0.128,
-        "Z": 0.326,
-    },
-    "pt": {
-        "A": 16.119, # 14.634 + 0.072 + 0.562 + 0.118 + 0.733
-        "B": 1.043,
-        "C": 4.412, # 3.882 + 0.530
-        "D": 4.992,
-        "E": 13.357, # 12.570 + 0.337 + 0.450
-        "F": 1.023,
-        "G": 1.303,
-        "H": 0.781,
-        "I": 6.318, # 6.186 + 0.132
-        "J": 0.397,
-        "K": 0.015,
-        "L": 2.779,
-        "M": 4.738,
-        "N": 4.446,
-        "O": 10.666, # 9.735 + 0.635 + 0.296
-        "P": 2.523,
-        "Q": 1.204,
-        "R": 6.530,
-        "S": 6.805,
-        "T": 4.336,
-        "U": 3.872, # 3.639 + 0.207 + 0.026
-        "V": 1.575,
-        "W": 0.037,
-        "X": 0.253,
-        "Y": 0.006,
-        "Z": 0.470,
-    },
-}
-"""
-Frequency of the letters in each language, used for generating random boards,
-data from https://en.wikipedia.org/wiki/Letter_frequency .
-
-Note that the sum of the frequency for a language might not be exactly 100.0,
-however the cdf will be normalized, dividing each frequency by the actual sum.
-"""
-
-
-
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data.
+
+The tables of each language live in their own module
+(e.g. ``elzzur.languages.en``), imported only when
+the tables of that language are first accessed,
+hence using one language does not load the data of the others.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import importlib
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LANGUAGES = [
+    "de",
+    "en",
+    "es",
+    "fr",
+    "it",
+    "nl",
+    "pt"
+]
+""" Supported languages """
+
+class LanguageTable(Mapping):
+    """
+    A read-only dict mapping each supported language
+    to one of its tables, loading the module of a language
+    the first time its table is accessed.
+
+    :param str name: the name of the table in the language modules (e.g. ``LETTER_SCORE``)
+    """
+    def __init__(self, name):
+        self.name = name
+        self.tables = {}
+
+    def __getitem__(self, language):
+        try:
+            return self.tables[language]
+        except KeyError:
+            if language not in LANGUAGES:
+                raise
+        table = getattr(importlib.import_module("elzzur.languages.%s" % language), self.name)
+        self.tables[language] = table
+        return table
+
+    def __contains__(self, language):
+        return language in LANGUAGES
+
+    def __iter__(self):
+        return iter(LANGUAGES)
+
+    def __len__(self):
+        return len(LANGUAGES)
+
+LETTER_SCORE = LanguageTable("LETTER_SCORE")
+"""
+Scores of the letters in each language,
+data from various unofficial Web sites on Ruzzle,
+and from https://en.wikipedia.org/wiki/Scrabble_letter_distributions .
+"""
+
+LETTER_FREQUENCY = LanguageTable("LETTER_FREQUENCY")
+"""
+Frequency of the letters in each language, used for generating random boards,
+data from https://en.wikipedia.org/wiki/Letter_frequency .
+
+Note that the sum of the frequency for a language might not be exactly 100.0,
+however the cdf will be normalized, dividing each frequency by the actual sum.
+"""
+
+
+
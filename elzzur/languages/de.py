@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for German (``de``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,
+    "B": 3,
+    "C": 4,
+    "D": 1,
+    "E": 1,
+    "F": 4,
+    "G": 2,
+    "H": 2,
+    "I": 1,
+    "J": 1,
+    "K": 2,
+    "L": 3,
+    "M": 3,
+    "N": 1,
+    "O": 2,
+    "P": 1,
+    "Q": 1,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 1,
+    "V": 1,
+    "W": 1,
+    "X": 1,
+    "Y": 1,
+    "Z": 3,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 7.094, # 6.516 + 0.578
+    "B": 1.886,
+    "C": 2.732,
+    "D": 5.076,
+    "E": 16.396,
+    "F": 1.656,
+    "G": 3.009,
+    "H": 4.577,
+    "I": 6.550,
+    "J": 0.268,
+    "K": 1.417,
+    "L": 3.437,
+    "M": 2.534,
+    "N": 9.776,
+    "O": 3.037, # 2.594 + 0.443
+    "P": 0.670,
+    "Q": 0.018,
+    "R": 7.003,
+    "S": 7.577, # 7.270 + 0.307
+    "T": 6.154,
+    "U": 5.161, # 4.166 + 0.995
+    "V": 0.846,
+    "W": 1.921,
+    "X": 0.034,
+    "Y": 0.039,
+    "Z": 1.134,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for English (``en``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,
+    "B": 4,
+    "C": 4,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 3,
+    "H": 4,
+    "I": 1,
+    "J": 10,
+    "K": 5,
+    "L": 1,
+    "M": 3,
+    "N": 1,
+    "O": 1,
+    "P": 4,
+    "Q": 10,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 2,
+    "V": 4,
+    "W": 4,
+    "X": 8,
+    "Y": 4,
+    "Z": 10,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 11.602,
+    "B": 4.702,
+    "C": 3.511,
+    "D": 2.670,
+    "E": 2.007,
+    "F": 3.779,
+    "G": 1.950,
+    "H": 7.232,
+    "I": 6.286,
+    "J": 0.597,
+    "K": 0.590,
+    "L": 2.705,
+    "M": 4.383,
+    "N": 2.365,
+    "O": 6.264,
+    "P": 2.545,
+    "Q": 0.173,
+    "R": 1.653,
+    "S": 7.755,
+    "T": 16.671,
+    "U": 1.487,
+    "V": 0.649,
+    "W": 6.753,
+    "X": 0.017,
+    "Y": 1.620,
+    "Z": 0.034,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
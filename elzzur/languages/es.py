@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for Spanish (``es``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,
+    "B": 3,
+    "C": 3,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 2,
+    "H": 4,
+    "I": 1,
+    "J": 8,
+    "K": 5,
+    "L": 1,
+    "M": 3,
+    "N": 1,
+    "O": 1,
+    "P": 3,
+    "Q": 10,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 1,
+    "V": 4,
+    "W": 4,
+    "X": 8,
+    "Y": 4,
+    "Z": 10,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 12.027, # 11.525 + 0.502
+    "B": 2.215,
+    "C": 4.019,
+    "D": 5.010,
+    "E": 12.614, # 12.181 + 0.433
+    "F": 0.692,
+    "G": 1.768,
+    "H": 0.703,
+    "I": 6.972, # 6.247 + 0.725
+    "J": 0.493,
+    "K": 0.011,
+    "L": 4.967,
+    "M": 3.157,
+    "N": 7.023, # 6.712 + 0.311
+    "O": 9.510, # 8.683 + 0.827
+    "P": 2.510,
+    "Q": 0.877,
+    "R": 6.871,
+    "S": 7.977,
+    "T": 4.632,
+    "U": 3.107, # 2.927 + 0.168 + 0.012
+    "V": 1.138,
+    "W": 0.017,
+    "X": 0.215,
+    "Y": 1.008,
+    "Z": 0.467,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for French (``fr``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,     # NOTE derived from Scrabble, not sure they are correct
+    "B": 3,
+    "C": 3,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 2,
+    "H": 4,
+    "I": 1,
+    "J": 10,
+    "K": 8,
+    "L": 2,
+    "M": 2,
+    "N": 1,
+    "O": 1,
+    "P": 3,
+    "Q": 10,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 1,
+    "V": 5,
+    "W": 8,
+    "X": 8,
+    "Y": 8,
+    "Z": 8,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 8.173, # 7.636 + 0.486 + 0.051
+    "B": 0.901,
+    "C": 3.345, # 3.260 + 0.085
+    "D": 3.669,
+    "E": 16.716, # 14.715 + 0.271 + 1.504 + 0.218 + 0.008
+    "F": 1.066,
+    "G": 0.866,
+    "H": 0.737,
+    "I": 7.579, # 7.529 + 0.045 + 0.005
+    "J": 0.613,
+    "K": 0.049,
+    "L": 5.456,
+    "M": 2.968,
+    "N": 7.095,
+    "O": 5.837, # 5.796 + 0.018 + 0.023
+    "P": 2.521,
+    "Q": 1.362,
+    "R": 6.693,
+    "S": 7.948,
+    "T": 7.244,
+    "U": 6.369, # 6.311 + 0.058
+    "V": 1.838,
+    "W": 0.074,
+    "X": 0.427,
+    "Y": 0.128,
+    "Z": 0.326,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
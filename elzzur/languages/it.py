@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for Italian (``it``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,
+    "B": 5,
+    "C": 2,
+    "D": 5,
+    "E": 1,
+    "F": 5,
+    "G": 8,
+    "H": 8,
+    "I": 1,
+    "J": 10,
+    "K": 5,
+    "L": 3,
+    "M": 3,
+    "N": 3,
+    "O": 1,
+    "P": 5,
+    "Q": 10,
+    "R": 2,
+    "S": 2,
+    "T": 2,
+    "U": 3,
+    "V": 5,
+    "W": 10,
+    "X": 10,
+    "Y": 4,
+    "Z": 8,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 12.380, # 11.745 + 0.635
+    "B": 0.927,
+    "C": 4.501,
+    "D": 3.736,
+    "E": 12.055, # 11.792 + 0.263
+    "F": 1.153,
+    "G": 1.644,
+    "H": 0.636,
+    "I": 10.173, # 10.143 + 0.030
+    "J": 0.011,
+    "K": 0.009,
+    "L": 6.510,
+    "M": 2.512,
+    "N": 6.883,
+    "O": 9.834, # 9.832 + 0.002
+    "P": 3.056,
+    "Q": 0.505,
+    "R": 6.367,
+    "S": 4.981,
+    "T": 5.623,
+    "U": 3.177, # 3.011 + 0.166
+    "V": 2.097,
+    "W": 0.033,
+    "X": 0.003,
+    "Y": 0.020,
+    "Z": 1.181,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
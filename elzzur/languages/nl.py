@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for Dutch (``nl``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,
+    "B": 4,
+    "C": 5,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 3,
+    "H": 4,
+    "I": 2,
+    "J": 4,
+    "K": 3,
+    "L": 3,
+    "M": 3,
+    "N": 1,
+    "O": 1,
+    "P": 4,
+    "Q": 10,
+    "R": 2,
+    "S": 2,
+    "T": 2,
+    "U": 2,
+    "V": 4,
+    "W": 5,
+    "X": 8,
+    "Y": 8,
+    "Z": 5,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 7.486,
+    "B": 1.584,
+    "C": 1.242,
+    "D": 5.933,
+    "E": 18.910,
+    "F": 0.805,
+    "G": 3.403,
+    "H": 2.380,
+    "I": 6.499,
+    "J": 1.460,
+    "K": 2.248,
+    "L": 3.568,
+    "M": 2.213,
+    "N": 10.032,
+    "O": 6.063,
+    "P": 1.570,
+    "Q": 0.009,
+    "R": 6.411,
+    "S": 3.730,
+    "T": 6.790,
+    "U": 1.990,
+    "V": 2.850,
+    "W": 1.520,
+    "X": 0.036,
+    "Y": 0.035,
+    "Z": 1.390,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
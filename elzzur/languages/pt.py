@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Language-dependent data for Portuguese (``pt``),
+loaded only when needed (see ``elzzur.languages``).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LETTER_SCORE = {
+    "A": 1,     # NOTE derived from Scrabble, not sure they are correct
+    "B": 4,
+    "C": 4,
+    "D": 2,
+    "E": 1,
+    "F": 4,
+    "G": 3,
+    "H": 4,
+    "I": 1,
+    "J": 5,
+    "K": 10,
+    "L": 1,
+    "M": 3,
+    "N": 1,
+    "O": 1,
+    "P": 4,
+    "Q": 6,
+    "R": 1,
+    "S": 1,
+    "T": 1,
+    "U": 2,
+    "V": 4,
+    "W": 10,
+    "X": 8,
+    "Y": 10,
+    "Z": 10,
+}
+""" Scores of the letters """
+
+LETTER_FREQUENCY = {
+    "A": 16.119, # 14.634 + 0.072 + 0.562 + 0.118 + 0.733
+    "B": 1.043,
+    "C": 4.412, # 3.882 + 0.530
+    "D": 4.992,
+    "E": 13.357, # 12.570 + 0.337 + 0.450
+    "F": 1.023,
+    "G": 1.303,
+    "H": 0.781,
+    "I": 6.318, # 6.186 + 0.132
+    "J": 0.397,
+    "K": 0.015,
+    "L": 2.779,
+    "M": 4.738,
+    "N": 4.446,
+    "O": 10.666, # 9.735 + 0.635 + 0.296
+    "P": 2.523,
+    "Q": 1.204,
+    "R": 6.530,
+    "S": 6.805,
+    "T": 4.336,
+    "U": 3.872, # 3.639 + 0.207 + 0.026
+    "V": 1.575,
+    "W": 0.037,
+    "X": 0.253,
+    "Y": 0.006,
+    "Z": 0.470,
+}
+""" Frequency of the letters, used for generating random boards """
+
+
+
@@ -9,11 +9,22 @@ This implementation requires the ``marisa-trie`` Python package (``pip install m
 
 from __future__ import absolute_import
 from __future__ import print_function
+import bz2
+import gzip
+import hashlib
 import io
-import marisa_trie
 import os
+import threading
+import time
 import unicodedata
 
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+from elzzur.pool import ordered_map
+
 __author__ = "Alberto Pettarin"
 __copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
 __license__ = "MIT"
@@ -21,6 +32,195 @@ __version__ = "0.0.1"
 __email__ = "alberto@albertopettarin.it"
 __status__ = "Production"
 
+_REGISTRY = {}
+""" Loaded dictionaries, see ``get_dictionary()`` """
+
+_REGISTRY_LOCK = threading.Lock()
+""" Lock protecting ``_REGISTRY`` """
+
+CHUNK_SIZE = 65536
+""" Number of lines normalized at once by ``iter_word_list()`` """
+
+def new_trie(keys=None):
+    """
+    Create a MARISA trie containing the given keys.
+
+    The ``marisa_trie`` module is imported here, on first use,
+    so that the commands not reading any dictionary do not pay for it.
+
+    :param iterable keys: the keys (if ``None``, an empty trie to be read from file)
+    :rtype: marisa_trie.Trie
+    """
+    import marisa_trie
+    if keys is None:
+        return marisa_trie.Trie()
+    return marisa_trie.Trie(keys)
+
+def bundled_dictionary_path(language):
+    """
+    Return the path of the built-in MARISA dictionary for the given language.
+
+    :param str language: the language code (e.g. ``en``)
+    :rtype: str
+    """
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "res", language + ".marisa"))
+
+def get_dictionary(file_path=None, language=None, normalize=True, ignore_case=True, mmap=True):
+    """
+    Return the dictionary for the given language and file path,
+    loading it only if it has not been loaded before by this process,
+    or if the file has been modified since.
+
+    If ``file_path`` is ``None``, the built-in dictionary
+    for the given language is used.
+    By default, MARISA files are memory-mapped,
+    so that all the processes using the same file
+    share the same page cache pages.
+
+    :param str file_path: path to the dictionary file
+    :param str language: the language code (e.g. ``en``)
+    :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the dictionary entries
+    :param bool ignore_case: if ``True``, ignore case, that is, make all dictionary entries uppercase
+    :param bool mmap: if ``True``, memory-map MARISA files instead of reading them
+    :rtype: MTDictionary
+    """
+    if file_path is None:
+        if language is None:
+            raise ValueError("You must specify either the language or the path of the dictionary file.")
+        file_path = bundled_dictionary_path(language)
+    if not os.path.isfile(file_path):
+        raise IOError("The dictionary file does not exist. (Got: '%s')" % file_path)
+    file_path = os.path.realpath(file_path)
+    key = (language, file_path, normalize, ignore_case, mmap)
+    stat = os.stat(file_path)
+    stamp = (stat.st_size, stat.st_mtime)
+    with _REGISTRY_LOCK:
+        entry = _REGISTRY.get(key)
+        if (entry is None) or (entry[0] != stamp):
+            entry = (stamp, MTDictionary(file_path, normalize=normalize, ignore_case=ignore_case, mmap=mmap))
+            _REGISTRY[key] = entry
+    return entry[1]
+
+def clear_registry():
+    """
+    Forget all the dictionaries loaded by ``get_dictionary()``.
+    """
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
+
+def open_word_list(file_path):
+    """
+    Open the given UTF-8 encoded word list for reading, as text,
+    decompressing it on the fly if its name ends
+    with ``.gz``, ``.bz2``, or ``.xz``.
+
+    :param str file_path: the path of the word list
+    :rtype: file
+    """
+    if file_path.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(file_path, "rb"), encoding="utf-8")
+    if file_path.endswith(".bz2"):
+        return io.TextIOWrapper(bz2.BZ2File(file_path, "rb"), encoding="utf-8")
+    if file_path.endswith(".xz"):
+        if lzma is None:
+            raise IOError("Reading .xz files requires the lzma module. (Got: '%s')" % file_path)
+        return io.TextIOWrapper(lzma.open(file_path, "rb"), encoding="utf-8")
+    return io.open(file_path, "r", encoding="utf-8")
+
+def normalize_words(lines, normalize=False, ignore_case=False):
+    """
+    Return the distinct, non-empty words contained in the given lines,
+    stripped and optionally normalized.
+
+    :param list lines: the lines, one word per line
+    :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the words
+    :param bool ignore_case: if ``True``, make all the words uppercase
+    :rtype: list of str
+    """
+    text = u"".join(lines)
+    if normalize:
+        text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    if ignore_case:
+        text = text.upper()
+    words = set([line.strip() for line in text.split(u"\n")])
+    words.discard(u"")
+    return list(words)
+
+def _normalize_chunk(args):
+    """
+    Call ``normalize_words()`` in a worker process of ``iter_word_list()``.
+
+    :param tuple args: the ``(lines, normalize, ignore_case)`` arguments
+    :rtype: (int, list of str) tuple, i.e. ``(number of lines, words)``
+    """
+    return (len(args[0]), normalize_words(*args))
+
+def _iter_chunks(f, chunk_size):
+    """
+    Yield the lines of the given file, in lists of ``chunk_size`` lines.
+
+    :param file f: the file
+    :param int chunk_size: the number of lines per chunk
+    :rtype: generator of list of str
+    """
+    chunk = []
+    for line in f:
+        if not line.endswith(u"\n"):
+            line += u"\n"
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+def _normalized_chunks(chunks, normalize, ignore_case, workers):
+    """
+    Normalize the given chunks, in order, yielding ``(number of lines, words)`` tuples.
+
+    If ``workers`` is greater than one, the chunks are normalized
+    by a pool of worker processes (see ``ordered_map()``),
+    so that the input is not read faster than it is consumed.
+
+    :param iterable chunks: the chunks of lines
+    :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the words
+    :param bool ignore_case: if ``True``, make all the words uppercase
+    :param int workers: the number of worker processes
+    :rtype: generator of (int, list) tuples
+    """
+    return ordered_map(_normalize_chunk, ((chunk, normalize, ignore_case) for chunk in chunks), workers)
+
+def iter_word_list(file_path, normalize=False, ignore_case=False, workers=1, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Yield the words of the given word list (see ``open_word_list()``),
+    one word per line, reading and normalizing it in chunks of lines,
+    so that the memory used does not depend on the size of the file.
+
+    Empty lines are dropped, and duplicated words
+    are dropped within each chunk.
+
+    If ``progress`` is not ``None``, it is called after each chunk
+    as ``progress(lines, elapsed)``, with the number of lines read so far
+    and the elapsed time in seconds.
+
+    :param str file_path: the path of the word list
+    :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the words
+    :param bool ignore_case: if ``True``, make all the words uppercase
+    :param int workers: the number of worker processes normalizing the chunks
+    :param int chunk_size: the number of lines per chunk
+    :param function progress: the progress callback
+    :rtype: generator of str
+    """
+    start = time.time()
+    lines = 0
+    with open_word_list(file_path) as f:
+        for (count, words) in _normalized_chunks(_iter_chunks(f, chunk_size), normalize, ignore_case, workers):
+            for word in words:
+                yield word
+            lines += count
+            if progress is not None:
+                progress(lines, time.time() - start)
+
 class MTDictionary(object):
     """
     A dictionary based on a MARISA trie.
@@ -33,24 +233,81 @@ class MTDictionary(object):
 
     This class allows reading a dictionary from
     a. a MARISA file, or
-    b. a plain text, UTF-8 encoded file.
+    b. a plain text, UTF-8 encoded file, optionally compressed (``.gz``, ``.bz2``, ``.xz``).
     In the latter case, you can save the resulting MARISA trie to file to use it later.
 
     :param str dictionary_file_path: path to the dictionary file to read. If it ends with ``.marisa``, it is read as a MARISA trie.
     :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the dictionary entries
     :param bool ignore_case: if ``True``, ignore case, that is, make all dictionary entries uppercase
+    :param bool mmap: if ``True``, memory-map the MARISA file instead of reading it into memory
+    :param int workers: the number of worker processes normalizing a plain text file
+    :param function progress: the progress callback for reading a plain text file (see ``iter_word_list()``)
     """
-    def __init__(self, dictionary_file_path, normalize=False, ignore_case=False):
+
+    ROOT = 0
+    """ Id of the root node, corresponding to the empty prefix """
+
+    def __init__(self, dictionary_file_path, normalize=False, ignore_case=False, mmap=False, workers=1, progress=None):
         if not os.path.isfile(dictionary_file_path):
             raise IOError("The dictionary file does not exist. (Got: '%s')" % dictionary_file_path)
+        self.file_path = dictionary_file_path
+        self.mmap = mmap
         if dictionary_file_path.endswith(".marisa"):
-            self.read_marisa_file(dictionary_file_path)
+            self.read_marisa_file(dictionary_file_path, mmap=mmap)
         else:
-            self.read_plain_file(dictionary_file_path, normalize=normalize, ignore_case=ignore_case)
+            self.read_plain_file(dictionary_file_path, normalize=normalize, ignore_case=ignore_case, workers=workers, progress=progress)
+        self.reset_nodes()
 
     def __len__(self):
         return len(self.trie)
 
+    @classmethod
+    def from_keys(cls, keys):
+        """
+        Create a dictionary containing the given keys,
+        not backed by any file.
+
+        :param iterable keys: the keys (words)
+        :rtype: MTDictionary
+        """
+        dictionary = cls.__new__(cls)
+        dictionary.file_path = None
+        dictionary.mmap = False
+        dictionary.trie = new_trie(keys)
+        dictionary.reset_nodes()
+        return dictionary
+
+    def __getstate__(self):
+        # a dictionary read from a MARISA file is pickled as its path,
+        # so that it is not serialized when sent to a worker process
+        if (self.file_path is not None) and (self.file_path.endswith(".marisa")):
+            return {"file_path": self.file_path, "mmap": self.mmap, "trie": None}
+        return {"file_path": self.file_path, "mmap": False, "trie": self.trie.tobytes()}
+
+    def __setstate__(self, state):
+        self.file_path = state["file_path"]
+        self.mmap = state["mmap"]
+        if state["trie"] is None:
+            self.read_marisa_file(self.file_path, mmap=self.mmap)
+        else:
+            self.trie = new_trie()
+            self.trie.frombytes(state["trie"])
+        self.reset_nodes()
+
+    @property
+    def fingerprint(self):
+        """
+        Return the SHA-1 of the serialized trie,
+        which changes whenever the set of keys changes.
+
+        The fingerprint is computed only once.
+
+        :rtype: str
+        """
+        if getattr(self, "_fingerprint", None) is None:
+            self._fingerprint = hashlib.sha1(self.trie.tobytes()).hexdigest()
+        return self._fingerprint
+
     @property
     def keys(self):
         """
@@ -87,36 +344,98 @@ class MTDictionary(object):
         """
         return self.trie.keys(prefix)
 
-    def read_marisa_file(self, file_path):
+    def reset_nodes(self):
+        """
+        Forget all the prefix nodes discovered so far,
+        keeping only the root node.
+
+        Prefix nodes are a lazily built, memoized view of the trie:
+        node ``n`` corresponds to the prefix ``self.node_prefix(n)``,
+        and its outgoing transitions are stored in a dict
+        mapping a letter to the id of the child node
+        (or to ``None`` if no key starts with the extended prefix).
+        """
+        self._node_prefixes = [u""]
+        self._node_children = [{}]
+        self._node_is_key = [False]
+
+    def child(self, node, letter):
+        """
+        Return the id of the node obtained by appending the given letter
+        to the prefix of the given node,
+        or ``None`` if no key in the dictionary starts with such a prefix.
+
+        The MARISA trie is queried only the first time
+        a given ``(node, letter)`` transition is requested,
+        hence walking down an already explored path costs O(1) per letter.
+
+        :param int node: the id of the current node (use ``MTDictionary.ROOT`` to start)
+        :param str letter: the letter to be appended
+        :rtype: int
+        """
+        children = self._node_children[node]
+        try:
+            return children[letter]
+        except KeyError:
+            pass
+        prefix = self._node_prefixes[node] + letter
+        child = None
+        if self.trie.has_keys_with_prefix(prefix):
+            child = len(self._node_prefixes)
+            self._node_prefixes.append(prefix)
+            self._node_children.append({})
+            self._node_is_key.append(prefix in self.trie)
+        children[letter] = child
+        return child
+
+    def is_key(self, node):
+        """
+        Return ``True`` if the prefix of the given node is a key of the dictionary.
+
+        :param int node: the id of the node
+        :rtype: bool
+        """
+        return self._node_is_key[node]
+
+    def node_prefix(self, node):
+        """
+        Return the prefix corresponding to the given node.
+
+        :param int node: the id of the node
+        :rtype: str
+        """
+        return self._node_prefixes[node]
+
+    def read_marisa_file(self, file_path, mmap=False):
         """
         Read a MARISA trie from file and return it.
 
         :param str file_path: the path of the input file to be read
+        :param bool mmap: if ``True``, memory-map the file instead of reading it into memory
         """
-        self.trie = marisa_trie.Trie()
-        with io.open(file_path, "rb") as f:
-            self.trie.read(f)
+        self.trie = new_trie()
+        if mmap:
+            self.trie.mmap(file_path)
+        else:
+            with io.open(file_path, "rb") as f:
+                self.trie.read(f)
 
-    def read_plain_file(self, file_path, normalize=False, ignore_case=False):
+    def read_plain_file(self, file_path, normalize=False, ignore_case=False, workers=1, progress=None):
         """
         Read a plain text, UTF-8 encoded file,
         containing one word per line,
         and return a MARISA trie from it.
+
+        The file is streamed into the trie builder (see ``iter_word_list()``),
+        hence it is never held in memory as a whole.
         
         :param str file_path: the path of the input file to be read
         :param bool normalize: if ``True``, apply Unicode NFKD + decode to ascii to the dictionary entries
         :param bool ignore_case: if ``True``, ignore case, that is, make all dictionary entries uppercase
+        :param int workers: the number of worker processes normalizing the file
+        :param function progress: the progress callback (see ``iter_word_list()``)
         """
-        with io.open(file_path, "r", encoding="utf-8") as f:
-            dictionary = f.read()
-        if normalize:
-            dictionary = unicodedata.normalize("NFKD", dictionary).encode("ascii", "ignore")
-        if ignore_case:
-            dictionary = dictionary.upper()
-        words = []
-        for line in dictionary.split(u"\n"):
-            words.append(line.strip())
-        self.trie = marisa_trie.Trie(words)
+        self.trie = new_trie(iter_word_list(file_path, normalize=normalize, ignore_case=ignore_case, workers=workers, progress=progress))
 
     def save_marisa_trie(self, file_path):
         """
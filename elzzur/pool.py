@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Run tasks in a pool of worker processes.
+
+The ``forkserver`` start method is used, if available,
+so that the workers do not inherit the state of the current process
+(e.g., a loaded dictionary or the memoized nodes of its trie),
+and the results are yielded in task order,
+keeping only a bounded number of tasks pending,
+so that the tasks can be read lazily from a large input.
+
+``multiprocessing`` is imported only when a pool is created.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import collections
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+PENDING_PER_WORKER = 2
+""" Number of tasks per worker process submitted to the pool but not yet consumed """
+
+def pool_context():
+    """
+    Return the ``multiprocessing`` context used to create the worker pools,
+    with the ``forkserver`` start method, if available,
+    or the default one otherwise.
+
+    :rtype: multiprocessing.context.BaseContext
+    """
+    import multiprocessing
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+
+def ordered_map(function, tasks, workers, initializer=None, initargs=()):
+    """
+    Run the given function on each task, yielding the results in task order.
+
+    If ``workers`` is greater than one, the tasks are run
+    by a pool of worker processes (see ``pool_context()``),
+    each initialized once with ``initializer(*initargs)``;
+    the tasks are consumed lazily, and at most ``PENDING_PER_WORKER`` tasks
+    per worker are pending at any time.
+    The pool is terminated once the generator is exhausted or closed.
+
+    Otherwise, the initializer and the tasks are run in the current process.
+
+    :param function function: the function to run, taking one task
+    :param iterable tasks: the tasks
+    :param int workers: the number of worker processes
+    :param function initializer: the initializer of the worker processes
+    :param tuple initargs: the arguments of ``initializer``
+    :rtype: generator
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            yield function(task)
+        return
+    pool = pool_context().Pool(processes=workers, initializer=initializer, initargs=initargs)
+    try:
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(pool.apply_async(function, (task,)))
+            if len(pending) >= PENDING_PER_WORKER * workers:
+                yield pending.popleft().get()
+        while len(pending) > 0:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+A compact, column-oriented container of solve results.
+
+Instead of one ``(word, score, Snake)`` tuple per word,
+the results are stored in four flat arrays:
+
+a. the key id of each word in the MARISA trie of the dictionary;
+b. the score of each word (64 bit integers,
+   or a list of Python integers if a score does not fit, see ``MAX_SCORE``);
+c. the offsets of the snake of each word in the paths array; and
+d. the paths array, containing the indices (as in ``BoardGraph``)
+   of the cells of all the snakes, one after the other,
+   as bytes (or 16 bit integers, for boards with more than 256 cells).
+
+Words and snakes are materialized only when accessed,
+slicing does not copy the arrays,
+and pickling copies only the bytes of the arrays (not the dictionary).
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import array
+
+from elzzur.snake import Snake
+from elzzur.topology import compile_graph
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+MAX_SCORE = 2 ** 63 - 1
+""" Scores above this value do not fit the 64 bit score column, which is then a list """
+
+def _column(typecode, data=b""):
+    """
+    Return a memoryview of a new array with the given typecode and bytes.
+
+    :param str typecode: the typecode of the array
+    :param bytes data: the bytes of the array
+    :rtype: memoryview
+    """
+    column = array.array(typecode)
+    column.frombytes(data)
+    return memoryview(column)
+
+def _score_column(scores):
+    """
+    Return the score column holding the given scores:
+    a memoryview of a 64 bit integer array,
+    or the list itself if a score is above ``MAX_SCORE``.
+
+    :param list scores: the scores
+    :rtype: memoryview or list
+    """
+    if (len(scores) > 0) and (max(scores) > MAX_SCORE):
+        return scores
+    return memoryview(array.array("q", scores))
+
+class SolveResult(object):
+    """
+    A compact, column-oriented list of ``(word, score, Snake)`` results.
+
+    The dictionary is needed only to materialize the words,
+    and it is not pickled: after unpickling, call ``bind()``.
+
+    :param MTDictionary dictionary: the dictionary whose trie key ids are stored
+    :param BoardGraph graph: the graph of the board whose cell indices are stored
+    :param memoryview key_ids: the trie key ids of the words
+    :param memoryview scores: the scores (a list, if a score is above ``MAX_SCORE``)
+    :param memoryview offsets: the offsets of the snakes in ``paths``, plus the final offset
+    :param memoryview paths: the cell indices of the snakes
+    """
+    def __init__(self, dictionary, graph, key_ids, scores, offsets, paths):
+        self.dictionary = dictionary
+        self.graph = graph
+        self.key_ids = key_ids
+        self.scores = scores
+        self.offsets = offsets
+        self.paths = paths
+
+    @classmethod
+    def from_entries(cls, entries, dictionary, graph):
+        """
+        Create a compact result from a list of ``(word, score, Snake)`` tuples.
+
+        :param list entries: the results
+        :param MTDictionary dictionary: the dictionary containing the words
+        :param BoardGraph graph: the graph of the board of the snakes
+        :rtype: SolveResult
+        """
+        key_ids = array.array("i")
+        scores = []
+        offsets = array.array("I", [0])
+        paths = array.array("B" if len(graph) <= 256 else "H")
+        key_id = dictionary.trie.key_id
+        index = graph.index
+        for (word, snake_score, snake) in entries:
+            key_ids.append(key_id(word))
+            scores.append(snake_score)
+            paths.extend([index(cell) for cell in snake.cells])
+            offsets.append(len(paths))
+        return cls(dictionary, graph, memoryview(key_ids), _score_column(scores), memoryview(offsets), memoryview(paths))
+
+    def bind(self, dictionary):
+        """
+        Set the dictionary used to materialize the words,
+        e.g. after unpickling.
+
+        :param MTDictionary dictionary: the dictionary whose trie key ids are stored
+        :rtype: SolveResult
+        """
+        self.dictionary = dictionary
+        return self
+
+    def __len__(self):
+        return len(self.key_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("Slices of a SolveResult must be contiguous.")
+            stop = max(start, stop)
+            # the offsets are absolute, hence the paths are shared as they are
+            return SolveResult(self.dictionary, self.graph, self.key_ids[start:stop], self.scores[start:stop], self.offsets[start:stop + 1], self.paths)
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError("SolveResult index out of range.")
+        return (self.word(index), self.scores[index], self.snake(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getstate__(self):
+        # copy only the bytes of this slice, rebasing its offsets
+        first = self.offsets[0] if len(self.offsets) > 0 else 0
+        last = self.offsets[-1] if len(self.offsets) > 0 else 0
+        return {
+            "shape": (self.graph.rows, self.graph.cols, self.graph.topology),
+            "key_ids": self.key_ids.tobytes(),
+            "scores": self.scores.tobytes() if isinstance(self.scores, memoryview) else list(self.scores),
+            "offsets": array.array("I", [offset - first for offset in self.offsets] or [0]).tobytes(),
+            "paths": (self.paths.format, self.paths[first:last].tobytes()),
+        }
+
+    def __setstate__(self, state):
+        rows, cols, topology = state["shape"]
+        self.dictionary = None
+        self.graph = compile_graph(rows, cols, topology)
+        self.key_ids = _column("i", state["key_ids"])
+        self.scores = _column("q", state["scores"]) if isinstance(state["scores"], bytes) else state["scores"]
+        self.offsets = _column("I", state["offsets"])
+        self.paths = _column(state["paths"][0], state["paths"][1])
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes of the arrays referenced by this result.
+
+        :rtype: int
+        """
+        scores = self.scores.nbytes if isinstance(self.scores, memoryview) else 8 * len(self.scores)
+        return self.key_ids.nbytes + scores + self.offsets.nbytes + self.paths.nbytes
+
+    def word(self, index):
+        """
+        Return the word of the result with the given index.
+
+        :param int index: the index of the result
+        :rtype: str
+        """
+        if self.dictionary is None:
+            raise ValueError("The SolveResult has no dictionary: call bind() first.")
+        return self.dictionary.trie.restore_key(self.key_ids[index])
+
+    def cells(self, index):
+        """
+        Return the list of ``(x, y)`` cells of the snake of the result with the given index.
+
+        :param int index: the index of the result
+        :rtype: list of tuple
+        """
+        cells = self.graph.cells
+        return [cells[i] for i in self.paths[self.offsets[index]:self.offsets[index + 1]]]
+
+    def snake(self, index):
+        """
+        Return the snake of the result with the given index.
+
+        :param int index: the index of the result
+        :rtype: Snake
+        """
+        return Snake(self.cells(index))
+
+    @property
+    def words(self):
+        """
+        The list of the words.
+
+        :rtype: list of str
+        """
+        return [self.word(index) for index in range(len(self))]
+
+    def to_entries(self):
+        """
+        Return the results as a list of ``(word, score, Snake)`` tuples.
+
+        :rtype: list of (str, int, Snake) tuples
+        """
+        return list(self)
+
+    def to_lists(self):
+        """
+        Return the results as a list of ``[word, score, cells]`` lists,
+        ready to be serialized as JSON.
+
+        :rtype: list
+        """
+        return [[self.word(index), self.scores[index], self.cells(index)] for index in range(len(self))]
+
+    def columns(self):
+        """
+        Return the arrays of this result, as memoryviews (without copying them),
+        e.g. to export them through the buffer protocol.
+        The scores are a list if a score is above ``MAX_SCORE``.
+
+        :rtype: dict
+        """
+        return {
+            "key_ids": self.key_ids,
+            "scores": self.scores,
+            "offsets": self.offsets,
+            "paths": self.paths,
+        }
+
+
+
@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+A long-running local solve service.
+
+The service keeps the dictionaries of the served languages loaded,
+and solves the boards it receives through a bounded pool of worker threads.
+The solves are CPU-bound and hold the GIL, hence the number of threads
+limits how many boards are solved concurrently, but not in parallel:
+it does not increase the number of boards solved per second.
+When the queue of pending requests is full, new requests are rejected
+(HTTP 503), and requests not solved within the timeout fail with HTTP 504.
+
+Endpoints:
+
+* ``POST /solve``: solve a board, passed either as JSON
+  (``{"language": "en", "board": "Ttl R S Ndl\\n..."}``,
+  where ``board`` can also be a list of rows, each a list of tokens),
+  or as plain text in the board file format, with the parameters
+  (``language``, ``topology``, ``sort``, ``reverse``, ``top``) in the query string;
+* ``GET /metrics``: counters, latency percentiles and throughput, as JSON;
+* ``GET /languages``: the served languages;
+* ``GET /health``: ``{"status": "ok"}``.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import collections
+import json
+import os
+import threading
+import time
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+    from Queue import Full, Queue
+    from urlparse import parse_qs, urlparse
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn, UnixStreamServer
+    from queue import Full, Queue
+    from urllib.parse import parse_qs, urlparse
+
+from elzzur.board import Board
+from elzzur.languages import LANGUAGES
+from elzzur.mtdictionary import get_dictionary
+from elzzur.solver import Solver
+from elzzur.topology import GRID
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+LATENCY_WINDOW = 1024
+""" Number of recent requests used to compute the latency percentiles """
+
+class ServiceBusy(Exception):
+    """
+    Raised when the queue of pending requests is full.
+    """
+    pass
+
+class ServiceTimeout(Exception):
+    """
+    Raised when a request is not solved within the timeout.
+    """
+    pass
+
+class SolveJob(object):
+    """
+    A pending solve request.
+
+    :param Board board: the board to solve
+    :param dict options: the keyword arguments for ``Solver.solve()``
+    """
+    def __init__(self, board, options):
+        self.board = board
+        self.options = options
+        self.done = threading.Event()
+        self.cancelled = False
+        self.solver = None
+        self.result = None
+        self.error = None
+
+    def cancel(self):
+        """
+        Cancel the job: if it has not started yet, it will not be solved,
+        otherwise its search is stopped (see ``Solver.cancel()``),
+        so that the worker thread can serve the next request.
+        """
+        self.cancelled = True
+        solver = self.solver
+        if solver is not None:
+            solver.cancel()
+
+class SolveService(object):
+    """
+    Solve boards through a bounded pool of worker threads,
+    keeping the dictionaries of the given languages loaded.
+
+    :param list languages: the language codes to serve
+    :param int workers: the number of worker threads, i.e. of boards solved concurrently
+    :param int queue_size: the maximum number of pending requests
+    :param float timeout: the maximum time, in seconds, to wait for a request to be solved
+    :param SolveCache cache: the cache of the solve results
+    """
+    def __init__(self, languages=LANGUAGES, workers=1, queue_size=64, timeout=10.0, cache=None):
+        self.languages = list(languages)
+        self.timeout = timeout
+        self.cache = cache
+        self.dictionaries = {}
+        for language in self.languages:
+            self.dictionaries[language] = get_dictionary(language=language)
+        self.queue = Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counters = collections.Counter()
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.threads = []
+        for i in range(max(1, workers)):
+            thread = threading.Thread(target=self._work, name="elzzur-worker-%d" % i)
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def _work(self):
+        """
+        Consume the queue of pending requests.
+        """
+        while True:
+            job = self.queue.get()
+            try:
+                if not job.cancelled:
+                    job.solver = Solver(job.board, self.dictionaries[job.board.language])
+                    # the job might have been cancelled before the solver was stored
+                    if job.cancelled:
+                        job.solver.cancel()
+                    job.result = job.solver.solve(cache=self.cache, **job.options)
+            except Exception as exc:
+                job.error = exc
+            finally:
+                job.done.set()
+                self.queue.task_done()
+
+    def _count(self, name, latency=None):
+        """
+        Increment the given counter, and record the given latency, if any.
+
+        :param str name: the counter name
+        :param float latency: the latency, in seconds
+        """
+        with self.lock:
+            self.counters[name] += 1
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def parse_board(self, text, language, topology=GRID):
+        """
+        Parse the given board, raising ``ValueError`` on invalid input.
+
+        :param object text: the board rows, either as a string or as a list of lists of tokens
+        :param str language: the language code (e.g. ``en``)
+        :param str topology: the adjacency of the board cells
+        :rtype: Board
+        """
+        if language not in self.dictionaries:
+            raise ValueError("Language '%s' is not served. Served languages: %s" % (language, ", ".join(self.languages)))
+        if isinstance(text, list):
+            text = u"\n".join([u" ".join(row) for row in text])
+        return Board(language, topology=topology).read_board_string(text)
+
+    def solve(self, board, **options):
+        """
+        Solve the given board, waiting at most ``self.timeout`` seconds.
+
+        :param Board board: the board to solve
+        :param dict options: the keyword arguments for ``Solver.solve()``
+        :rtype: list of (str, int, Snake) tuples
+        """
+        start = time.time()
+        self._count("requests")
+        job = SolveJob(board, options)
+        try:
+            self.queue.put_nowait(job)
+        except Full:
+            self._count("rejected")
+            raise ServiceBusy("Too many pending requests.")
+        if not job.done.wait(self.timeout):
+            job.cancel()
+            self._count("timeouts")
+            raise ServiceTimeout("The board was not solved within %.3f seconds." % self.timeout)
+        if job.error is not None:
+            self._count("errors")
+            raise job.error
+        self._count("completed", latency=time.time() - start)
+        return job.result
+
+    def metrics(self):
+        """
+        Return the service metrics.
+
+        :rtype: dict
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            latencies = sorted(self.latencies)
+        uptime = time.time() - self.started
+
+        def percentile(p):
+            if len(latencies) == 0:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 6)
+
+        return {
+            "uptime": round(uptime, 3),
+            "requests": counters.get("requests", 0),
+            "completed": counters.get("completed", 0),
+            "errors": counters.get("errors", 0),
+            "rejected": counters.get("rejected", 0),
+            "timeouts": counters.get("timeouts", 0),
+            "cache_hits": self.cache.hits if self.cache is not None else 0,
+            "cache_misses": self.cache.misses if self.cache is not None else 0,
+            "pending": self.queue.qsize(),
+            "throughput": round(counters.get("completed", 0) / uptime, 3) if uptime > 0 else 0.0,
+            "latency": {
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "max": round(latencies[-1], 6) if len(latencies) > 0 else None,
+            },
+        }
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP front end of a ``SolveService``,
+    available as ``self.server.service``.
+    """
+
+    server_version = "elzzur/" + __version__
+
+    def address_string(self):
+        # Unix socket clients have no address
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            BaseHTTPRequestHandler.log_message(self, format, *args)
+
+    def send_json(self, status, obj):
+        """
+        Send the given object as JSON.
+
+        :param int status: the HTTP status code
+        :param object obj: the object to send
+        """
+        body = json.dumps(obj, sort_keys=True).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        service = self.server.service
+        if path == "/metrics":
+            self.send_json(200, service.metrics())
+        elif path == "/languages":
+            self.send_json(200, {"languages": service.languages})
+        elif path == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": "Not found."})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/solve":
+            self.send_json(404, {"error": "Not found."})
+            return
+        service = self.server.service
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        params = dict([(k, v[-1]) for (k, v) in parse_qs(url.query).items()])
+        try:
+            if (self.headers.get("Content-Type") or "").startswith("application/json"):
+                request = json.loads(body)
+                if not isinstance(request, dict):
+                    raise ValueError("The request must be a JSON object.")
+                params.update(request)
+            else:
+                params["board"] = body
+            board = service.parse_board(params.get("board") or u"", params.get("language"), topology=params.get("topology", GRID))
+            reverse = params.get("reverse", False)
+            if not isinstance(reverse, bool):
+                reverse = str(reverse).lower() in ["1", "true", "yes"]
+            top_k = params.get("top")
+            options = {
+                "sort": params.get("sort", Solver.SORT_BY_SCORE),
+                "reverse": reverse,
+                "top_k": int(top_k) if top_k is not None else None,
+            }
+            if (options["top_k"] is not None) and (options["top_k"] < 1):
+                raise ValueError("The number of best words (top) must be at least 1.")
+        except ValueError as exc:
+            self.send_json(400, {"error": str(exc)})
+            return
+        except (TypeError, AttributeError) as exc:
+            # a JSON value of the wrong type, e.g. a number as the board or a list as top
+            self.send_json(400, {"error": "Invalid request: %s" % exc})
+            return
+        start = time.time()
+        try:
+            words = service.solve(board, **options)
+        except ServiceBusy as exc:
+            self.send_json(503, {"error": str(exc)})
+            return
+        except ServiceTimeout as exc:
+            self.send_json(504, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self.send_json(500, {"error": str(exc)})
+            return
+        self.send_json(200, {
+            "words": [[word, snake_score, snake.cells] for (word, snake_score, snake) in words],
+            "count": len(words),
+            "total": sum([w[1] for w in words]),
+            "time": round(time.time() - start, 6),
+        })
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server handling each connection in a new thread.
+    """
+    daemon_threads = True
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """
+    HTTP server over a Unix socket, handling each connection in a new thread.
+    """
+    daemon_threads = True
+
+    def server_bind(self):
+        UnixStreamServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+def create_server(service, host="127.0.0.1", port=8080, socket_path=None, verbose=False):
+    """
+    Create an HTTP server for the given service,
+    listening on ``host:port``, or on the given Unix socket, if not ``None``.
+
+    :param SolveService service: the service
+    :param str host: the host to listen on
+    :param int port: the port to listen on
+    :param str socket_path: the path of the Unix socket to listen on
+    :param bool verbose: if ``True``, log each request to stderr
+    :rtype: socketserver.BaseServer
+    """
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, SolveRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), SolveRequestHandler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+
@@ -16,21 +16,74 @@ __version__ = "0.0.1"
 __email__ = "alberto@albertopettarin.it"
 __status__ = "Production"
 
+def cell_bit(cell):
+    """
+    Return the bit representing the given ``(x, y)`` cell
+    in the visited mask of a snake.
+
+    The bit position is given by the Szudzik pairing of ``x`` and ``y``,
+    hence it does not depend on the board size,
+    and all the cells of a ``NxN`` board map to the first ``N*N`` bits.
+
+    :param tuple cell: the ``(x, y)`` cell
+    :rtype: int
+    """
+    x, y = cell
+    if x >= y:
+        return 1 << (x * x + x + y)
+    return 1 << (y * y + x)
+
 class Snake(object):
     """
     A Snake represents a (possibly partial) list of adjacent board cells,
     represented by ``(x, y)`` pairs, 0-indexing.
-    
+
+    A snake is stored as its last cell plus a pointer to the snake
+    it extends, so that all the snakes sharing a prefix share
+    the same objects, and extending a snake costs O(1).
+    The cells visited by the snake are also stored as a bitmask
+    (see ``cell_bit()``), so that ``has_cell()`` costs O(1).
+    The full list of cells is built only when ``cells`` is accessed.
+
     :param list cells: list of (x, y) pairs representing the cells of the snake
     """
+
+    __slots__ = ["parent", "cell", "mask", "length"]
+
     def __init__(self, cells):
-        self.cells = cells
+        self.parent = None
+        self.cell = None
+        self.mask = 0
+        self.length = 0
+        if len(cells) > 0:
+            if len(cells) > 1:
+                self.parent = Snake(cells[:-1])
+                self.mask = self.parent.mask
+                self.length = self.parent.length
+            self.cell = cells[-1]
+            self.mask |= cell_bit(self.cell)
+            self.length += 1
 
     def __str__(self):
         return u" ".join(["(%d,%d)" % cell for cell in self.cells])
 
     def __len__(self):
-        return len(self.cells)
+        return self.length
+
+    @property
+    def cells(self):
+        """
+        The list of the ``(x, y)`` cells of the snake, from start to end.
+
+        :rtype: list of (int, int)
+        """
+        acc = []
+        current = self
+        while (current is not None) and (current.length > 0):
+            acc.append(current.cell)
+            current = current.parent
+        acc.reverse()
+        return acc
 
     @property
     def start(self):
@@ -39,7 +92,10 @@ class Snake(object):
 
         :rtype: (int, int)
         """
-        return self.cells[0]
+        current = self
+        while (current.parent is not None) and (current.parent.length > 0):
+            current = current.parent
+        return current.cell
 
     @property
     def end(self):
@@ -48,8 +104,8 @@ class Snake(object):
 
         :rtype: (int, int)
         """
-        return self.cells[-1]
-    
+        return self.cell
+
     def has_cell(self, cell):
         """
         Return ``True`` if the given ``(x, y)`` cell is already in the snake.
@@ -57,16 +113,24 @@ class Snake(object):
         :param tuple cell: the ``(x, y)`` cell to be checked for
         :rtype: bool
         """
-        return cell in self.cells
-    
+        return (self.mask & cell_bit(cell)) != 0
+
     def extend(self, cell):
         """
         Return a new Snake which is the current Snake extended with the given cell.
 
+        The current Snake is not modified, and it is shared
+        by the returned Snake as its parent.
+
         :param tuple cell: the ``(x, y)`` cell to be added
         :rtype: Snake
         """
-        return Snake(self.cells + [cell])
+        child = Snake.__new__(Snake)
+        child.parent = self
+        child.cell = cell
+        child.mask = self.mask | cell_bit(cell)
+        child.length = self.length + 1
+        return child
 
 
 
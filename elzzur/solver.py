@@ -4,8 +4,9 @@
 """
 Solve a Ruzzle board.
 
-The idea is to do a BFS exploration of the board,
-avoiding extending the current snake (i.e., adjacent sequence of letters),
+The idea is to do a DFS exploration of the board,
+using an explicit stack, whose size grows only with the length of the longest snake,
+and avoiding extending the current snake (i.e., adjacent sequence of letters),
 if either
 a. the snake self-intersects or,
 b. the word corresponding to the current snake is not a prefix of any word in the dictionary.
@@ -13,14 +14,22 @@ b. the word corresponding to the current snake is not a prefix of any word in th
 To speed the lookup operations, the dictionary is stored in a MARISA trie,
 which is a very efficient trie (a.k.a. prefix tree),
 supporting the has_keys_with_prefix(prefix) operation.
+Each snake carries the dictionary node of its prefix,
+so that checking an extension costs a single memoized transition.
 """
 
 from __future__ import absolute_import
 from __future__ import print_function
+import heapq
+import threading
+import time
 
-from elzzur.board import Board
+from elzzur.board import Board, BoardCell, LENGTH_POINTS
 from elzzur.mtdictionary import MTDictionary
+from elzzur.pool import ordered_map
+from elzzur.results import SolveResult
 from elzzur.snake import Snake
+from elzzur.symmetry import canonical_form
 
 __author__ = "Alberto Pettarin"
 __copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
@@ -29,14 +38,285 @@ __version__ = "0.0.1"
 __email__ = "alberto@albertopettarin.it"
 __status__ = "Production"
 
+_WORKER_SOLVER = None
+""" The solver of the current worker process, see ``Solver.solve(workers=N)`` """
+
+def _init_worker(board, dictionary, stats=False, min_length=2, max_length=None):
+    """
+    Initialize a worker process of the parallel solver.
+
+    This function is called once per worker process,
+    hence the dictionary is loaded once per worker,
+    and not once per task.
+
+    :param Board board: the board to solve
+    :param MTDictionary dictionary: the dictionary containing the valid words
+    :param bool stats: if ``True``, collect the search counters
+    :param int min_length: the minimum length of the words
+    :param int max_length: the maximum length of the words, or ``None`` for no limit
+    """
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = Solver(board, dictionary, stats=stats, min_length=min_length, max_length=max_length)
+
+def _solve_start(start):
+    """
+    Solve the board of the current worker process,
+    considering only the snakes starting at the given cell index.
+
+    The search counters of the task are returned
+    if the worker solver collects them, otherwise ``None``.
+
+    :param int start: the index of the start cell
+    :rtype: (list of (str, int, list) tuples, SolverStats)
+    """
+    if _WORKER_SOLVER.stats is not None:
+        _WORKER_SOLVER.stats = SolverStats()
+    entries = [(word, snake_score, snake.cells) for (word, snake_score, snake) in _WORKER_SOLVER.find_ties(starts=[start])]
+    return (entries, _WORKER_SOLVER.stats)
+
+def score_rank(entry):
+    """
+    Return the ranking key of a ``(word, score, snake)`` entry,
+    larger for better words: higher score, then shorter word, then word.
+
+    This is the order of ``Solver.SORT_BY_SCORE``.
+
+    :param tuple entry: the ``(word, score, snake)`` entry
+    :rtype: tuple
+    """
+    return (entry[1], -len(entry[0]), entry[0])
+
+class SearchBudget(object):
+    """
+    The budget of an anytime search (see ``Solver.solve()``):
+    at most ``max_nodes`` snakes taken from the exploration stack,
+    and at most ``deadline`` seconds from the creation of the budget.
+
+    :param float deadline: the time budget, in seconds, or ``None`` for no limit
+    :param int max_nodes: the node budget, or ``None`` for no limit
+    """
+
+    CLOCK_INTERVAL = 64
+    """ Number of nodes expanded between two reads of the clock """
+
+    def __init__(self, deadline=None, max_nodes=None):
+        self.time_limit = time.time() + deadline if deadline is not None else None
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.exhausted = False
+
+    def spend(self, nodes):
+        """
+        Account for the given number of nodes taken from the stack,
+        and return ``True`` if the budget is exhausted,
+        i.e. if they exceed ``max_nodes``, or if the deadline has passed.
+
+        :param int nodes: the number of nodes taken from the stack since the last call
+        :rtype: bool
+        """
+        self.nodes += nodes
+        if (self.max_nodes is not None) and (self.nodes > self.max_nodes):
+            self.exhausted = True
+        elif (self.time_limit is not None) and (time.time() >= self.time_limit):
+            self.exhausted = True
+        return self.exhausted
+
+class SolverStats(object):
+    """
+    Counters collected by a ``Solver`` created with ``stats=True``:
+
+    * ``nodes_expanded``: snakes taken from the exploration stack;
+    * ``prefix_queries``, ``prefix_hits``: dictionary transitions
+      (i.e., "is this snake plus one letter a prefix of a word?") asked and found;
+    * ``word_queries``, ``word_hits``: full word checks asked and found;
+    * ``peak_frontier``: maximum size of the exploration stack;
+    * ``start_times``: wall time, in seconds, spent on the snakes starting at each cell
+      (including the time spent by the consumer of the yielded snakes);
+    * ``time``: wall time, in seconds, of ``Solver.solve()``;
+    * ``cached``: ``True`` if the result was read from the cache.
+    """
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.prefix_queries = 0
+        self.prefix_hits = 0
+        self.word_queries = 0
+        self.word_hits = 0
+        self.peak_frontier = 0
+        self.start_times = {}
+        self.time = 0.0
+        self.cached = False
+
+    def merge(self, other):
+        """
+        Add the counters of another ``SolverStats`` to these ones.
+
+        :param SolverStats other: the counters to add
+        """
+        self.nodes_expanded += other.nodes_expanded
+        self.prefix_queries += other.prefix_queries
+        self.prefix_hits += other.prefix_hits
+        self.word_queries += other.word_queries
+        self.word_hits += other.word_hits
+        self.peak_frontier = max(self.peak_frontier, other.peak_frontier)
+        for (cell, seconds) in other.start_times.items():
+            self.start_times[cell] = self.start_times.get(cell, 0.0) + seconds
+
+    def count_child(self, child):
+        """
+        Wrap the given ``MTDictionary.child`` function,
+        counting the prefix queries and hits.
+
+        :param function child: the function to wrap
+        :rtype: function
+        """
+        def counted_child(node, letter):
+            self.prefix_queries += 1
+            target = child(node, letter)
+            if target is not None:
+                self.prefix_hits += 1
+            return target
+        return counted_child
+
+    def count_is_key(self, is_key):
+        """
+        Wrap the given ``MTDictionary.is_key`` function,
+        counting the word queries and hits.
+
+        :param function is_key: the function to wrap
+        :rtype: function
+        """
+        def counted_is_key(node):
+            self.word_queries += 1
+            if is_key(node):
+                self.word_hits += 1
+                return True
+            return False
+        return counted_is_key
+
+    def as_dict(self):
+        """
+        Return the counters as a JSON-serializable dict.
+
+        :rtype: dict
+        """
+        start_times = sorted(self.start_times.items())
+        slowest = max(start_times, key=lambda x: x[1]) if len(start_times) > 0 else None
+        return {
+            "nodes_expanded": self.nodes_expanded,
+            "prefix_queries": self.prefix_queries,
+            "prefix_hits": self.prefix_hits,
+            "word_queries": self.word_queries,
+            "word_hits": self.word_hits,
+            "peak_frontier": self.peak_frontier,
+            "start_times": [[cell[0], cell[1], round(seconds, 6)] for (cell, seconds) in start_times],
+            "slowest_start": [slowest[0][0], slowest[0][1], round(slowest[1], 6)] if slowest is not None else None,
+            "time": round(self.time, 6),
+            "cached": self.cached,
+        }
+
+    def pretty_print(self):
+        """
+        Return the counters as a human-readable string.
+
+        :rtype: str
+        """
+        obj = self.as_dict()
+        acc = []
+        for key in ["nodes_expanded", "prefix_queries", "prefix_hits", "word_queries", "word_hits", "peak_frontier", "time", "cached"]:
+            acc.append(u"%-16s%s" % (key + u":", obj[key]))
+        if obj["slowest_start"] is not None:
+            acc.append(u"%-16s(%d, %d) %ss" % (u"slowest_start:", obj["slowest_start"][0], obj["slowest_start"][1], obj["slowest_start"][2]))
+        return u"\n".join(acc)
+
+class SnakeIndex(object):
+    """
+    The valid snake prefixes of a board, explored by ``Solver.update_cell()``,
+    each stored as an ``(indices, node, letters, multiplier, mask)`` tuple,
+    i.e. its cell indices, the id of its dictionary node,
+    the sum of its letter scores, the product of its word multipliers,
+    and the bitmask of its cells.
+
+    The prefixes are indexed by the cells they use (``through``),
+    by their last cell (``ending``), and, if they are words, by word (``words``);
+    ``best`` holds the score and the cell indices of the best snake of each word,
+    and ``found`` the corresponding ``(word, score, Snake)`` entry.
+
+    :param BoardGraph graph: the graph of the board
+    """
+    def __init__(self, graph):
+        self.paths = {}
+        self.scores = {}
+        self.next_id = 0
+        self.through = [set() for i in range(len(graph))]
+        self.ending = [set() for i in range(len(graph))]
+        self.words = {}
+        self.path_words = {}
+        self.best = {}
+        self.found = {}
+        self.predecessors = [[source for source in range(len(graph)) if graph.are_adjacent(source, target)] for target in range(len(graph))]
+
+    def add(self, path, word=None, snake_score=None):
+        """
+        Add the given prefix.
+
+        :param tuple path: the ``(indices, node, letters, multiplier, mask)`` prefix
+        :param str word: the word of the prefix, or ``None`` if it is not a (long enough) word
+        :param int snake_score: the score of the prefix, if it is a word
+        :rtype: int, i.e. the id of the prefix
+        """
+        path_id = self.next_id
+        self.next_id += 1
+        self.paths[path_id] = path
+        for i in path[0]:
+            self.through[i].add(path_id)
+        self.ending[path[0][-1]].add(path_id)
+        if word is not None:
+            self.scores[path_id] = snake_score
+            self.path_words[path_id] = word
+            self.words.setdefault(word, set()).add(path_id)
+        return path_id
+
+    def remove(self, path_id):
+        """
+        Remove the given prefix.
+
+        :param int path_id: the id of the prefix
+        :rtype: str, i.e. the word of the prefix, or ``None`` if it is not a word
+        """
+        indices = self.paths.pop(path_id)[0]
+        for i in indices:
+            self.through[i].discard(path_id)
+        self.ending[indices[-1]].discard(path_id)
+        word = self.path_words.pop(path_id, None)
+        if word is not None:
+            del self.scores[path_id]
+            self.words[word].discard(path_id)
+            if len(self.words[word]) == 0:
+                del self.words[word]
+        return word
+
 class Solver(object):
     """
     Solve a Ruzzle board.
 
     Please see the README.md for a discussion.
 
+    If ``stats`` is ``True``, the search counters
+    are collected in ``self.stats`` (see ``SolverStats``),
+    otherwise ``self.stats`` is ``None``.
+
+    Only the words with at least ``min_length``
+    and at most ``max_length`` letters are found,
+    and the snakes are not extended beyond ``max_length`` cells.
+
+    The search can be stopped from another thread with ``cancel()``:
+    the words found so far are returned, and they are not cached.
+
     :param Board board: the board to solve
     :param MTDictionary dictionary: the dictionary containing the valid words
+    :param bool stats: if ``True``, collect the search counters
+    :param int min_length: the minimum length of the words (at least 2)
+    :param int max_length: the maximum length of the words, or ``None`` for no limit
     """
 
     SORT_BY_SCORE = "score"
@@ -51,55 +331,580 @@ class Solver(object):
     SORT_BY_END = "end"
     """ Sort by snake end position (NW->SE), score (decr), word (alpha) """
 
-    def __init__(self, board, dictionary):
+    def __init__(self, board, dictionary, stats=False, min_length=2, max_length=None):
         self.board = board
         self.dictionary = dictionary
         self.found = {}
+        self.nodes_expanded = 0
+        self.stats = SolverStats() if stats else None
+        self.min_length = max(2, min_length)
+        self.max_length = max_length
+        self._index = None
+        self.cancel_event = threading.Event()
+        self.incomplete = False
+
+    def cancel(self):
+        """
+        Ask the search to stop as soon as possible,
+        i.e. before exploring the snakes starting at the next cell.
+        It can be called from any thread.
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        """
+        ``True`` if ``cancel()`` has been called.
+
+        :rtype: bool
+        """
+        return self.cancel_event.is_set()
+
+    def cache_kind(self, kind=u"all"):
+        """
+        Return the cache key label of the results of this solver,
+        distinguishing the ones computed with length limits.
 
-    def solve(self, sort=SORT_BY_SCORE, reverse=False):
+        :param str kind: the label of the results without length limits
+        :rtype: str
+        """
+        if (self.min_length == 2) and (self.max_length is None):
+            return kind
+        return u"%s|length:%d-%s" % (kind, self.min_length, self.max_length)
+
+    def solve(self, sort=SORT_BY_SCORE, reverse=False, workers=1, cache=None, symmetry=False, top_k=None, deadline=None, max_nodes=None):
         """
         Solve the board.
 
+        If ``workers`` is greater than one,
+        the start cells are distributed among a pool of worker processes,
+        each loading the dictionary once;
+        the results are merged in start cell order,
+        hence they are identical to the ones of the serial solver.
+
+        If ``cache`` is not ``None``, the result is looked up in it
+        before solving the board, and stored in it afterwards.
+
+        If ``symmetry`` is ``True``, the canonical rotation/reflection
+        of the board is solved instead (see ``solve_symmetric()``),
+        so that all the boards in the same orbit share the same cache entry.
+
+        If ``top_k`` is not ``None``, the board is solved as above,
+        and only the ``top_k`` best words
+        (by score, as in ``SORT_BY_SCORE``) are returned, sorted by ``sort``.
+
+        If ``deadline`` or ``max_nodes`` is not ``None``,
+        the search is an anytime search (see ``SearchBudget``):
+        the most promising cells (with high letter scores and multipliers)
+        are explored first, and, once the budget is exhausted,
+        the best words found so far are returned,
+        and ``self.incomplete`` is set to ``True``.
+        If the budget is not exhausted, the result is identical to the one
+        of the unbudgeted search, since ties are broken explicitly
+        (see ``record()``). In this case, ``workers`` and ``symmetry`` are ignored,
+        and incomplete results are not cached.
+
         :param str sort: the sort method
         :param bool reverse: if ``True`` reverse the order of the words
+        :param int workers: the number of worker processes
+        :param SolveCache cache: the cache of the solve results
+        :param bool symmetry: if ``True``, solve the canonical form of the board
+        :param int top_k: if not ``None``, the number of best words to return
+        :param float deadline: the time budget, in seconds, of an anytime search
+        :param int max_nodes: the node budget (snakes taken from the stack) of an anytime search
         """
+        if (top_k is not None) and (top_k < 1):
+            raise ValueError("The number of best words must be at least 1. (Got %d)" % top_k)
         self.found = {}
-        # find all valid snakes
-        for snake in self.find_snakes():
-            # for each word, keep only the snake with the highest score
-            snake_word = self.board.compute_snake_word(snake)
-            snake_score = self.board.compute_snake_score(snake)
-            if (snake_word not in self.found) or (self.found[snake_word][1] < snake_score):
-                self.found[snake_word] = (snake_word, snake_score, snake)
+        self.incomplete = False
+        started = time.time()
+        budget = None
+        if (deadline is not None) or (max_nodes is not None):
+            budget = SearchBudget(deadline=deadline, max_nodes=max_nodes)
+        if symmetry and (budget is None):
+            self.solve_symmetric(workers=workers, cache=cache)
+        else:
+            key = None
+            entries = None
+            if cache is not None:
+                key = cache.key(self.board, self.dictionary, kind=self.cache_kind())
+                entries = cache.get(key)
+            if entries is not None:
+                self._mark_cached()
+                for entry in entries:
+                    self.found[entry[0]] = entry
+            else:
+                if budget is not None:
+                    for (word, snake_score, snake) in self.iter_snakes(budget=budget):
+                        self.record(word, snake_score, snake, tie_break=True)
+                elif workers > 1:
+                    self.solve_parallel(workers)
+                else:
+                    for (word, snake_score, snake) in self.iter_snakes():
+                        self.record(word, snake_score, snake)
+                if (cache is not None) and (not self.cancelled) and (not self.incomplete):
+                    cache.put(key, self.found.values())
+        if top_k is not None:
+            self.found = dict([(entry[0], entry) for entry in heapq.nlargest(top_k, self.found.values(), key=score_rank)])
+        if self.stats is not None:
+            self.stats.time = time.time() - started
         # sort and return
         return self.sort_words(sort=sort, reverse=reverse)
 
-    def find_snakes(self):
+    def _mark_cached(self):
+        if self.stats is not None:
+            self.stats.cached = True
+
+    def solve_compact(self, **options):
+        """
+        Solve the board, and return the result as a compact ``SolveResult``,
+        storing the trie key ids of the words instead of the words.
+
+        :param dict options: the keyword arguments for ``solve()``
+        :rtype: SolveResult
+        """
+        return SolveResult.from_entries(self.solve(**options), self.dictionary, self.board.graph)
+
+    def solve_symmetric(self, workers=1, cache=None):
+        """
+        Solve the canonical rotation/reflection of the board,
+        and map its snakes back to the orientation of the board.
+
+        For each word, all the snakes with the highest score
+        are kept for the canonical board;
+        once mapped back, the one coming first in the exploration order
+        of the board (i.e., the lexicographically smallest) is chosen,
+        hence the result is identical to the one of ``solve()``.
+
+        :param int workers: the number of worker processes
+        :param SolveCache cache: the cache of the solve results of the canonical boards
+        """
+        canonical, mapping = canonical_form(self.board)
+        key = None
+        entries = None
+        if cache is not None:
+            key = cache.key(canonical, self.dictionary, kind=self.cache_kind(u"ties"))
+            entries = cache.get(key)
+        if entries is None:
+            solver = Solver(canonical, self.dictionary, min_length=self.min_length, max_length=self.max_length)
+            # the canonical solver shares the counters and the cancellation of this one
+            solver.stats = self.stats
+            solver.cancel_event = self.cancel_event
+            entries = solver.find_ties(workers=workers)
+            if (cache is not None) and (not self.cancelled):
+                cache.put(key, entries)
+        else:
+            self._mark_cached()
+        best = {}
+        for (word, snake_score, snake) in entries:
+            cells = [mapping[cell] for cell in snake.cells]
+            if (word not in best) or (cells < best[word][1]):
+                best[word] = (snake_score, cells)
+        for (word, (snake_score, cells)) in best.items():
+            self.found[word] = (word, snake_score, Snake(cells))
+
+    def find_ties(self, workers=1, starts=None):
+        """
+        Return, for each word, all the snakes with the highest score,
+        in the order they are found.
+
+        :param int workers: the number of worker processes
+        :param list starts: if not ``None``, consider only the snakes starting at the cells with these indices
+        :rtype: list of (str, int, Snake) tuples, with possibly repeated words
+        """
+        if workers > 1:
+            entries = self.find_ties_parallel(workers)
+        else:
+            entries = self.iter_snakes(starts=starts)
+        ties = {}
+        for (word, snake_score, snake) in entries:
+            if (word not in ties) or (ties[word][0] < snake_score):
+                ties[word] = (snake_score, [snake])
+            elif ties[word][0] == snake_score:
+                ties[word][1].append(snake)
+        return [(word, snake_score, snake) for (word, (snake_score, snakes)) in ties.items() for snake in snakes]
+
+    def solve_parallel(self, workers):
+        """
+        Find the valid snakes using a pool of worker processes,
+        one task per start cell.
+
+        :param int workers: the number of worker processes
+        """
+        for (word, snake_score, snake) in self.find_ties_parallel(workers):
+            self.record(word, snake_score, snake)
+
+    def find_ties_parallel(self, workers):
+        """
+        Find, for each start cell and word, all the snakes with the highest score,
+        using a pool of worker processes, one task per start cell,
+        and yield them in start cell order.
+
+        The workers are started as in ``ordered_map()``,
+        and the dictionary is sent to each worker once,
+        as the path of its MARISA file, if any.
+
+        :param int workers: the number of worker processes
+        :rtype: generator of (str, int, Snake) tuples
+        """
+        tasks = range(len(self.board.graph))
+        for (entries, stats) in ordered_map(_solve_start, tasks, workers, initializer=_init_worker, initargs=(self.board, self.dictionary, self.stats is not None, self.min_length, self.max_length)):
+            if stats is not None:
+                self.stats.merge(stats)
+            for (word, snake_score, cells) in entries:
+                yield (word, snake_score, Snake(cells))
+
+    def iter_words(self, updates=False):
+        """
+        Solve the board, yielding each word as soon as it is found,
+        as a ``(word, score, snake)`` tuple.
+
+        If ``updates`` is ``True``, a word is yielded again
+        each time a higher scoring snake for it is found,
+        so that the last tuple yielded for each word
+        is the one that ``solve()`` would return.
+
+        Only the best snake of each word is kept in memory,
+        and, once the generator is exhausted,
+        ``sort_words()`` returns the same list as ``solve()``.
+
+        :param bool updates: if ``True``, yield also the best snake updates
+        :rtype: generator of (str, int, Snake) tuples
+        """
+        self.found = {}
+        started = time.time()
+        for (word, snake_score, snake) in self.iter_snakes():
+            new = word not in self.found
+            if self.record(word, snake_score, snake) and (new or updates):
+                yield (word, snake_score, snake)
+        if self.stats is not None:
+            self.stats.time = time.time() - started
+
+    def record(self, word, snake_score, snake, tie_break=False):
+        """
+        Record a valid snake for the given word,
+        keeping, for each word, only the first snake with the highest score.
+
+        Since the snakes are normally found in lexicographic order of their cells,
+        the first one is also the smallest one;
+        if they are found in a different order (e.g., in an anytime search),
+        ``tie_break`` must be ``True``, so that the smallest one is kept explicitly.
+
+        :param str word: the word
+        :param int snake_score: the score of the snake
+        :param Snake snake: the snake
+        :param bool tie_break: if ``True``, among the highest scoring snakes keep the lexicographically smallest one
+        :rtype: bool
+        """
+        entry = self.found.get(word)
+        if (entry is None) or (entry[1] < snake_score) or (tie_break and (entry[1] == snake_score) and (snake.cells < entry[2].cells)):
+            self.found[word] = (word, snake_score, snake)
+            return True
+        return False
+
+    def find_snakes(self, starts=None):
         """
         Find all the valid snakes in the board.
 
+        :param list starts: if not ``None``, consider only the snakes starting at the cells with these indices
         :rtype: list of Snake objects
         """
-        valid_snakes = []
-        rows = self.board.rows
-        cols = self.board.cols
-        for row in range(rows):
-            for col in range(cols):
-                to_be_explored = [Snake([(row, col)])]
-                while len(to_be_explored) > 0:
-                    current = to_be_explored.pop(0)
-                    current_word = self.board.compute_snake_word(current)
-                    if (len(current_word) > 1) and (self.dictionary.has_key(current_word)):
-                        valid_snakes.append(current)
-                    if self.dictionary.has_keys_with_prefix(current_word):
-                        crow, ccol = current.end
-                        for trow in range(max(0, crow - 1), min(rows, crow + 2)):       # (crow + 1) + 1 => range(x, y) = [x, x+1, ... , y-1]
-                            for tcol in range(max(0, ccol - 1), min(cols, ccol + 2)):   # (ccol + 1) + 1 => range(x, y) = [x, x+1, ... , y-1]
-                                tcell = (trow, tcol) 
-                                if not current.has_cell(tcell):
-                                    to_be_explored.append(current.extend(tcell))
-        return valid_snakes
-            
+        return [snake for (word, snake_score, snake) in self.iter_snakes(starts=starts)]
+
+    def iter_snakes(self, starts=None, budget=None):
+        """
+        Yield all the valid snakes in the board,
+        as ``(word, score, snake)`` tuples.
+
+        The board is explored depth-first, from each start cell,
+        using an explicit stack: since the neighbours of each cell
+        are pushed in reverse order, the snakes are found
+        in the same order of a breadth-first exploration
+        restricted to each word length (i.e., lexicographic order of their cell indices),
+        while the stack holds at most (max degree) x (longest snake) entries.
+
+        Each snake in the exploration stack carries the id of
+        the dictionary node corresponding to its word,
+        so that extending it by one letter costs a single
+        (memoized) transition, instead of rebuilding the whole word
+        and querying the trie from its root.
+        It also carries the sum of its letter scores
+        and the product of its word multipliers,
+        so that its score is computed in O(1).
+        The neighbours of each cell are read from the compiled
+        adjacency graph of the board.
+
+        The exploration stops before the next start cell
+        once ``cancel()`` has been called.
+
+        If ``budget`` is not ``None``, the start cells are explored
+        by decreasing potential (the value of the cell and of its neighbours,
+        where the value of a cell is its letter score times its word multiplier),
+        the neighbours of each snake by decreasing value,
+        and the exploration stops as soon as the budget is exhausted,
+        setting ``self.incomplete`` to ``True``.
+
+        The number of snakes taken from the stack is added
+        to ``self.nodes_expanded`` after each start cell.
+        If ``self.stats`` is not ``None``, the search counters
+        are updated as well; otherwise, the only overhead
+        is one test per snake taken from the stack.
+
+        :param list starts: if not ``None``, consider only the snakes starting at the cells with these indices
+        :param SearchBudget budget: the budget of an anytime search
+        :rtype: generator of (str, int, Snake) tuples
+        """
+        graph = self.board.graph
+        cells = graph.cells
+        bits = graph.bits
+        neighbours = graph.neighbours
+        board_cells = [self.board.cells[cell] for cell in cells]
+        letters = [c.letter for c in board_cells]
+        scores = [c.score for c in board_cells]
+        multipliers = [c.word_multiplier for c in board_cells]
+        dictionary = self.dictionary
+        child = dictionary.child
+        is_key = dictionary.is_key
+        node_prefix = dictionary.node_prefix
+        # the stack is LIFO: push the neighbours in reverse order, to pop them in increasing order
+        reversed_neighbours = [tuple(reversed(n)) for n in neighbours]
+        min_length = self.min_length
+        max_length = self.max_length
+        stats = self.stats
+        if stats is not None:
+            child = stats.count_child(child)
+            is_key = stats.count_is_key(is_key)
+        if starts is None:
+            starts = range(len(cells))
+        if budget is not None:
+            # explore the most valuable cells first, word multipliers before letter scores:
+            # the stack pops the last pushed neighbour
+            reversed_neighbours = [tuple(sorted(n, key=lambda t: (multipliers[t], scores[t], -t))) for n in neighbours]
+            starts = sorted(starts, key=lambda i: (-multipliers[i], -scores[i] * multipliers[i], i))
+            clock = SearchBudget.CLOCK_INTERVAL
+            node_limit = budget.max_nodes if budget.max_nodes is not None else float("inf")
+            pending = 0
+        cancel_event = self.cancel_event
+        for start in starts:
+            if cancel_event.is_set():
+                return
+            if (budget is not None) and budget.spend(0):
+                self.incomplete = True
+                return
+            if stats is not None:
+                started = time.time()
+            node = child(MTDictionary.ROOT, letters[start])
+            if node is None:
+                if stats is not None:
+                    stats.start_times[cells[start]] = stats.start_times.get(cells[start], 0.0) + time.time() - started
+                continue
+            expanded = 0
+            to_be_explored = [(Snake([cells[start]]), node, start, scores[start], multipliers[start])]
+            while len(to_be_explored) > 0:
+                if (stats is not None) and (len(to_be_explored) > stats.peak_frontier):
+                    stats.peak_frontier = len(to_be_explored)
+                if budget is not None:
+                    pending += 1
+                    if (pending == clock) or (budget.nodes + pending > node_limit):
+                        exhausted = budget.spend(pending)
+                        pending = 0
+                        if exhausted:
+                            self.incomplete = True
+                            break
+                current, node, index, acc, mult = to_be_explored.pop()
+                expanded += 1
+                length = len(current)
+                if (length >= min_length) and (is_key(node)):
+                    yield (node_prefix(node), acc * mult + LENGTH_POINTS.get(length, 0), current)
+                if (max_length is not None) and (length >= max_length):
+                    continue
+                for target in reversed_neighbours[index]:
+                    if (current.mask & bits[target]) == 0:
+                        tnode = child(node, letters[target])
+                        if tnode is not None:
+                            to_be_explored.append((current.extend(cells[target]), tnode, target, acc + scores[target], mult * multipliers[target]))
+            self.nodes_expanded += expanded
+            if stats is not None:
+                stats.nodes_expanded += expanded
+                stats.start_times[cells[start]] = stats.start_times.get(cells[start], 0.0) + time.time() - started
+
+    def update_cell(self, cell, token):
+        """
+        Set the token (letter and multiplier) of the given cell,
+        and update the found words, exploring only the snakes through the cell.
+
+        The first call explores the whole board,
+        keeping every valid snake prefix (not only the words),
+        indexed by the cells it uses and by its last cell.
+        When a cell changes, the prefixes through it are dropped,
+        and the board is explored again only from the prefixes
+        ending next to it (which do not depend on its token),
+        and from the cell itself.
+
+        Afterwards, ``self.found`` (hence ``sort_words()``) contains
+        the same words, scores and snakes that ``solve()`` would return
+        for the modified board.
+        The index is valid only as long as the board
+        is modified exclusively through this method.
+
+        :param tuple cell: the ``(x, y)`` cell
+        :param str token: the new token of the cell
+        :rtype: (list of (str, int, Snake) tuples, list of str), i.e.
+                the entries of the new words and of the words whose best snake changed,
+                and the words no longer found, both sorted by word
+        """
+        if self._index is None:
+            self.build_index()
+        index = self._index
+        graph = self.board.graph
+        target = graph.index(cell)
+        old_cell = self.board.cells[cell]
+        new_cell = BoardCell(token, self.board.language)
+        self.board.cells[cell] = new_cell
+        affected = set()
+        if new_cell.letter == old_cell.letter:
+            # same letter: the same prefixes, with different scores
+            for path_id in index.through[target]:
+                indices, node, acc, mult, mask = index.paths[path_id]
+                acc += new_cell.score - old_cell.score
+                mult = mult // old_cell.word_multiplier * new_cell.word_multiplier
+                index.paths[path_id] = (indices, node, acc, mult, mask)
+                if path_id in index.scores:
+                    index.scores[path_id] = acc * mult + LENGTH_POINTS.get(len(indices), 0)
+                    affected.add(index.path_words[path_id])
+        else:
+            for path_id in list(index.through[target]):
+                affected.add(index.remove(path_id))
+            affected.discard(None)
+            affected.update(self._explore(self._seeds(target)))
+        affected = sorted(affected)
+        old = [index.found.get(word) for word in affected]
+        for word in affected:
+            self._update_best(word)
+        self.found = index.found
+        added = [index.found[word] for (word, entry) in zip(affected, old) if (word in index.found) and (entry is not index.found[word])]
+        removed = [word for (word, entry) in zip(affected, old) if (entry is not None) and (word not in index.found)]
+        return (added, removed)
+
+    def build_index(self):
+        """
+        Explore the whole board, indexing all the valid snake prefixes
+        (see ``update_cell()``), and set ``self.found`` accordingly.
+
+        This is done by the first call of ``update_cell()``,
+        but it can be called earlier to get the words of the unmodified board.
+        """
+        graph = self.board.graph
+        self._index = SnakeIndex(graph)
+        board_cells = [self.board.cells[cell] for cell in graph.cells]
+        child = self.dictionary.child
+        seeds = []
+        for (start, board_cell) in enumerate(board_cells):
+            node = child(MTDictionary.ROOT, board_cell.letter)
+            if node is not None:
+                seeds.append(((start,), node, board_cell.score, board_cell.word_multiplier, graph.bits[start]))
+        for word in self._explore(seeds):
+            self._update_best(word)
+        self.found = self._index.found
+
+    def _seeds(self, target):
+        """
+        Return the prefixes ending with the cell with the given index:
+        the cell itself, and the extensions of the indexed prefixes
+        ending next to it, not using it.
+
+        :param int target: the index of the cell
+        :rtype: list of ``(indices, node, letters, multiplier, mask)`` prefixes
+        """
+        index = self._index
+        bits = self.board.graph.bits
+        board_cell = self.board.cells[self.board.graph.cells[target]]
+        letter = board_cell.letter
+        score = board_cell.score
+        multiplier = board_cell.word_multiplier
+        child = self.dictionary.child
+        max_length = self.max_length
+        seeds = []
+        node = child(MTDictionary.ROOT, letter)
+        if node is not None:
+            seeds.append(((target,), node, score, multiplier, bits[target]))
+        for source in index.predecessors[target]:
+            for path_id in index.ending[source]:
+                indices, pnode, acc, mult, mask = index.paths[path_id]
+                if ((mask & bits[target]) == 0) and ((max_length is None) or (len(indices) < max_length)):
+                    tnode = child(pnode, letter)
+                    if tnode is not None:
+                        seeds.append((indices + (target,), tnode, acc + score, mult * multiplier, mask | bits[target]))
+        return seeds
+
+    def _explore(self, seeds):
+        """
+        Explore the board depth-first from the given prefixes,
+        adding them and all their valid extensions to the index.
+
+        :param list seeds: the ``(indices, node, letters, multiplier, mask)`` prefixes
+        :rtype: set of str, i.e. the words of the added snakes
+        """
+        index = self._index
+        graph = self.board.graph
+        bits = graph.bits
+        neighbours = graph.neighbours
+        board_cells = [self.board.cells[cell] for cell in graph.cells]
+        letters = [c.letter for c in board_cells]
+        scores = [c.score for c in board_cells]
+        multipliers = [c.word_multiplier for c in board_cells]
+        child = self.dictionary.child
+        is_key = self.dictionary.is_key
+        node_prefix = self.dictionary.node_prefix
+        min_length = self.min_length
+        max_length = self.max_length
+        words = set()
+        to_be_explored = list(seeds)
+        while len(to_be_explored) > 0:
+            path = to_be_explored.pop()
+            indices, node, acc, mult, mask = path
+            self.nodes_expanded += 1
+            length = len(indices)
+            word = None
+            if (length >= min_length) and (is_key(node)):
+                word = node_prefix(node)
+                words.add(word)
+            index.add(path, word, acc * mult + LENGTH_POINTS.get(length, 0))
+            if (max_length is not None) and (length >= max_length):
+                continue
+            for target in neighbours[indices[-1]]:
+                if (mask & bits[target]) == 0:
+                    tnode = child(node, letters[target])
+                    if tnode is not None:
+                        to_be_explored.append((indices + (target,), tnode, acc + scores[target], mult * multipliers[target], mask | bits[target]))
+        return words
+
+    def _update_best(self, word):
+        """
+        Set the entry of the given word in the index to its highest scoring snake,
+        choosing the first one in exploration order (i.e., the lexicographically smallest)
+        among the ties, as ``solve()`` does; remove the word if it has no snake.
+
+        :param str word: the word
+        """
+        index = self._index
+        path_ids = index.words.get(word)
+        if not path_ids:
+            index.found.pop(word, None)
+            index.best.pop(word, None)
+            return
+        best = None
+        for path_id in path_ids:
+            indices = index.paths[path_id][0]
+            snake_score = index.scores[path_id]
+            if (best is None) or (snake_score > best[0]) or ((snake_score == best[0]) and (indices < best[1])):
+                best = (snake_score, indices)
+        # keep the current entry if its best snake did not change
+        if index.best.get(word) != best:
+            cells = self.board.graph.cells
+            index.best[word] = best
+            index.found[word] = (word, best[0], Snake([cells[i] for i in best[1]]))
+
     def sort_words(self, sort=SORT_BY_SCORE, reverse=False):
         """
         Sort the found words according to the requested method,
@@ -119,7 +924,7 @@ class Solver(object):
             key = lambda x: (x[2].end, x[1], x[0])
             rev = False
         else:
-            key = lambda x: (x[1], -len(x[0]), x[0])
+            key = score_rank
             rev = True
         reverse = not rev if reverse else rev
         return sorted([self.found[word] for word in self.found], key=key, reverse=reverse)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Symmetries of the board under the dihedral group of the rectangle/square.
+
+Rotating or reflecting a ``grid`` (or ``torus``) board
+does not change its adjacency, hence its words and their scores:
+only the cells of the snakes change.
+Therefore, all the boards in the same orbit can be solved
+by solving a single canonical representative,
+and mapping its snakes back to the original orientation.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+from elzzur.board import Board
+from elzzur.topology import GRID, TORUS
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+TRANSFORMS = [
+    ("identity", False, lambda r, c, R, C: (r, c)),
+    ("rotate90", True, lambda r, c, R, C: (c, R - 1 - r)),
+    ("rotate180", False, lambda r, c, R, C: (R - 1 - r, C - 1 - c)),
+    ("rotate270", True, lambda r, c, R, C: (C - 1 - c, r)),
+    ("flip_horizontal", False, lambda r, c, R, C: (r, C - 1 - c)),
+    ("flip_vertical", False, lambda r, c, R, C: (R - 1 - r, c)),
+    ("transpose", True, lambda r, c, R, C: (c, r)),
+    ("antitranspose", True, lambda r, c, R, C: (C - 1 - c, R - 1 - r)),
+]
+"""
+The eight elements of the dihedral group D4,
+as ``(name, swaps_shape, function)`` tuples,
+where ``function(r, c, R, C)`` maps the cell ``(r, c)``
+of a ``R x C`` board to the transformed board
+(which is ``C x R`` if ``swaps_shape`` is ``True``).
+"""
+
+SYMMETRIC_TOPOLOGIES = [GRID, TORUS]
+""" Topologies whose adjacency is invariant under all the TRANSFORMS """
+
+def transform_board(board, transform):
+    """
+    Return a new board, obtained by applying the given transform to the given board.
+
+    :param Board board: the board
+    :param tuple transform: an element of ``TRANSFORMS``
+    :rtype: Board
+    """
+    name, swaps_shape, function = transform
+    transformed = Board(board.language, topology=board.topology)
+    transformed.rows, transformed.cols = (board.cols, board.rows) if swaps_shape else (board.rows, board.cols)
+    for ((row, col), cell) in board.cells.items():
+        transformed.cells[function(row, col, board.rows, board.cols)] = cell
+    return transformed
+
+def board_tokens(board):
+    """
+    Return the shape and the tokens (letters and multipliers) of the given board, row by row.
+
+    :param Board board: the board
+    :rtype: tuple
+    """
+    return (board.rows, board.cols, tuple([board.cells[(row, col)].pretty_print(multiplier=True) for row in range(board.rows) for col in range(board.cols)]))
+
+def canonical_form(board):
+    """
+    Return the canonical representative of the orbit of the given board,
+    that is, the transformed board with the smallest tokens,
+    and the dict mapping each cell of the canonical board
+    to the corresponding cell of the given board.
+
+    Boards whose topology is not in ``SYMMETRIC_TOPOLOGIES``
+    are their own canonical representative.
+
+    :param Board board: the board
+    :rtype: (Board, dict)
+    """
+    transforms = TRANSFORMS if board.topology in SYMMETRIC_TOPOLOGIES else TRANSFORMS[0:1]
+    best = None
+    for transform in transforms:
+        transformed = transform_board(board, transform)
+        tokens = board_tokens(transformed)
+        if (best is None) or (tokens < best[0]):
+            best = (tokens, transformed, transform)
+    tokens, canonical, (name, swaps_shape, function) = best
+    mapping = {}
+    for (row, col) in board.cells:
+        mapping[function(row, col, board.rows, board.cols)] = (row, col)
+    return (canonical, mapping)
+
+
+
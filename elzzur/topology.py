@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Compiled adjacency graphs of the board cells.
+
+The cells of a ``rows x cols`` board are numbered row by row
+(i.e., cell ``(x, y)`` has index ``x * cols + y``),
+and the graph stores, for each cell index,
+the sorted tuple of the indices of its neighbours.
+
+Graphs are compiled once per ``(rows, cols, topology)``,
+and shared by all the boards with the same shape.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+from elzzur.snake import cell_bit
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+GRID = "grid"
+""" Rectangular grid, each cell is adjacent to its (up to) 8 surrounding cells """
+
+TORUS = "torus"
+""" Like GRID, but the first and last rows (and columns) are adjacent """
+
+HEX = "hex"
+""" Hexagonal grid, with odd rows shifted right by half a cell ("odd-r" layout) """
+
+TOPOLOGIES = [GRID, TORUS, HEX]
+""" Supported topologies """
+
+HEX_OFFSETS = {
+    0: [(-1, -1), (-1, 0), (0, -1), (0, 1), (1, -1), (1, 0)],
+    1: [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, 0), (1, 1)],
+}
+""" Neighbour offsets in a HEX topology, for even (0) and odd (1) rows """
+
+_GRAPHS = {}
+""" Cache of the compiled graphs, keyed by ``(rows, cols, topology)`` """
+
+class BoardGraph(object):
+    """
+    The compiled adjacency graph of a board shape.
+
+    :param int rows: the number of rows
+    :param int cols: the number of columns
+    :param str topology: the topology (see ``TOPOLOGIES``)
+    """
+    def __init__(self, rows, cols, topology=GRID):
+        if topology not in TOPOLOGIES:
+            raise ValueError("Unknown topology '%s'. Supported topologies: %s" % (topology, ", ".join(TOPOLOGIES)))
+        self.rows = rows
+        self.cols = cols
+        self.topology = topology
+        self.cells = [(row, col) for row in range(rows) for col in range(cols)]
+        self.bits = [cell_bit(cell) for cell in self.cells]
+        self.neighbours = [tuple(sorted(self._compute_neighbours(cell))) for cell in self.cells]
+        self.neighbour_masks = [sum([1 << t for t in neighbours]) for neighbours in self.neighbours]
+
+    def __len__(self):
+        return len(self.cells)
+
+    def index(self, cell):
+        """
+        Return the index of the given ``(x, y)`` cell.
+
+        :param tuple cell: the ``(x, y)`` cell
+        :rtype: int
+        """
+        return cell[0] * self.cols + cell[1]
+
+    def are_adjacent(self, index1, index2):
+        """
+        Return ``True`` if the cells with the given indices are adjacent.
+
+        :param int index1: the index of the first cell
+        :param int index2: the index of the second cell
+        :rtype: bool
+        """
+        return (self.neighbour_masks[index1] >> index2) & 1 == 1
+
+    def _compute_neighbours(self, cell):
+        """
+        Return the set of the indices of the cells adjacent to the given cell.
+
+        :param tuple cell: the ``(x, y)`` cell
+        :rtype: set of int
+        """
+        row, col = cell
+        if self.topology == HEX:
+            offsets = HEX_OFFSETS[row % 2]
+        else:
+            offsets = [(drow, dcol) for drow in (-1, 0, 1) for dcol in (-1, 0, 1) if (drow, dcol) != (0, 0)]
+        acc = set()
+        for (drow, dcol) in offsets:
+            trow, tcol = row + drow, col + dcol
+            if self.topology == TORUS:
+                trow, tcol = trow % self.rows, tcol % self.cols
+            if (0 <= trow < self.rows) and (0 <= tcol < self.cols) and ((trow, tcol) != cell):
+                acc.add(self.index((trow, tcol)))
+        return acc
+
+def compile_graph(rows, cols, topology=GRID):
+    """
+    Return the adjacency graph of a ``rows x cols`` board
+    with the given topology, compiling it only the first time
+    a given shape is requested.
+
+    :param int rows: the number of rows
+    :param int cols: the number of columns
+    :param str topology: the topology (see ``TOPOLOGIES``)
+    :rtype: BoardGraph
+    """
+    key = (rows, cols, topology)
+    graph = _GRAPHS.get(key)
+    if graph is None:
+        graph = _GRAPHS.setdefault(key, BoardGraph(rows, cols, topology))
+    return graph
+
+
+
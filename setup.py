@@ -16,7 +16,7 @@ __status__ = "Production"
 
 setup(
     name="elzzur",
-    packages=["elzzur"],
+    packages=["elzzur", "elzzur.languages"],
     package_data={"elzzur": ["res/*"]},
     version="0.0.1.0",
     description="elzzur solves a Ruzzle board, listing all the valid words with their scores.",
@@ -26,6 +26,7 @@ setup(
     license="MIT License",
     long_description=open("README.rst", "r").read(),
     install_requires=["marisa-trie>=0.7.2"],
+    extras_require={"numpy": ["numpy"]},
     scripts=["bin/elzzur"],
     keywords=[
         "elzzur",
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.
+
+Run them from the root of the repository with::
+
+    $ python -m pytest
+
+or::
+
+    $ python -m unittest discover
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+
+from elzzur.board import Board
+from elzzur.mtdictionary import get_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+RES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "elzzur", "res")
+""" Directory of the bundled boards and dictionaries """
+
+def bundled_board(language, topology="grid"):
+    """
+    Return the bundled board of the given language.
+
+    :param str language: the language code (e.g. ``en``)
+    :param str topology: the adjacency of the board cells
+    :rtype: Board
+    """
+    return Board(language, topology=topology).read_board_file(os.path.join(RES_DIR, language + ".board"))
+
+def bundled_dictionary(language):
+    """
+    Return the (shared) bundled dictionary of the given language.
+
+    :param str language: the language code (e.g. ``en``)
+    :rtype: MTDictionary
+    """
+    return get_dictionary(language=language)
+
+def as_lists(words):
+    """
+    Return the given solve result with the snakes as lists of cells,
+    so that two results can be compared.
+
+    :param list words: list of (word, score, snake) tuples
+    :rtype: list of (str, int, list) tuples
+    """
+    return [(word, snake_score, snake.cells) for (word, snake_score, snake) in words]
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.asyncsolver.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import asyncio
+import concurrent.futures
+import unittest
+
+from elzzur.asyncsolver import AsyncSolver, iter_words_async, solve_async, split_options
+from elzzur.generator import BoardSampler
+from elzzur.solver import Solver
+
+from tests import as_lists, bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestAsyncSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.board = bundled_board("en")
+        self.dictionary = bundled_dictionary("en")
+        self.expected = as_lists(Solver(self.board, self.dictionary).solve())
+
+    def test_split_options(self):
+        self.assertEqual(split_options({"max_length": 5, "top_k": 3}), ({"max_length": 5}, {"top_k": 3}))
+
+    def test_solve_async(self):
+        async def run():
+            return await asyncio.gather(
+                solve_async(self.board),
+                solve_async(self.board, dictionary=self.dictionary, top_k=5),
+                solve_async(self.board, max_length=3),
+            )
+        full, top, short = asyncio.run(run())
+        self.assertEqual(as_lists(full), self.expected)
+        self.assertEqual(as_lists(top), self.expected[0:5])
+        self.assertEqual(as_lists(short), [entry for entry in self.expected if len(entry[0]) <= 3])
+
+    def test_iter_words_async(self):
+        async def run():
+            return [entry async for entry in iter_words_async(self.board, updates=True)]
+        # the last entry of each word is its best snake
+        best = dict([(word, (word, snake_score, cells)) for (word, snake_score, cells) in as_lists(asyncio.run(run()))])
+        self.assertEqual(sorted(best.values()), sorted(self.expected))
+
+    def test_timeout(self):
+        board = BoardSampler("en", seed=9).board(12, 12)
+        full = dict([(word, snake_score) for (word, snake_score, snake) in Solver(board, self.dictionary).solve()])
+        solver = AsyncSolver(max_concurrent=1)
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(solver.solve(board, timeout=0.0))
+            words = asyncio.run(solver.solve(board, timeout=0.0, partial=True))
+            self.assertTrue(len(words) < len(full))
+            for (word, snake_score, snake) in words:
+                self.assertTrue(snake_score <= full[word])
+        finally:
+            solver.shutdown()
+
+    def test_process_executor(self):
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+        solver = AsyncSolver(executor=executor, max_concurrent=2)
+        try:
+            self.assertEqual(as_lists(asyncio.run(solver.solve(self.board))), self.expected)
+            with self.assertRaises(ValueError):
+                asyncio.run(solver.iter_words(self.board).__anext__())
+        finally:
+            executor.shutdown()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.batch.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.batch import CHUNK_SIZE, solve_records, split_records
+from elzzur.generator import generate_boards, parse_board_line
+from elzzur.solver import Solver
+
+from tests import bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.dictionary = bundled_dictionary("en")
+        self.lines = list(generate_boards("en", 40, seed=5))
+
+    def expected(self, line):
+        return [[word, snake_score, snake.cells] for (word, snake_score, snake) in Solver(parse_board_line(line, "en"), self.dictionary).solve()]
+
+    def test_split_records(self):
+        lines = [u"A B\n", u"C D\n", u"\n", u"\n", u"E F\n", u"G H\n", u"I J/K L\n"]
+        self.assertEqual(list(split_records(lines, u"in")), [
+            (u"in:1", u"A B\nC D\n"),
+            (u"in:5", u"E F\nG H\n"),
+            (u"in:7", u"I J\nK L"),
+        ])
+
+    def test_solve_records(self):
+        for workers in [1, 2]:
+            records = [(u"in:%d" % i, line.replace(u"/", u"\n")) for (i, line) in enumerate(self.lines)]
+            records.insert(3, (u"bad", u"A B\nC"))
+            results = list(solve_records(records, "en", self.dictionary, workers=workers))
+            self.assertEqual([result["index"] for result in results], list(range(len(records))))
+            self.assertIn("error", results[3])
+            del results[3]
+            for (line, result) in zip(self.lines, results):
+                self.assertEqual(result["words"], self.expected(line))
+
+    def test_solve_records_bounded(self):
+        consumed = []
+
+        def records():
+            for (i, line) in enumerate(self.lines):
+                consumed.append(i)
+                yield (u"in:%d" % i, line.replace(u"/", u"\n"))
+
+        workers = 2
+        results = solve_records(records(), "en", self.dictionary, workers=workers)
+        first = next(results)
+        self.assertEqual(first["words"], self.expected(self.lines[0]))
+        self.assertTrue(len(consumed) <= 2 * workers * CHUNK_SIZE)
+        self.assertTrue(len(consumed) < len(self.lines))
+        results.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.board.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.board import _numpy
+from elzzur.generator import BoardSampler
+from elzzur.solver import Solver
+
+from tests import bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestBatchScoring(unittest.TestCase):
+
+    def snakes(self, board, language):
+        return [snake for (word, snake_score, snake) in Solver(board, bundled_dictionary(language)).solve()]
+
+    def test_pure_python_scores(self):
+        board = bundled_board("en")
+        snakes = self.snakes(board, "en")
+        expected = [board.compute_snake_score(snake) for snake in snakes]
+        self.assertEqual(board.compute_snakes_scores(snakes), expected)
+        self.assertEqual(board.compute_snakes_scores([snake.cells for snake in snakes], vectorized=False), expected)
+        self.assertEqual(board.compute_snakes_scores([]), [])
+
+    @unittest.skipIf(_numpy() is None, "NumPy is not installed")
+    def test_vectorized_scores(self):
+        for (language, board) in [("fr", bundled_board("fr")), ("en", BoardSampler("en", seed=2).board(8, 8))]:
+            snakes = self.snakes(board, language)
+            expected = [board.compute_snake_score(snake) for snake in snakes]
+            self.assertEqual(board.compute_snakes_scores(snakes, vectorized=True), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.cache.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import shutil
+import tempfile
+import unittest
+
+from elzzur.cache import SolveCache
+from elzzur.snake import Snake
+from elzzur.solver import Solver
+
+from tests import as_lists, bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestSolveCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def disk_size(self, cache):
+        return sum([os.path.getsize(path) for path in cache._disk_files()])
+
+    def test_solve_with_cache(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        expected = as_lists(Solver(board, dictionary).solve())
+        cache = SolveCache(directory=self.directory)
+        self.assertEqual(as_lists(Solver(board, dictionary).solve(cache=cache)), expected)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(as_lists(Solver(board, dictionary).solve(cache=cache)), expected)
+        self.assertEqual(cache.hits, 1)
+        # a new cache on the same directory reads the on-disk tier
+        cache = SolveCache(directory=self.directory)
+        self.assertEqual(as_lists(Solver(board, dictionary).solve(cache=cache)), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_disk_used_on_overwrite(self):
+        cache = SolveCache(directory=self.directory)
+        entries = [(u"CAT", 5, Snake([(0, 0), (0, 1), (1, 1)]))]
+        for i in range(3):
+            cache.put(u"a" * 40, entries)
+        self.assertEqual(cache.disk_used, self.disk_size(cache))
+        cache.put(u"a" * 40, entries[0:0])
+        cache.put(u"b" * 40, entries)
+        self.assertEqual(cache.disk_used, self.disk_size(cache))
+        cache.clear()
+        self.assertEqual(cache.disk_used, 0)
+
+    def test_disk_eviction(self):
+        entries = [(u"CAT", 5, Snake([(0, 0), (0, 1), (1, 1)]))]
+        cache = SolveCache(directory=self.directory, disk_size=200)
+        for i in range(20):
+            cache.put(u"%040d" % i, entries)
+        self.assertTrue(cache.disk_used <= 200)
+        self.assertEqual(cache.disk_used, self.disk_size(cache))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for the elzzur command line tool.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from tests import RES_DIR
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+""" Root of the repository """
+
+def run(arguments, stderr=False):
+    """
+    Run ``python -m elzzur`` with the given arguments.
+
+    :param list arguments: the command line arguments
+    :param bool stderr: if ``True``, return stderr as well
+    :rtype: (int, str) tuple, i.e. ``(exit code, stdout)``, or ``(exit code, stdout, stderr)``
+    """
+    process = subprocess.Popen([sys.executable, "-m", "elzzur"] + arguments, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = process.communicate()
+    if stderr:
+        return (process.returncode, out.decode("utf-8"), err.decode("utf-8"))
+    return (process.returncode, out.decode("utf-8"))
+
+class TestCommandLine(unittest.TestCase):
+
+    BOARD = os.path.join(RES_DIR, "en.board")
+
+    def words(self, stdout):
+        return set([line.split()[0] for line in stdout.splitlines() if len(line.strip()) > 0])
+
+    def test_stream(self):
+        code, streamed = run(["solve", "-l", "en", "-b", self.BOARD, "--stream", "-q"])
+        self.assertEqual(code, 0)
+        code, solved = run(["solve", "-l", "en", "-b", self.BOARD, "-q"])
+        self.assertEqual(code, 0)
+        self.assertEqual(self.words(streamed), self.words(solved))
+
+    def test_stream_rejects_ignored_options(self):
+        for options in [["-j", "2"], ["-k", "5"], ["--cache", ROOT], ["--symmetry"], ["--deadline", "1"], ["--max-nodes", "100"], ["-s", "length"], ["-R"]]:
+            code, stdout = run(["solve", "-l", "en", "-b", self.BOARD, "--stream", "-q"] + options)
+            self.assertEqual(code, 1, options)
+            self.assertIn("--stream", stdout)
+
+    def test_bare_stats(self):
+        code, stdout, stderr = run(["solve", "-l", "en", "-b", self.BOARD, "-q", "--stats"], stderr=True)
+        self.assertEqual(code, 0)
+        counters = [line for line in stderr.splitlines() if line.startswith("{")]
+        self.assertEqual(len(counters), 1)
+        self.assertGreater(json.loads(counters[0])["nodes_expanded"], 0)
+        code, stdout, stderr = run(["solve", "-l", "en", "-b", self.BOARD, "-q", "--stats", "text"], stderr=True)
+        self.assertEqual(code, 0)
+        self.assertIn("nodes_expanded:", stderr)
+
+    def test_top_must_be_positive(self):
+        for top in ["0", "-1"]:
+            for command in [["demo", "-l", "en"], ["solve", "-l", "en", "-b", self.BOARD], ["solve-batch", "-l", "en", "-b", self.BOARD]]:
+                code, stdout = run(command + ["-k", top])
+                self.assertEqual(code, 1, command + [top])
+                self.assertIn("at least 1", stdout)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.generator.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.generator import SHARD_SIZE, BoardQuality, BoardSampler, format_board_line, generate_boards, parse_board_line, search_board, search_boards, shard_seed
+from elzzur.solver import Solver
+
+from tests import bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestGenerator(unittest.TestCase):
+
+    def test_generate_boards_reproducible(self):
+        lines = list(generate_boards("en", 10, seed=7))
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines, list(generate_boards("en", 10, seed=7)))
+        self.assertNotEqual(lines, list(generate_boards("en", 10, seed=8)))
+        for line in lines:
+            board = parse_board_line(line, "en")
+            self.assertEqual((board.rows, board.cols), (4, 4))
+
+    def test_search_board_meets_targets(self):
+        dictionary = bundled_dictionary("en")
+        targets = (100, 0, 6)
+        board = search_board(BoardSampler("en", seed=1), dictionary, 4, 4, targets)
+        words = Solver(board, dictionary).solve()
+        self.assertTrue(len(words) >= 100)
+        self.assertTrue(max([len(word) for (word, snake_score, snake) in words]) >= 6)
+
+    def test_search_board_unreachable(self):
+        dictionary = bundled_dictionary("en")
+        counters = {}
+        with self.assertRaises(ValueError):
+            search_board(BoardSampler("en", seed=1), dictionary, 2, 2, (500, 0, 0), max_steps=50, max_restarts=2, counters=counters)
+        self.assertEqual(counters["restarts"], 2)
+        with self.assertRaises(ValueError):
+            list(search_boards("en", dictionary, 1, (500, 0, 0), rows=2, cols=2, max_restarts=0))
+
+    def test_board_quality_update(self):
+        dictionary = bundled_dictionary("en")
+        board = BoardSampler("en", seed=3).board(4, 4)
+        quality = BoardQuality(board, dictionary)
+        record = quality.set_token(5, u"E")
+        words = Solver(board, dictionary).solve()
+        self.assertEqual(quality.words, len(words))
+        self.assertEqual(quality.total, sum([snake_score for (word, snake_score, snake) in words]))
+        quality.undo(record)
+        self.assertEqual(quality.words, len(Solver(board, dictionary).solve()))
+
+class TestBulkGenerator(unittest.TestCase):
+
+    def test_workers_do_not_change_boards(self):
+        lines = list(generate_boards("it", SHARD_SIZE + 10, seed=3))
+        self.assertEqual(len(lines), SHARD_SIZE + 10)
+        self.assertEqual(list(generate_boards("it", SHARD_SIZE + 10, seed=3, workers=2)), lines)
+        # the first boards do not depend on the number of boards
+        self.assertEqual(list(generate_boards("it", 5, seed=3)), lines[0:5])
+
+    def test_sampler_board_matches_line(self):
+        board = BoardSampler("en", seed=shard_seed(11, 0)).board(5, 3)
+        self.assertEqual(format_board_line(board), next(generate_boards("en", 1, rows=5, cols=3, seed=11)))
+        self.assertEqual(format_board_line(parse_board_line(format_board_line(board), "en")), format_board_line(board))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.languages and the lazy imports of the command line tool.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import os
+import subprocess
+import sys
+import unittest
+
+from elzzur.languages import LANGUAGES, LETTER_FREQUENCY, LETTER_SCORE
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+""" Root of the repository """
+
+def imported_modules(code):
+    """
+    Run the given code in a new interpreter,
+    and return the names of the modules it imported.
+
+    :param str code: the Python code to run
+    :rtype: set of str
+    """
+    code += "\nimport sys\nprint(\"\\n\".join(sorted(sys.modules)))\n"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+    return set(output.decode("utf-8").splitlines())
+
+class TestLanguageTables(unittest.TestCase):
+
+    def test_tables(self):
+        self.assertEqual(list(LETTER_SCORE), LANGUAGES)
+        self.assertEqual(len(LETTER_FREQUENCY), len(LANGUAGES))
+        for language in LANGUAGES:
+            self.assertIn(language, LETTER_SCORE)
+            self.assertEqual(LETTER_SCORE[language]["A"], LETTER_SCORE.get(language)["A"])
+            self.assertEqual(sorted(LETTER_SCORE[language]), sorted(LETTER_FREQUENCY[language]))
+        self.assertNotIn("xx", LETTER_SCORE)
+        with self.assertRaises(KeyError):
+            LETTER_SCORE["xx"]
+
+    def test_lazy_language_modules(self):
+        modules = imported_modules("from elzzur.languages import LETTER_SCORE\nLETTER_SCORE['en']")
+        self.assertIn("elzzur.languages.en", modules)
+        for language in LANGUAGES:
+            if language != "en":
+                self.assertNotIn("elzzur.languages.%s" % language, modules)
+
+    def test_lazy_imports(self):
+        modules = imported_modules("from elzzur.board import Board\nfrom elzzur.generator import BoardSampler\nBoardSampler('en', seed=1).board(4, 4)")
+        for name in ["numpy", "marisa_trie", "multiprocessing", "elzzur.solver", "elzzur.mtdictionary"]:
+            self.assertNotIn(name, modules)
+        modules = imported_modules("import elzzur.solver")
+        for name in ["numpy", "multiprocessing"]:
+            self.assertNotIn(name, modules)
+
+if __name__ == "__main__":
+    unittest.main()
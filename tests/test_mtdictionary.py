@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.mtdictionary.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import bz2
+import gzip
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from elzzur.mtdictionary import MTDictionary, bundled_dictionary_path, clear_registry, get_dictionary, iter_word_list
+from elzzur.solver import Solver
+
+from tests import as_lists, bundled_board
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_mmap_equals_read(self):
+        path = bundled_dictionary_path("it")
+        mapped = MTDictionary(path, mmap=True)
+        loaded = MTDictionary(path, mmap=False)
+        self.assertEqual(mapped.keys, loaded.keys)
+        board = bundled_board("it")
+        self.assertEqual(as_lists(Solver(board, mapped).solve()), as_lists(Solver(board, loaded).solve()))
+
+    def test_registry_shares_dictionaries(self):
+        self.assertIs(get_dictionary(language="en"), get_dictionary(language="en"))
+        self.assertIs(get_dictionary(language="en"), get_dictionary(bundled_dictionary_path("en"), language="en"))
+        self.assertIsNot(get_dictionary(language="en"), get_dictionary(language="en", mmap=False))
+        with self.assertRaises(ValueError):
+            get_dictionary()
+        with self.assertRaises(IOError):
+            get_dictionary(os.path.join(self.directory, "missing.marisa"))
+
+    def test_registry_reloads_modified_files(self):
+        path = os.path.join(self.directory, "words.marisa")
+        MTDictionary.from_keys([u"CAT", u"DOG"]).save_marisa_trie(path)
+        first = get_dictionary(path)
+        self.assertEqual(len(first), 2)
+        MTDictionary.from_keys([u"CAT", u"DOG", u"COW"]).save_marisa_trie(path)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        second = get_dictionary(path)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second), 3)
+        clear_registry()
+        self.assertIsNot(get_dictionary(path), second)
+
+    def test_pickle(self):
+        mapped = get_dictionary(language="en")
+        state = pickle.dumps(mapped)
+        # a MARISA dictionary is pickled as its path
+        self.assertTrue(len(state) < 1024)
+        self.assertEqual(pickle.loads(state).keys, mapped.keys)
+        small = MTDictionary.from_keys([u"CAT", u"DOG"])
+        self.assertEqual(pickle.loads(pickle.dumps(small)).keys, [u"CAT", u"DOG"])
+
+class TestCompiler(unittest.TestCase):
+
+    WORDS = [u"Café", u"cat", u"CAT", u"", u"dog", u"  cow  ", u"zoë"]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, opener):
+        path = os.path.join(self.directory, name)
+        with opener(path, "wb") as f:
+            f.write(u"\n".join(self.WORDS).encode("utf-8"))
+        return path
+
+    def test_plain_and_compressed(self):
+        expected = [u"CAFE", u"CAT", u"COW", u"DOG", u"ZOE"]
+        openers = [("words.txt", io.open), ("words.txt.gz", gzip.open), ("words.txt.bz2", bz2.BZ2File)]
+        for (name, opener) in openers:
+            path = self.write(name, opener)
+            self.assertEqual(MTDictionary(path, normalize=True, ignore_case=True).keys, expected, name)
+        self.assertEqual(MTDictionary(path).keys, sorted([u"Café", u"cat", u"CAT", u"dog", u"cow", u"zoë"]))
+
+    def test_chunks_and_workers(self):
+        path = self.write("words.txt", io.open)
+        expected = sorted(set(iter_word_list(path, normalize=True, ignore_case=True)))
+        progress = []
+        words = list(iter_word_list(path, normalize=True, ignore_case=True, workers=2, chunk_size=2, progress=lambda lines, elapsed: progress.append(lines)))
+        self.assertEqual(sorted(set(words)), expected)
+        self.assertEqual(progress, [2, 4, 6, 7])
+
+    def test_bundled_round_trip(self):
+        dictionary = get_dictionary(language="it")
+        path = os.path.join(self.directory, "it.txt")
+        dictionary.save_plain_text(path)
+        compiled = MTDictionary(path, normalize=True, ignore_case=True, workers=2)
+        # empty lines are dropped by the compiler
+        self.assertEqual(compiled.keys, [key for key in dictionary.keys if len(key) > 0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.pool.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.pool import PENDING_PER_WORKER, ordered_map
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestOrderedMap(unittest.TestCase):
+
+    def test_task_order(self):
+        tasks = [-5, 3, -1, 0, 7, -2, 4, -6, 8]
+        for workers in [1, 2, 3]:
+            self.assertEqual(list(ordered_map(abs, tasks, workers)), [abs(task) for task in tasks])
+        self.assertEqual(list(ordered_map(abs, [], 2)), [])
+
+    def test_bounded_pending_tasks(self):
+        consumed = []
+
+        def tasks():
+            for i in range(100):
+                consumed.append(i)
+                yield -i
+
+        workers = 2
+        results = ordered_map(abs, tasks(), workers)
+        self.assertEqual(next(results), 0)
+        self.assertEqual(len(consumed), PENDING_PER_WORKER * workers)
+        results.close()
+
+if __name__ == "__main__":
+    unittest.main()
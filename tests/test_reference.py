@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests checking the solve results against the reference of the benchmark suite.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import io
+import json
+import os
+import sys
+import unittest
+
+from elzzur.solver import Solver
+
+from tests import bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+BENCHMARKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+""" Directory of the benchmark suite """
+
+sys.path.insert(0, BENCHMARKS_DIR)
+import bench
+
+class TestReference(unittest.TestCase):
+
+    def test_solve_cases(self):
+        with io.open(bench.REFERENCE_FILE, "r", encoding="utf-8") as f:
+            reference = json.load(f)
+        for (name, language, factory) in bench.solve_cases():
+            words = Solver(factory(), bundled_dictionary(language)).solve()
+            self.assertEqual(bench.digest_words(words), reference[name]["digest"], name)
+            self.assertEqual(len(words), reference[name]["words"], name)
+            if name == "solve/en":
+                self.assertEqual(bench.format_words(words), bench.output_md_lines())
+
+if __name__ == "__main__":
+    unittest.main()
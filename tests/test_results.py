@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.results.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import pickle
+import unittest
+
+from elzzur.batch import solve_records
+from elzzur.board import Board
+from elzzur.mtdictionary import MTDictionary
+from elzzur.results import MAX_SCORE, SolveResult
+from elzzur.solver import Solver
+
+from tests import as_lists, bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestSolveResult(unittest.TestCase):
+
+    def setUp(self):
+        self.board = bundled_board("en")
+        self.dictionary = bundled_dictionary("en")
+        self.words = Solver(self.board, self.dictionary).solve()
+
+    def test_solve_compact(self):
+        result = Solver(self.board, self.dictionary).solve_compact()
+        self.assertEqual(len(result), len(self.words))
+        self.assertEqual(as_lists(result.to_entries()), as_lists(self.words))
+        self.assertEqual(result.to_lists(), [[word, snake_score, snake.cells] for (word, snake_score, snake) in self.words])
+        self.assertEqual(result.words, [word for (word, snake_score, snake) in self.words])
+        self.assertEqual(as_lists([result[-1]]), as_lists(self.words[-1:]))
+        with self.assertRaises(IndexError):
+            result[len(self.words)]
+
+    def test_slice_and_pickle(self):
+        result = SolveResult.from_entries(self.words, self.dictionary, self.board.graph)
+        part = result[10:20]
+        self.assertEqual(as_lists(part), as_lists(self.words[10:20]))
+        copy = pickle.loads(pickle.dumps(part))
+        with self.assertRaises(ValueError):
+            copy.word(0)
+        self.assertEqual(as_lists(copy.bind(self.dictionary)), as_lists(self.words[10:20]))
+        # only the bytes of the slice are pickled
+        self.assertLess(len(pickle.dumps(part)), len(pickle.dumps(result)))
+        with self.assertRaises(ValueError):
+            result[0:10:2]
+
+class TestLargeScores(unittest.TestCase):
+
+    def row(self, word):
+        return u" ".join([letter + u"tw" for letter in word])
+
+    def check(self, word):
+        dictionary = MTDictionary.from_keys([word])
+        board = Board("en").read_board_string(self.row(word))
+        words = Solver(board, dictionary).solve()
+        result = SolveResult.from_entries(words, dictionary, board.graph)
+        self.assertEqual(as_lists(result.to_entries()), as_lists(words))
+        self.assertEqual(as_lists(pickle.loads(pickle.dumps(result)).bind(dictionary).to_entries()), as_lists(words))
+        for workers in [1, 2]:
+            results = list(solve_records([(u"row", self.row(word))], "en", dictionary, workers=workers))
+            self.assertEqual(results[0]["words"], [[word, snake_score, snake.cells] for (word, snake_score, snake) in words])
+        return words[0][1]
+
+    def test_above_32_bits(self):
+        self.assertGreater(self.check(u"ELECTROENCEPHALOGRAPHIC"), 2 ** 31)
+
+    def test_above_64_bits(self):
+        self.assertGreater(self.check(u"A" * 45), MAX_SCORE)
+
+if __name__ == "__main__":
+    unittest.main()
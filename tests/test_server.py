@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.server.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import json
+import os
+import threading
+import unittest
+
+try:
+    from httplib import HTTPConnection
+except ImportError:
+    from http.client import HTTPConnection
+
+from elzzur.server import ServiceTimeout, SolveJob, SolveService, create_server
+from elzzur.solver import Solver
+
+from tests import RES_DIR, bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = SolveService(languages=["en"], workers=2)
+        cls.server = create_server(cls.service, port=0)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def post(self, body, content_type="application/json", query=""):
+        connection = HTTPConnection("127.0.0.1", self.server.server_port, timeout=10)
+        try:
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode("utf-8")
+            connection.request("POST", "/solve" + query, body=body, headers={"Content-Type": content_type})
+            response = connection.getresponse()
+            return (response.status, json.loads(response.read().decode("utf-8")))
+        finally:
+            connection.close()
+
+    def board_rows(self):
+        with open(os.path.join(RES_DIR, "en.board"), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def test_solve(self):
+        expected = Solver(bundled_board("en"), bundled_dictionary("en")).solve()
+        status, result = self.post({"language": "en", "board": self.board_rows()})
+        self.assertEqual(status, 200)
+        self.assertEqual(result["words"], [[word, snake_score, [list(cell) for cell in snake.cells]] for (word, snake_score, snake) in expected])
+        status, result = self.post(self.board_rows().encode("utf-8"), content_type="text/plain", query="?language=en&top=5&reverse=1")
+        self.assertEqual(status, 200)
+        self.assertEqual(result["count"], 5)
+
+    def test_bad_requests(self):
+        board = self.board_rows()
+        for request in [
+            [1, 2, 3],
+            {"language": "xx", "board": board},
+            {"language": "en", "board": 42},
+            {"language": "en", "board": [1, 2]},
+            {"language": ["en"], "board": board},
+            {"language": "en", "board": board, "top": [1]},
+            {"language": "en", "board": board, "top": {"k": 1}},
+            {"language": "en", "board": board, "top": "many"},
+            {"language": "en", "board": board, "top": 0},
+            {"language": "en", "board": board, "top": -1},
+        ]:
+            status, result = self.post(request)
+            self.assertEqual(status, 400, request)
+            self.assertIn("error", result)
+        status, result = self.post(b"{", content_type="application/json")
+        self.assertEqual(status, 400)
+        # a number is a valid value of reverse
+        status, result = self.post({"language": "en", "board": board, "reverse": 1})
+        self.assertEqual(status, 200)
+
+    def test_timeout_cancels_search(self):
+        job = SolveJob(bundled_board("en"), {})
+        job.solver = Solver(job.board, bundled_dictionary("en"))
+        job.cancel()
+        self.assertTrue(job.cancelled)
+        self.assertTrue(job.solver.cancelled)
+        service = SolveService(languages=["en"], timeout=0.0)
+        with self.assertRaises(ServiceTimeout):
+            service.solve(bundled_board("en"))
+        service.queue.join()
+        self.assertEqual(service.metrics()["timeouts"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
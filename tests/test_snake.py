@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.snake.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.snake import Snake, cell_bit
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestSnake(unittest.TestCase):
+
+    def test_cell_bit(self):
+        # all the cells of a NxN board map to the first N*N bits
+        for size in [1, 4, 12]:
+            bits = [cell_bit((x, y)) for x in range(size) for y in range(size)]
+            self.assertEqual(sum(bits), (1 << (size * size)) - 1)
+
+    def test_snake(self):
+        cells = [(0, 0), (0, 1), (1, 1), (2, 0)]
+        snake = Snake(cells)
+        self.assertEqual(snake.cells, cells)
+        self.assertEqual(len(snake), 4)
+        self.assertEqual((snake.start, snake.end), ((0, 0), (2, 0)))
+        self.assertEqual(str(snake), u"(0,0) (0,1) (1,1) (2,0)")
+        for cell in cells:
+            self.assertTrue(snake.has_cell(cell))
+        self.assertFalse(snake.has_cell((1, 0)))
+        self.assertEqual(Snake([]).cells, [])
+        self.assertEqual(len(Snake([])), 0)
+
+    def test_extend_shares_parent(self):
+        snake = Snake([(0, 0), (0, 1)])
+        left = snake.extend((1, 0))
+        right = snake.extend((1, 1))
+        self.assertIs(left.parent, snake)
+        self.assertIs(right.parent, snake)
+        self.assertEqual(snake.cells, [(0, 0), (0, 1)])
+        self.assertEqual(left.cells, [(0, 0), (0, 1), (1, 0)])
+        self.assertEqual(right.cells, [(0, 0), (0, 1), (1, 1)])
+        self.assertTrue(left.has_cell((1, 0)))
+        self.assertFalse(right.has_cell((1, 0)))
+        self.assertEqual(left.start, (0, 0))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.solver.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.cache import SolveCache
+from elzzur.generator import BoardSampler
+from elzzur.languages import LANGUAGES
+from elzzur.solver import SearchBudget, Solver
+from elzzur.symmetry import TRANSFORMS, board_tokens, canonical_form, transform_board
+from elzzur.topology import HEX
+
+from tests import as_lists, bundled_board, bundled_dictionary
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestTopK(unittest.TestCase):
+
+    def test_top_k_equals_full_solve(self):
+        for language in LANGUAGES:
+            board = bundled_board(language)
+            dictionary = bundled_dictionary(language)
+            full = as_lists(Solver(board, dictionary).solve())
+            for k in [1, 10, 50]:
+                self.assertEqual(as_lists(Solver(board, dictionary).solve(top_k=k)), full[0:k])
+
+    def test_top_k_sort(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        top = as_lists(Solver(board, dictionary).solve(top_k=10))
+        by_length = as_lists(Solver(board, dictionary).solve(top_k=10, sort=Solver.SORT_BY_LENGTH))
+        self.assertEqual(sorted(top), sorted(by_length))
+
+    def test_top_k_options(self):
+        board = bundled_board("fr")
+        dictionary = bundled_dictionary("fr")
+        full = as_lists(Solver(board, dictionary).solve())
+        for options in [{"workers": 2}, {"symmetry": True}, {"cache": SolveCache()}]:
+            self.assertEqual(as_lists(Solver(board, dictionary).solve(top_k=10, **options)), full[0:10], options)
+
+    def test_top_k_must_be_positive(self):
+        solver = Solver(bundled_board("en"), bundled_dictionary("en"))
+        for k in [0, -1]:
+            with self.assertRaises(ValueError):
+                solver.solve(top_k=k)
+
+    def test_top_k_max_length(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        full = as_lists(Solver(board, dictionary, max_length=4).solve())
+        self.assertEqual(as_lists(Solver(board, dictionary, max_length=4).solve(top_k=5)), full[0:5])
+
+class TestSymmetry(unittest.TestCase):
+
+    def test_symmetry_equals_full_solve(self):
+        for language in ["en", "fr"]:
+            dictionary = bundled_dictionary(language)
+            for transform in TRANSFORMS:
+                board = transform_board(bundled_board(language), transform)
+                expected = as_lists(Solver(board, dictionary).solve())
+                self.assertEqual(as_lists(Solver(board, dictionary).solve(symmetry=True)), expected, transform[0])
+
+    def test_symmetric_boards_share_cache(self):
+        dictionary = bundled_dictionary("en")
+        cache = SolveCache()
+        board = bundled_board("en")
+        Solver(board, dictionary).solve(symmetry=True, cache=cache)
+        rotated = transform_board(board, TRANSFORMS[1])
+        self.assertEqual(as_lists(Solver(rotated, dictionary).solve(symmetry=True, cache=cache)), as_lists(Solver(rotated, dictionary).solve()))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_asymmetric_topology(self):
+        board = bundled_board("en", topology=HEX)
+        dictionary = bundled_dictionary("en")
+        canonical, mapping = canonical_form(board)
+        self.assertEqual(board_tokens(canonical), board_tokens(board))
+        self.assertEqual(as_lists(Solver(board, dictionary).solve(symmetry=True)), as_lists(Solver(board, dictionary).solve()))
+
+class TestParallel(unittest.TestCase):
+
+    def test_parallel_equals_serial(self):
+        for language in ["en", "es"]:
+            board = bundled_board(language)
+            dictionary = bundled_dictionary(language)
+            expected = as_lists(Solver(board, dictionary).solve())
+            self.assertEqual(as_lists(Solver(board, dictionary).solve(workers=2)), expected)
+            self.assertEqual(as_lists(Solver(board, dictionary).solve(workers=3, symmetry=True)), expected)
+
+    def test_parallel_stats(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        serial = Solver(board, dictionary, stats=True)
+        serial.solve()
+        parallel = Solver(board, dictionary, stats=True)
+        parallel.solve(workers=2)
+        self.assertEqual(parallel.stats.nodes_expanded, serial.stats.nodes_expanded)
+
+class TestIterWords(unittest.TestCase):
+
+    def test_iter_words_equals_solve(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        expected = as_lists(Solver(board, dictionary).solve())
+        solver = Solver(board, dictionary)
+        words = list(solver.iter_words())
+        self.assertEqual(sorted(set([word for (word, snake_score, snake) in words])), sorted([word for (word, snake_score, cells) in expected]))
+        self.assertEqual(len(words), len(expected))
+        self.assertEqual(as_lists(solver.sort_words()), expected)
+
+    def test_iter_words_updates(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        expected = dict([(word, (snake_score, cells)) for (word, snake_score, cells) in as_lists(Solver(board, dictionary).solve())])
+        last = {}
+        for (word, snake_score, snake) in Solver(board, dictionary).iter_words(updates=True):
+            if word in last:
+                self.assertGreater(snake_score, last[word][0])
+            last[word] = (snake_score, snake.cells)
+        self.assertEqual(last, expected)
+
+class TestStats(unittest.TestCase):
+
+    def test_stats_counters(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        solver = Solver(board, dictionary, stats=True)
+        words = solver.solve()
+        stats = solver.stats.as_dict()
+        self.assertEqual(as_lists(words), as_lists(Solver(board, dictionary).solve()))
+        self.assertGreater(stats["nodes_expanded"], 0)
+        self.assertTrue(stats["prefix_hits"] <= stats["prefix_queries"])
+        self.assertTrue(stats["word_hits"] <= stats["word_queries"])
+        self.assertTrue(stats["word_hits"] >= len(words))
+        self.assertEqual(len(stats["start_times"]), len(board.graph))
+        self.assertFalse(stats["cached"])
+        self.assertIn("nodes_expanded:", solver.stats.pretty_print())
+
+    def test_stats_disabled(self):
+        solver = Solver(bundled_board("en"), bundled_dictionary("en"))
+        solver.solve()
+        self.assertIsNone(solver.stats)
+
+class TestLengths(unittest.TestCase):
+
+    def test_length_limits_filter_full_solve(self):
+        for language in ["en", "it"]:
+            board = bundled_board(language)
+            dictionary = bundled_dictionary(language)
+            full = as_lists(Solver(board, dictionary).solve())
+            for (min_length, max_length) in [(2, 3), (4, None), (3, 5)]:
+                expected = [entry for entry in full if (len(entry[0]) >= min_length) and ((max_length is None) or (len(entry[0]) <= max_length))]
+                self.assertEqual(as_lists(Solver(board, dictionary, min_length=min_length, max_length=max_length).solve()), expected)
+
+    def test_max_length_bounds_search(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        full = Solver(board, dictionary, stats=True)
+        full.solve()
+        bounded = Solver(board, dictionary, stats=True, max_length=3)
+        bounded.solve()
+        self.assertLess(bounded.stats.nodes_expanded, full.stats.nodes_expanded)
+
+class TestUpdateCell(unittest.TestCase):
+
+    def test_update_cell_equals_fresh_solve(self):
+        dictionary = bundled_dictionary("en")
+        sampler = BoardSampler("en", seed=4)
+        board = sampler.board(5, 5)
+        solver = Solver(board, dictionary)
+        solver.build_index()
+        self.assertEqual(as_lists(solver.sort_words()), as_lists(Solver(board, dictionary).solve()))
+        cells = board.graph.cells
+        for step in range(30):
+            cell = cells[sampler.rng.randrange(len(cells))]
+            old = dict(solver.found)
+            added, removed = solver.update_cell(cell, sampler.token())
+            fresh = Solver(board, dictionary)
+            self.assertEqual(as_lists(solver.sort_words()), as_lists(fresh.solve()))
+            self.assertEqual(sorted(removed), sorted(set(old) - set(fresh.found)))
+            for (word, snake_score, snake) in added:
+                self.assertIn(word, fresh.found)
+
+    def test_update_multiplier_only(self):
+        dictionary = bundled_dictionary("en")
+        board = bundled_board("en")
+        solver = Solver(board, dictionary)
+        cell = board.graph.cells[0]
+        solver.update_cell(cell, board.cells[cell].letter + "tw")
+        self.assertEqual(as_lists(solver.sort_words()), as_lists(Solver(board, dictionary).solve()))
+
+class TestBudget(unittest.TestCase):
+
+    def test_unexhausted_budget_equals_full_solve(self):
+        for language in ["en", "nl"]:
+            board = bundled_board(language)
+            dictionary = bundled_dictionary(language)
+            expected = as_lists(Solver(board, dictionary).solve())
+            solver = Solver(board, dictionary)
+            self.assertEqual(as_lists(solver.solve(deadline=60.0, max_nodes=10 ** 9)), expected)
+            self.assertFalse(solver.incomplete)
+
+    def test_node_budget(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        full = dict([(word, snake_score) for (word, snake_score, snake) in Solver(board, dictionary).solve()])
+        solver = Solver(board, dictionary, stats=True)
+        words = solver.solve(max_nodes=100)
+        self.assertTrue(solver.incomplete)
+        self.assertTrue(0 < len(words) < len(full))
+        self.assertTrue(solver.stats.nodes_expanded <= 100 + SearchBudget.CLOCK_INTERVAL)
+        for (word, snake_score, snake) in words:
+            self.assertTrue(snake_score <= full[word])
+            self.assertEqual(board.compute_snake_word(snake), word)
+
+    def test_expired_deadline(self):
+        solver = Solver(bundled_board("en"), bundled_dictionary("en"))
+        self.assertEqual(solver.solve(deadline=0.0), [])
+        self.assertTrue(solver.incomplete)
+
+    def test_incomplete_results_not_cached(self):
+        board = bundled_board("en")
+        dictionary = bundled_dictionary("en")
+        cache = SolveCache()
+        Solver(board, dictionary).solve(max_nodes=10, cache=cache)
+        self.assertEqual(len(cache), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+Tests for elzzur.topology.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import unittest
+
+from elzzur.topology import GRID, HEX, TORUS, BoardGraph, compile_graph
+
+__author__ = "Alberto Pettarin"
+__copyright__ = "Copyright 2016, Alberto Pettarin (www.albertopettarin.it)"
+__license__ = "MIT"
+__version__ = "0.0.1"
+__email__ = "alberto@albertopettarin.it"
+__status__ = "Production"
+
+class TestBoardGraph(unittest.TestCase):
+
+    def degrees(self, graph):
+        return sorted([len(neighbours) for neighbours in graph.neighbours])
+
+    def test_grid(self):
+        graph = compile_graph(4, 4, GRID)
+        self.assertEqual(len(graph), 16)
+        self.assertEqual(self.degrees(graph), [3] * 4 + [5] * 8 + [8] * 4)
+        self.assertEqual(graph.neighbours[graph.index((0, 0))], (1, 4, 5))
+        self.assertTrue(graph.are_adjacent(0, 5))
+        self.assertFalse(graph.are_adjacent(0, 2))
+
+    def test_torus_and_hex(self):
+        self.assertEqual(self.degrees(compile_graph(4, 5, TORUS)), [8] * 20)
+        graph = compile_graph(4, 4, HEX)
+        self.assertTrue(max(self.degrees(graph)) == 6)
+        for (index, neighbours) in enumerate(graph.neighbours):
+            for target in neighbours:
+                # adjacency is symmetric
+                self.assertTrue(graph.are_adjacent(target, index))
+
+    def test_compiled_once(self):
+        self.assertIs(compile_graph(3, 7, GRID), compile_graph(3, 7, GRID))
+        self.assertIsNot(compile_graph(3, 7, GRID), compile_graph(3, 7, TORUS))
+        with self.assertRaises(ValueError):
+            BoardGraph(4, 4, "cube")
+
+if __name__ == "__main__":
+    unittest.main()